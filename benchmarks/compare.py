@@ -0,0 +1,62 @@
+"""
+Compares two benchmark result files written by ``benchmarks.run``.
+
+    python -m benchmarks.compare baseline.json candidate.json
+"""
+
+import argparse
+import json
+from typing import Any, Dict, Iterator, Tuple
+
+# Metrics where a lower value is an improvement; everything else is better higher.
+LOWER_IS_BETTER = (
+    "ttft",
+    "latency",
+    "duration",
+    "bytes_per_stream",
+    "errors",
+    "connections",
+)
+
+
+def flatten(value: Any, prefix: str = "") -> Iterator[Tuple[str, float]]:
+    """Yields ``dotted.path, number`` for every numeric leaf of the results."""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from flatten(item, f"{prefix}.{key}" if prefix else key)
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        yield prefix, float(value)
+
+
+def compare(baseline: Dict[str, Any], candidate: Dict[str, Any]) -> str:
+    old = dict(flatten(baseline["results"]))
+    new = dict(flatten(candidate["results"]))
+    width = max(len(key) for key in old) if old else 10
+    lines = [f"{'metric':<{width}} {'baseline':>12} {'candidate':>12} {'change':>9}"]
+    for key, before in old.items():
+        if key not in new or "client_metrics" in key:
+            continue
+        after = new[key]
+        change = (after - before) / before * 100 if before else 0.0
+        better = change < 0 if any(k in key for k in LOWER_IS_BETTER) else change > 0
+        marker = "+" if better and abs(change) >= 5 else "-" if abs(change) >= 5 else ""
+        lines.append(
+            f"{key:<{width}} {before:>12.4g} {after:>12.4g} {change:>8.1f}% {marker}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    args = parser.parse_args()
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    with open(args.candidate, encoding="utf-8") as file:
+        candidate = json.load(file)
+    print(compare(baseline, candidate))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""
+Local stand-in for the LLM_Streaming microservice used by the benchmarks.
+
+It serves the ``/api/v1/chat/*`` HTTP routes and the Socket.IO namespace with
+a configurable token rate, latency and error injection, and counts the TCP
+connections it accepts so connection reuse can be measured. Run it on its own
+with ``python -m benchmarks.fake_server --port 5000``.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import sys
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+import socketio
+from aiohttp import web
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.llm_streaming_client.config.config import CONFIG
+
+STATS_PATH = "/_bench/stats"
+
+
+@dataclass
+class FakeServerConfig:
+    """
+    Behaviour of the fake server.
+
+    ``token_rate`` is the number of tokens emitted per second on each stream (0
+    sends them back to back), ``latency`` the seconds waited before answering a
+    request or emitting the first token, and ``error_rate`` the probability of
+    answering with a 503 or emitting an ``error`` event.
+    """
+
+    token_rate: float = 200.0
+    tokens_per_response: int = 100
+    token_text: str = "tok "
+    latency: float = 0.0
+    error_rate: float = 0.0
+    seed: Optional[int] = None
+
+
+class FakeLLMServer:
+    """aiohttp + Socket.IO server implementing the routes used by the client."""
+
+    def __init__(self, config: FakeServerConfig) -> None:
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.stats: Dict[str, Any] = {
+            "http_requests": 0,
+            "http_connections": 0,
+            "http_errors": 0,
+            "socket_connections": 0,
+            "streams": 0,
+            "stream_errors": 0,
+            "tokens_sent": 0,
+            "upload_bytes": 0,
+        }
+        self._peers: set = set()
+
+        self.sio = socketio.AsyncServer(
+            async_mode="aiohttp", cors_allowed_origins="*"
+        )
+        self.app = web.Application(middlewares=[self._count_connections])
+        self.sio.attach(self.app)
+        self._register_routes()
+
+    def _register_routes(self) -> None:
+        routes = CONFIG.config_adapter
+        self.app.router.add_get(routes["status"], self._status)
+        self.app.router.add_get(routes["available_models"], self._models)
+        self.app.router.add_get(routes["available_llms"], self._llms)
+        self.app.router.add_get(routes["available_prompts"], self._prompts)
+        self.app.router.add_post(
+            CONFIG.server_request_adapter["request"], self._request
+        )
+        self.app.router.add_post(CONFIG.config_audio_adapter["audio"], self._audio)
+        self.app.router.add_get(STATS_PATH, self._stats)
+        self.app.router.add_delete(STATS_PATH, self._reset_stats)
+
+        namespace = CONFIG.SOCKET_NAMESPACE
+        self.sio.on("connect", self._on_connect, namespace=namespace)
+        self.sio.on("send_message", self._on_send_message, namespace=namespace)
+
+    @web.middleware
+    async def _count_connections(self, request: web.Request, handler: Any) -> Any:
+        # Only the API routes count: Engine.IO polling has its own connections.
+        if not request.path.startswith(CONFIG.API_PREFIX):
+            return await handler(request)
+        transport = request.transport
+        peer = transport.get_extra_info("peername") if transport else None
+        if peer not in self._peers:
+            self._peers.add(peer)
+            self.stats["http_connections"] += 1
+        self.stats["http_requests"] += 1
+        return await handler(request)
+
+    def _should_fail(self) -> bool:
+        rate = self.config.error_rate
+        return rate > 0 and self.random.random() < rate
+
+    async def _respond(self, body: Any) -> web.Response:
+        if self.config.latency:
+            await asyncio.sleep(self.config.latency)
+        if self._should_fail():
+            self.stats["http_errors"] += 1
+            return web.json_response({"error": "Injected failure"}, status=503)
+        return web.json_response(body)
+
+    async def _status(self, request: web.Request) -> web.Response:
+        return await self._respond({"status": "ok"})
+
+    async def _models(self, request: web.Request) -> web.Response:
+        return await self._respond({"models": {"openai": ["gpt-4o-mini"]}})
+
+    async def _llms(self, request: web.Request) -> web.Response:
+        return await self._respond({"llms": ["openai", "google"]})
+
+    async def _prompts(self, request: web.Request) -> web.Response:
+        return await self._respond(
+            {"prompts": [{"title": "Summarize", "action_key": "summarize"}]}
+        )
+
+    async def _request(self, request: web.Request) -> web.Response:
+        data = await request.json()
+        text = self.config.token_text * self.config.tokens_per_response
+        return await self._respond(
+            {"response": text, "status": "success", "echo": data.get("action_key")}
+        )
+
+    async def _audio(self, request: web.Request) -> web.Response:
+        size = 0
+        async for chunk in request.content.iter_any():
+            size += len(chunk)
+        self.stats["upload_bytes"] += size
+        return await self._respond({"response": {"text": f"{size} bytes"}})
+
+    async def _stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.stats)
+
+    async def _reset_stats(self, request: web.Request) -> web.Response:
+        for key in self.stats:
+            self.stats[key] = 0
+        self._peers.clear()
+        return web.json_response(self.stats)
+
+    async def _on_connect(self, sid: str, environ: Any, auth: Any = None) -> None:
+        self.stats["socket_connections"] += 1
+
+    async def _on_send_message(self, sid: str, data: Dict[str, Any]) -> None:
+        self.stats["streams"] += 1
+        namespace = CONFIG.SOCKET_NAMESPACE
+        request_id = data.get("request_id")
+        if self.config.latency:
+            await asyncio.sleep(self.config.latency)
+        if self._should_fail():
+            self.stats["stream_errors"] += 1
+            await self.sio.emit(
+                "error",
+                {"request_id": request_id, "error_message": "Injected failure"},
+                to=sid,
+                namespace=namespace,
+            )
+            return
+
+        interval = 1 / self.config.token_rate if self.config.token_rate else 0
+        for _ in range(self.config.tokens_per_response):
+            await self.sio.emit(
+                "response_message",
+                {
+                    "request_id": request_id,
+                    "content": self.config.token_text,
+                    "finished": False,
+                },
+                to=sid,
+                namespace=namespace,
+            )
+            self.stats["tokens_sent"] += 1
+            await asyncio.sleep(interval)
+        await self.sio.emit(
+            "response_message",
+            {"request_id": request_id, "content": "", "finished": True},
+            to=sid,
+            namespace=namespace,
+        )
+
+    def run(self, host: str, port: int, ready: Optional[Any] = None) -> None:
+        """Serves until the process is stopped; ``ready`` receives the bound port."""
+
+        async def serve() -> None:
+            runner = web.AppRunner(self.app, access_log=None)
+            await runner.setup()
+            site = web.TCPSite(runner, host, port)
+            await site.start()
+            bound = site._server.sockets[0].getsockname()[1]
+            if ready is not None:
+                ready.send(bound)
+            await asyncio.Event().wait()
+
+        asyncio.run(serve())
+
+
+class FakeServerProcess:
+    """
+    Runs a FakeLLMServer in a child process so its CPU time and allocations do
+    not distort the client measurements.
+    """
+
+    def __init__(
+        self, config: FakeServerConfig, host: str = "127.0.0.1", port: int = 0
+    ) -> None:
+        self.config = config
+        self.host = host
+        self.port = port
+        self._process: Optional[multiprocessing.Process] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> "FakeServerProcess":
+        parent, child = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(
+            target=_serve, args=(self.config, self.host, self.port, child), daemon=True
+        )
+        self._process.start()
+        if not parent.poll(10):
+            self.stop()
+            raise RuntimeError("Fake server did not start")
+        self.port = parent.recv()
+        return self
+
+    def stop(self) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join(5)
+            self._process = None
+
+    def __enter__(self) -> "FakeServerProcess":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def _serve(config: FakeServerConfig, host: str, port: int, ready: Any) -> None:
+    FakeLLMServer(config).run(host, port, ready)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    defaults = FakeServerConfig()
+    for name, value in asdict(defaults).items():
+        parser.add_argument(
+            "--" + name.replace("_", "-"),
+            type=type(value) if value is not None else int,
+            default=value,
+        )
+    args = vars(parser.parse_args())
+    host, port = args.pop("host"), args.pop("port")
+    print(f"Fake LLM_Streaming server on http://{host}:{port}")
+    FakeLLMServer(FakeServerConfig(**args)).run(host, port)
+
+
+if __name__ == "__main__":
+    main()
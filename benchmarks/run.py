@@ -0,0 +1,256 @@
+"""
+End-to-end benchmarks of LLMStreamingClient against the local fake server.
+
+Measures request throughput and latency, connection reuse, time to first
+token, tokens per second and memory per concurrent stream, and writes the
+results as JSON so runs can be compared with ``python -m benchmarks.compare``.
+
+    python -m benchmarks.run --output bench_results.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.fake_server import STATS_PATH, FakeServerConfig, FakeServerProcess
+from src.llm_streaming_client.client import LLMStreamingClient
+from src.llm_streaming_client.client import build_message_input
+from src.llm_streaming_client.adapter.exceptions import SocketCommunicationException
+from src.llm_streaming_client.enums.action_keys import ActionKeys
+from src.llm_streaming_client.enums.language_keys import LanguageEnum
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    return {
+        "p50": percentile(values, 0.5),
+        "p95": percentile(values, 0.95),
+        "p99": percentile(values, 0.99),
+        "mean": sum(values) / len(values) if values else 0.0,
+    }
+
+
+def server_stats(url: str, reset: bool = False) -> Dict[str, Any]:
+    method = requests.delete if reset else requests.get
+    return method(url + STATS_PATH, timeout=5).json()
+
+
+def bench_http_sequential(url: str, count: int) -> Dict[str, Any]:
+    """handle_request called back to back on one client."""
+    client = LLMStreamingClient(url, coalesce_requests=False)
+    server_stats(url, reset=True)
+    latencies, errors = [], 0
+    started = time.perf_counter()
+    for i in range(count):
+        t0 = time.perf_counter()
+        result = client.handle_request(f"texto {i}", ActionKeys.SUMMARIZE)
+        latencies.append(time.perf_counter() - t0)
+        errors += not result.get("success")
+    elapsed = time.perf_counter() - started
+    stats = server_stats(url)
+    client.close()
+    return {
+        "requests": count,
+        "errors": errors,
+        "requests_per_sec": count / elapsed,
+        "latency": summarize(latencies),
+        "connections_opened": stats["http_connections"],
+        "requests_per_connection": stats["http_requests"]
+        / max(1, stats["http_connections"]),
+    }
+
+
+def bench_http_batch(url: str, count: int, concurrency: int) -> Dict[str, Any]:
+    """handle_requests_batch with bounded concurrency over the shared pool."""
+    client = LLMStreamingClient(url, coalesce_requests=False)
+    server_stats(url, reset=True)
+    dtos = (
+        build_message_input(
+            text=f"texto {i}",
+            action_key=ActionKeys.SUMMARIZE,
+            llm_name="openai",
+            model_name="gpt-4o-mini",
+            language=LanguageEnum.SPANISH,
+        )
+        for i in range(count)
+    )
+    started = time.perf_counter()
+    errors = sum(
+        not result.get("success")
+        for _, result in client.handle_requests_batch(dtos, max_concurrency=concurrency)
+    )
+    elapsed = time.perf_counter() - started
+    stats = server_stats(url)
+    client.close()
+    return {
+        "requests": count,
+        "concurrency": concurrency,
+        "errors": errors,
+        "requests_per_sec": count / elapsed,
+        "connections_opened": stats["http_connections"],
+        "requests_per_connection": stats["http_requests"]
+        / max(1, stats["http_connections"]),
+    }
+
+
+def _timed_stream(client: LLMStreamingClient) -> Optional[Dict[str, float]]:
+    """Consumes one stream; returns its timings, or None if it failed."""
+    started = time.perf_counter()
+    first = None
+    tokens = 0
+    try:
+        for _ in client.stream("¿Cuál es la capital de Francia?"):
+            if first is None:
+                first = time.perf_counter()
+            tokens += 1
+    except SocketCommunicationException:
+        return None
+    ended = time.perf_counter()
+    first = first or ended
+    return {
+        "ttft": first - started,
+        "duration": ended - started,
+        "tokens": tokens,
+        "tokens_per_sec": tokens / (ended - first) if ended > first else 0.0,
+    }
+
+
+def bench_streams(url: str, count: int, persistent: bool) -> Dict[str, Any]:
+    """Sequential Socket.IO streams measured on the consumer side."""
+    client = LLMStreamingClient(url, persistent_socket=persistent)
+    server_stats(url, reset=True)
+    runs = [_timed_stream(client) for _ in range(count)]
+    stats = server_stats(url)
+    client.close()
+    completed = [r for r in runs if r is not None]
+    return {
+        "streams": count,
+        "persistent_socket": persistent,
+        "errors": count - len(completed),
+        "socket_connections": stats["socket_connections"],
+        "ttft": summarize([r["ttft"] for r in completed]),
+        "tokens_per_sec": summarize([r["tokens_per_sec"] for r in completed]),
+        "duration": summarize([r["duration"] for r in completed]),
+        "client_metrics": client.get_stream_metrics(),
+    }
+
+
+def bench_stream_memory(url: str, count: int) -> Dict[str, Any]:
+    """Python heap used per concurrent stream, measured with tracemalloc."""
+    client = LLMStreamingClient(url, persistent_socket=True)
+    client.socket_adapter.connect()
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    handles = [client.stream("¿Cuál es la capital de Francia?") for _ in range(count)]
+    for handle in handles:
+        try:
+            handle.result()
+        except SocketCommunicationException:
+            pass
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    client.close()
+    return {
+        "concurrent_streams": count,
+        "peak_bytes_per_stream": (peak - baseline) / count,
+        "retained_bytes_per_stream": (current - baseline) / count,
+    }
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except OSError:
+        return ""
+
+
+def _run(name: str, fn: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    print(f"running {name}...", file=sys.stderr)
+    return fn()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--streams", type=int, default=20)
+    parser.add_argument("--concurrent-streams", type=int, default=20)
+    parser.add_argument("--tokens", type=int, default=200)
+    parser.add_argument("--token-rate", type=float, default=0.0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the JSON results to this file")
+    args = parser.parse_args()
+
+    server_config = FakeServerConfig(
+        token_rate=args.token_rate,
+        tokens_per_response=args.tokens,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    with FakeServerProcess(server_config) as server:
+        url = server.url
+        results = {
+            "http_sequential": _run(
+                "http_sequential", lambda: bench_http_sequential(url, args.requests)
+            ),
+            "http_batch": _run(
+                "http_batch",
+                lambda: bench_http_batch(url, args.requests, args.concurrency),
+            ),
+            "stream": _run("stream", lambda: bench_streams(url, args.streams, False)),
+            "stream_persistent": _run(
+                "stream_persistent", lambda: bench_streams(url, args.streams, True)
+            ),
+            "stream_memory": _run(
+                "stream_memory",
+                lambda: bench_stream_memory(url, args.concurrent_streams),
+            ),
+        }
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "args": vars(args),
+            "server": asdict(server_config),
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2, default=str)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,11 @@ setup(
         "python-dotenv>=1.1.0",
         "python-socketio==5.12.1",
     ],
+    extras_require={
+        "async": ["aiohttp>=3.9"],
+        "otel": ["opentelemetry-api>=1.20"],
+        "fast": ["orjson>=3.8"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "Operating System :: OS Independent",
@@ -1,3 +1,13 @@
 from .client import LLMStreamingClient
 
-__all__ = ['LLMStreamingClient']
\ No newline at end of file
+__all__ = ['LLMStreamingClient', 'AsyncLLMStreamingClient']
+
+
+def __getattr__(name):
+    # The async client needs the optional aiohttp dependency, so it is only
+    # imported when requested.
+    if name == 'AsyncLLMStreamingClient':
+        from .async_client import AsyncLLMStreamingClient
+
+        return AsyncLLMStreamingClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,32 @@
+from typing import Dict, Any, List
+from .async_http_client import AsyncHttpClient
+from ..config.config import CONFIG
+
+
+class AsyncConfigAdapter(AsyncHttpClient):
+    """Asynchronous adapter to interact with the configuration microservice paths."""
+
+    def __init__(self, base_url: str, timeout: int = CONFIG.TIMEOUT, **kwargs) -> None:
+        super().__init__(timeout=timeout, **kwargs)
+        self.base_url = base_url
+        self._config = CONFIG.config_adapter
+
+    async def status(self) -> Dict[str, Any]:
+        """Checks the status of the service."""
+        url = self.base_url + self._config["status"]
+        return await self._get(url)
+
+    async def get_available_models(self) -> Dict[str, Any]:
+        """Gets the list of available models."""
+        url = self.base_url + self._config["available_models"]
+        return await self._get(url)
+
+    async def get_available_llms(self) -> Dict[str, Any]:
+        """Gets the list of available LLMs."""
+        url = self.base_url + self._config["available_llms"]
+        return await self._get(url)
+
+    async def get_available_prompts(self) -> List[Dict[str, Any]]:
+        """Gets the list of available prompts with their metadata."""
+        url = self.base_url + self._config["available_prompts"]
+        return await self._get(url)
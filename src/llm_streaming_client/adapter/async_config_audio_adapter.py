@@ -0,0 +1,34 @@
+from typing import Dict, Any
+from .async_http_client import AsyncHttpClient
+import aiohttp
+import mimetypes
+from ..config.config import CONFIG
+from ..adapter.exceptions import AudioTranscriptionException
+
+
+class AsyncConfigAudioAdapter(AsyncHttpClient):
+    """Asynchronous adapter to interact with the audio transcription microservice paths."""
+
+    def __init__(self, base_url: str, timeout: int = CONFIG.TIMEOUT, **kwargs) -> None:
+        super().__init__(timeout=timeout, **kwargs)
+        self._config = CONFIG.config_audio_adapter
+        self.base_url = base_url
+
+    async def transcribe_audio(self, audio_service: str, audio_url: str) -> Dict[str, Any]:
+        """
+        Sends an audio file to the transcription service and retrieves the transcription.
+        """
+        url = self.base_url + self._config["audio"]
+        try:
+            mime_type, _ = mimetypes.guess_type(audio_url)
+            if not mime_type:
+                mime_type = "application/octet-stream"
+            with open(audio_url, "rb") as audio_file:
+                form = aiohttp.FormData()
+                form.add_field("audio_service", audio_service)
+                form.add_field(
+                    "audio", audio_file, filename=audio_url, content_type=mime_type
+                )
+                return await self._post(url, data=form)
+        except Exception as e:
+            raise AudioTranscriptionException(f"Failed to transcribe audio: {e}") from e
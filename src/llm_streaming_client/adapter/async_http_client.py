@@ -0,0 +1,102 @@
+import asyncio
+from typing import Dict, Any, Optional
+import aiohttp
+from ..config.config import CONFIG
+from ..utils.http_client_utils import (
+    build_success_payload,
+    build_status_error_response,
+    build_error_payload,
+)
+from ..utils.json_codec import BACKEND, dumps, loads
+from ..utils.error_classifier import classify_connection_error
+
+
+class AsyncHttpClient:
+    """Asynchronous HTTP client for making requests to the llm-streaming service."""
+
+    def __init__(
+        self,
+        timeout: int = CONFIG.TIMEOUT,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> None:
+        self.timeout: int = timeout
+        self._session = session
+        self._owns_session = session is None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Returns the session, creating it on the running event loop if needed."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._owns_session = True
+        return self._session
+
+    async def close(self) -> None:
+        """Closes the underlying session if this client created it."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+        self._session = None
+
+    async def _make_request(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
+        """Make HTTP request expecting JSON response."""
+        try:
+            async with self._get_session().request(method, url, **kwargs) as response:
+                if response.status >= 400:
+                    return build_status_error_response(
+                        response.status,
+                        await response.read(),
+                        response.headers.get("Retry-After"),
+                    )
+                body = await response.read()
+            try:
+                return build_success_payload(loads(body))
+            except ValueError as e:
+                return build_error_payload(f"Invalid response body: {e}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            timeout = isinstance(e, asyncio.TimeoutError)
+            return build_error_payload(
+                error_info=classify_connection_error(e, timeout=timeout)
+            )
+
+    async def _get(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Performs a GET request and returns the JSON response.
+
+        Args:
+            url: The URL to send the GET request to.
+            params: Optional query parameters.
+
+        Returns:
+            A dictionary containing the JSON response.
+        """
+        return await self._make_request("GET", url, params=params)
+
+    async def _post(
+        self,
+        url: str,
+        data: Optional[Any] = None,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Performs a POST request and returns the JSON response.
+
+        Args:
+            url: The URL to send the POST request to.
+            data: Optional form data (or ``aiohttp.FormData``) to include in the request.
+            json: Optional JSON body, encoded with the fast JSON backend when one
+                is installed.
+
+        Returns:
+            A dictionary containing the JSON response.
+        """
+        if json is not None and data is None and BACKEND != "json":
+            return await self._make_request(
+                "POST",
+                url,
+                data=dumps(json),
+                headers={"Content-Type": "application/json"},
+            )
+        return await self._make_request("POST", url, data=data, json=json)
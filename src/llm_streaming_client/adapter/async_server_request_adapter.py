@@ -0,0 +1,30 @@
+from typing import Dict, Any
+from .async_http_client import AsyncHttpClient
+from ..config.config import CONFIG
+from ..dtos.input import MessageInputDTO
+
+
+class AsyncServerRequestAdapter(AsyncHttpClient):
+    """Asynchronous adapter to interact with the request handling microservice paths."""
+
+    def __init__(self, base_url: str, timeout: int = CONFIG.TIMEOUT, **kwargs) -> None:
+        super().__init__(timeout=timeout, **kwargs)
+        self._config = CONFIG.server_request_adapter
+        self.base_url = base_url
+
+    async def handle_request(self, dto: MessageInputDTO) -> Dict[str, Any]:
+        """
+        Sends a request to the LLM service and retrieves the response.
+
+        Args:
+            dto: The MessageInputDTO describing the request.
+
+        Returns:
+            A dictionary containing the response from the LLM service.
+        """
+        try:
+            data = dto.to_payload()
+            url = self.base_url + self._config["request"]
+            return await self._post(url, json=data)
+        except Exception:
+            return {}
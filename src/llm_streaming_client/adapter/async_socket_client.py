@@ -0,0 +1,204 @@
+import asyncio
+import inspect
+import uuid
+import socketio
+from ..config.config import CONFIG
+from ..dtos.input import StreamingInputDTO
+from ..dtos.output import SocketOutputDTO
+from ..adapter.exceptions import SocketCommunicationException
+from typing import Any, Callable, Dict, Optional
+
+
+class _AsyncStreamState:
+    """Routing state for a single in-flight stream on the shared async connection."""
+
+    def __init__(self, request_id: str, on_token: Optional[Callable[..., Any]]) -> None:
+        self.request_id = request_id
+        self.on_token = on_token
+        self.done = asyncio.Event()
+
+
+class AsyncSocketAdapter:
+    """Asynchronous adapter to interact with the Socket.IO server using StreamingInputDTO."""
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = CONFIG.TIMEOUT,
+        persistent: bool = CONFIG.SOCKET_PERSISTENT,
+        stream_timeout: Optional[float] = CONFIG.SOCKET_STREAM_TIMEOUT,
+    ) -> None:
+        """
+        Initialize the asynchronous Socket.IO adapter.
+
+        Args:
+            base_url: The base URL to connect to.
+            timeout: Maximum wait time for the connection (in seconds).
+            persistent: Keep the connection open across calls instead of
+                connecting and disconnecting for every stream.
+            stream_timeout: Seconds a stream may last in total (None for no
+                limit) before it is cancelled on the server and fails.
+        """
+        self.sio = socketio.AsyncClient(
+            reconnection_attempts=CONFIG.RECONNECT_ATTEMPTS, request_timeout=timeout
+        )
+        self.namespace = CONFIG.SOCKET_NAMESPACE
+        self.timeout = timeout
+        self.base_url = base_url
+        self.persistent = persistent
+        self.stream_timeout = stream_timeout
+        self._streams: Dict[str, _AsyncStreamState] = {}
+        self._connect_lock: Optional[asyncio.Lock] = None
+
+        self.sio.on(
+            "response_message", self._on_response_message, namespace=self.namespace
+        )
+        self.sio.on("error", self._on_error, namespace=self.namespace)
+        self.sio.on("disconnect", self._on_disconnect, namespace=self.namespace)
+
+    def _lock(self) -> asyncio.Lock:
+        # Created lazily so it binds to the event loop that first uses it.
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        return self._connect_lock
+
+    async def connect(self) -> None:
+        """Opens the Socket.IO connection if it is not already established."""
+        async with self._lock():
+            await self._connect()
+
+    async def close(self) -> None:
+        """Closes the Socket.IO connection and stops any reconnection attempts."""
+        async with self._lock():
+            await self._close()
+
+    async def _connect(self) -> None:
+        if self.sio.connected:
+            return
+        if self.sio.eio.state != "disconnected":
+            # A dropped connection being re-established in the background;
+            # Socket.IO refuses to connect a client in that state.
+            await self.sio.shutdown()
+            if self.sio.connected:
+                return
+        await self.sio.connect(self.base_url, namespaces=[self.namespace])
+
+    async def _close(self) -> None:
+        if self.sio.connected:
+            await self.sio.disconnect()
+        else:
+            await self.sio.shutdown()
+
+    async def send_messages(
+        self,
+        dto: StreamingInputDTO,
+        on_token: Optional[Callable[[str, bool], Any]] = None,
+    ) -> None:
+        """
+        Sends a StreamingInputDTO to the Socket.IO server and streams the response tokens.
+
+        Args:
+            dto: A StreamingInputDTO containing llm_name, model_name, action_key, language, etc.
+            on_token: Optional callback, plain or ``async``, receiving each token
+                and the finished flag.
+        """
+        stream = _AsyncStreamState(str(uuid.uuid4()), on_token)
+
+        try:
+            # Registering and connecting under the lock keeps a finishing stream
+            # from closing the connection this one is about to use.
+            async with self._lock():
+                self._streams[stream.request_id] = stream
+                await self._connect()
+            payload = dto.to_payload(stream.request_id)
+            await self.sio.emit("send_message", payload, namespace=self.namespace)
+            try:
+                await asyncio.wait_for(stream.done.wait(), self.stream_timeout)
+            except asyncio.TimeoutError:
+                await self._cancel(stream)
+                raise
+
+        except Exception as e:
+            if on_token:
+                await self._call(on_token, f"[EXCEPTION] {e}", True)
+            raise SocketCommunicationException(error=e)
+        finally:
+            async with self._lock():
+                self._streams.pop(stream.request_id, None)
+                if not self.persistent and not self._streams:
+                    await self._close()
+
+    async def _cancel(self, stream: _AsyncStreamState) -> None:
+        """Tells the server to stop generating an abandoned stream."""
+        if self.sio.connected:
+            try:
+                await self.sio.emit(
+                    "cancel_message",
+                    {"request_id": stream.request_id},
+                    namespace=self.namespace,
+                )
+            except Exception:
+                pass
+
+    def _resolve_stream(self, data: Any) -> Optional[_AsyncStreamState]:
+        """
+        Finds the stream an incoming event belongs to, falling back to the only
+        active stream for servers that do not echo the ``request_id``. Events for
+        an unknown ``request_id``, e.g. a stream that already ended, are dropped.
+        """
+        request_id = data.get("request_id") if isinstance(data, dict) else None
+        if request_id in self._streams:
+            return self._streams[request_id]
+        if request_id is None and len(self._streams) == 1:
+            return next(iter(self._streams.values()))
+        return None
+
+    @staticmethod
+    async def _call(callback: Callable[..., Any], *args: Any) -> None:
+        result = callback(*args)
+        if inspect.isawaitable(result):
+            await result
+
+    async def _deliver(
+        self, stream: _AsyncStreamState, content: str, finished: bool
+    ) -> None:
+        if stream.on_token:
+            try:
+                await self._call(stream.on_token, content, finished)
+            except Exception:
+                pass
+        else:
+            print(content, end="", flush=True)
+
+    async def _on_response_message(self, data: Dict[str, Any]) -> None:
+        event = SocketOutputDTO.from_wire(data)
+        stream = self._resolve_stream(data)
+        if stream is None:
+            return
+
+        finished = event.finished
+        await self._deliver(stream, event.content, finished)
+        if finished:
+            stream.done.set()
+
+    async def _on_error(self, data: Any) -> None:
+        stream = self._resolve_stream(data)
+        if stream is not None:
+            targets = [stream]
+        elif isinstance(data, dict) and data.get("request_id") is not None:
+            # An error for a stream that has already ended.
+            targets = []
+        else:
+            targets = list(self._streams.values())
+
+        for target in targets:
+            if target.on_token:
+                await self._call(target.on_token, f"[ERROR] {data}", True)
+            else:
+                print(f"Error: {data}")
+            target.done.set()
+
+    async def _on_disconnect(self, *args: Any) -> None:
+        for stream in [s for s in self._streams.values() if not s.done.is_set()]:
+            await self._deliver(stream, "[ERROR] Socket disconnected", True)
+            stream.done.set()
@@ -1,31 +1,205 @@
-from typing import Dict, Any, List
+import copy
+import threading
+import time
+from typing import Dict, Any, List, Optional, Type
+import requests
 from .http_client import HttpClient
+from ..utils.retry import RetryPolicy
+from ..utils.load_balancer import LoadBalancer
 from ..config.config import CONFIG
+from ..utils.single_flight import SingleFlight
+from ..utils.json_codec import convert
+from ..utils.http_client_utils import build_error_payload
+from ..dtos.output import (
+    AvailableLLMsOutputDTO,
+    AvailableModelsOutputDTO,
+    AvailablePromptsOutputDTO,
+    StatusOutputDTO,
+)
+
+# DTO each endpoint's response value is decoded into when ``as_dto`` is set.
+_RESPONSE_TYPES: Dict[str, Type[Any]] = {
+    "status": StatusOutputDTO,
+    "available_models": AvailableModelsOutputDTO,
+    "available_llms": AvailableLLMsOutputDTO,
+    "available_prompts": AvailablePromptsOutputDTO,
+}
+
+
+class _CacheEntry:
+    """Cached discovery response with its HTTP validators."""
+
+    def __init__(
+        self,
+        value: Dict[str, Any],
+        expires_at: float,
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> None:
+        self.value = value
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+
 
 class ConfigAdapter(HttpClient):
     """Adapter to interact with the configuration microservice paths."""
 
-    def __init__(self, base_url: str, timeout: int = CONFIG.TIMEOUT) -> None:
-        super().__init__(timeout=timeout)
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = CONFIG.TIMEOUT,
+        session: Optional[requests.Session] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache_ttls: Optional[Dict[str, float]] = None,
+        stale_while_revalidate: float = 0.0,
+        coalesce: bool = False,
+        load_balancer: Optional[LoadBalancer] = None,
+    ) -> None:
+        """
+        Args:
+            base_url: The base URL of the service.
+            timeout: Maximum wait time for requests.
+            session: Optional shared requests session.
+            retry_policy: Optional retry policy shared with the other adapters.
+            cache_ttls: Seconds each endpoint (keyed as in ``CONFIG.config_adapter``)
+                is served from memory. Endpoints without a positive TTL are not cached.
+            stale_while_revalidate: Seconds after expiry during which the stale value
+                is still returned while it is refreshed in the background.
+            coalesce: Share one upstream call between concurrent callers of the
+                same endpoint.
+            load_balancer: Optional balancer over several replicas; ``base_url``
+                is then empty and the paths are resolved per request.
+        """
+        super().__init__(
+            timeout=timeout,
+            session=session,
+            retry_policy=retry_policy,
+            load_balancer=load_balancer,
+        )
         self.base_url = base_url
         self._config = CONFIG.config_adapter
+        self._cache_ttls = cache_ttls or {}
+        self._stale_while_revalidate = stale_while_revalidate
+        self._cache: Dict[str, _CacheEntry] = {}
+        self._refreshing: set = set()
+        self._cache_lock = threading.Lock()
+        self._single_flight = SingleFlight() if coalesce else None
 
-    def status(self) -> Dict[str, Any]:
+    def status(self, as_dto: bool = False) -> Dict[str, Any]:
         """Checks the status of the service."""
-        url = self.base_url + self._config["status"]
-        return self._get(url)
+        return self._cached_get("status", as_dto)
 
-    def get_available_models(self) -> Dict[str, Any]:
+    def get_available_models(self, as_dto: bool = False) -> Dict[str, Any]:
         """Gets the list of available models."""
-        url = self.base_url + self._config["available_models"]
-        return self._get(url)
+        return self._cached_get("available_models", as_dto)
 
-    def get_available_llms(self) -> Dict[str, Any]:
+    def get_available_llms(self, as_dto: bool = False) -> Dict[str, Any]:
         """Gets the list of available LLMs."""
-        url = self.base_url + self._config["available_llms"]
-        return self._get(url)
+        return self._cached_get("available_llms", as_dto)
 
-    def get_available_prompts(self) -> List[Dict[str, Any]]:
+    def get_available_prompts(self, as_dto: bool = False) -> List[Dict[str, Any]]:
         """Gets the list of available prompts with their metadata."""
-        url = self.base_url + self._config["available_prompts"]
-        return self._get(url)
\ No newline at end of file
+        return self._cached_get("available_prompts", as_dto)
+
+    def invalidate_cache(self, key: Optional[str] = None) -> None:
+        """Drops the cached response of one endpoint, or of all of them."""
+        with self._cache_lock:
+            if key is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(key, None)
+
+    def _cached_get(self, key: str, as_dto: bool = False) -> Dict[str, Any]:
+        """
+        Serves an endpoint from the cache while fresh, returns the stale value and
+        refreshes it in the background inside the stale-while-revalidate window, and
+        otherwise revalidates it with ``If-None-Match`` / ``If-Modified-Since``.
+
+        With ``as_dto`` the response value is the endpoint's output DTO; uncached
+        endpoints decode the body straight into it.
+        """
+        url = self.base_url + self._config[key]
+        response_type = _RESPONSE_TYPES[key] if as_dto else None
+        if self._cache_ttls.get(key, 0) <= 0:
+            if self._single_flight is None:
+                return self._get_as(url, response_type)
+            return self._single_flight.do(
+                (key, as_dto), lambda: self._get_as(url, response_type)
+            )
+
+        entry = self._cache.get(key)
+        now = time.monotonic()
+        if entry is not None:
+            if now < entry.expires_at:
+                return _with_response_type(entry.value, response_type)
+            if now < entry.expires_at + self._stale_while_revalidate:
+                self._refresh_in_background(key)
+                return _with_response_type(entry.value, response_type)
+        return _with_response_type(self._fetch(key), response_type)
+
+    def _get_as(self, url: str, response_type: Optional[Type[Any]]) -> Dict[str, Any]:
+        if response_type is None:
+            return self._get(url)
+        return self._get(url, response_type=response_type)
+
+    def _fetch(self, key: str) -> Dict[str, Any]:
+        if self._single_flight is None:
+            return self._revalidate(key)
+        return self._single_flight.do(key, lambda: self._revalidate(key))
+
+    def _revalidate(self, key: str) -> Dict[str, Any]:
+        url = self.base_url + self._config[key]
+        entry = self._cache.get(key)
+        headers = {}
+        if entry is not None and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+
+        result, response = self._send("GET", url, headers=headers or None)
+        expires_at = time.monotonic() + self._cache_ttls[key]
+
+        if result is None and entry is not None:
+            entry.expires_at = expires_at
+            return entry.value
+        if result is None or not result.get("success"):
+            return result or {}
+
+        headers = response.headers if response is not None else {}
+        with self._cache_lock:
+            self._cache[key] = _CacheEntry(
+                result, expires_at, headers.get("ETag"), headers.get("Last-Modified")
+            )
+        return result
+
+    def _refresh_in_background(self, key: str) -> None:
+        with self._cache_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh() -> None:
+            try:
+                self._fetch(key)
+            finally:
+                with self._cache_lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+
+def _with_response_type(
+    result: Dict[str, Any], response_type: Optional[Type[Any]]
+) -> Dict[str, Any]:
+    """
+    Deep-copies a cached result, so callers cannot change the cache through it,
+    converting its response value to a DTO if asked.
+    """
+    result = copy.deepcopy(result)
+    if response_type is None or not result.get("success"):
+        return result
+    try:
+        return dict(result, response=convert(result["response"], response_type))
+    except ValueError as e:
+        return build_error_payload(f"Invalid response body: {e}")
@@ -1,31 +1,157 @@
-from typing import Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
+import requests
 from .http_client import HttpClient
+from ..utils.retry import RetryPolicy
+from ..utils.load_balancer import LoadBalancer
 import mimetypes
-import os
 from ..config.config import CONFIG
 from ..adapter.exceptions import AudioTranscriptionException
+from ..utils.multipart import AudioSource, MultipartStream, guess_filename
+from ..utils.audio_segments import (
+    WavSegment,
+    WavSource,
+    merge_overlap,
+    plan_segments,
+    read_segment,
+)
+from ..dtos.output import AudioSegmentDTO, AudioTranscriptionOutputDTO
+from ..utils.tracing import get_tracer
 
 class ConfigAudioAdapter(HttpClient):
     """Adapter to interact with the audio transcription microservice paths."""
 
-    def __init__(self, base_url: str, timeout: int = CONFIG.TIMEOUT) -> None:
-        super().__init__(timeout=timeout)
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = CONFIG.TIMEOUT,
+        session: Optional[requests.Session] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        load_balancer: Optional[LoadBalancer] = None,
+    ) -> None:
+        super().__init__(
+            timeout=timeout,
+            session=session,
+            retry_policy=retry_policy,
+            load_balancer=load_balancer,
+        )
         self._config = CONFIG.config_audio_adapter
         self.base_url = base_url
     
-    def transcribe_audio(self, audio_service: str, audio_url: str) -> Dict[str, Any]:
+    def transcribe_audio(
+        self,
+        audio_service: str,
+        audio_url: AudioSource,
+        filename: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Sends an audio file to the transcription service and retrieves the transcription.
+
+        The multipart body is streamed while it is sent, so memory use does not grow
+        with the size of the audio.
+
+        Args:
+            audio_service: The name of the audio service to use.
+            audio_url: A path, bytes-like object, binary file object or iterable of
+                byte chunks with the audio content.
+            filename: Name sent for the audio part; guessed from the source if omitted.
         """
         url = self.base_url + self._config["audio"]
         try:
-            mime_type, _ = mimetypes.guess_type(audio_url)
+            filename = filename or guess_filename(audio_url)
+            mime_type, _ = mimetypes.guess_type(filename)
             if not mime_type:
-                mime_type = "application/octet-stream" 
-            with open(audio_url, "rb") as audio_file:
-                files = {"audio": (audio_url, audio_file, mime_type)}
-                data = {"audio_service": audio_service}
-                response = self._post(url, files=files, data=data)
-                return response
+                mime_type = "application/octet-stream"
+            body = MultipartStream(
+                {"audio_service": audio_service}, "audio", filename, mime_type, audio_url
+            )
+            tracer = get_tracer()
+            attributes = {"audio.service": audio_service}
+            with tracer.span("audio.transcribe", attributes) as span:
+                if tracer.enabled and body.len is not None:
+                    span.set_attribute("audio.upload_bytes", body.len)
+                return self._post(
+                    url, data=body, headers={"Content-Type": body.content_type}
+                )
         except Exception as e:
             raise AudioTranscriptionException(f"Failed to transcribe audio: {e}") from e
+
+    def transcribe_audio_chunked(
+        self,
+        audio_service: str,
+        audio_url: WavSource,
+        segment_seconds: float = CONFIG.AUDIO_SEGMENT_SECONDS,
+        overlap_seconds: float = CONFIG.AUDIO_SEGMENT_OVERLAP_SECONDS,
+        silence_search_seconds: float = CONFIG.AUDIO_SILENCE_SEARCH_SECONDS,
+        max_concurrency: int = CONFIG.AUDIO_MAX_CONCURRENCY,
+    ) -> AudioTranscriptionOutputDTO:
+        """
+        Transcribes a long WAV file as overlapping segments sent in parallel.
+
+        Cuts are moved to the quietest point near each window boundary, segments are
+        transcribed concurrently and the texts are stitched back in order, dropping
+        the words repeated in the overlaps.
+
+        Args:
+            audio_service: The name of the audio service to use.
+            audio_url: Path or bytes-like object with WAV audio.
+            segment_seconds: Target length of each segment.
+            overlap_seconds: Audio shared by consecutive segments.
+            silence_search_seconds: How far before a window end to look for silence
+                (0 cuts at fixed windows).
+            max_concurrency: Maximum number of segments transcribed at once.
+
+        Returns:
+            An AudioTranscriptionOutputDTO with the full text and per-segment timings.
+        """
+        try:
+            segments = plan_segments(
+                audio_url, segment_seconds, overlap_seconds, silence_search_seconds
+            )
+        except Exception as e:
+            raise AudioTranscriptionException(f"Failed to split audio: {e}") from e
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            results = list(
+                executor.map(
+                    lambda segment: self._transcribe_segment(
+                        audio_service, audio_url, segment
+                    ),
+                    segments,
+                )
+            )
+
+        text = ""
+        for result in results:
+            piece = merge_overlap(text, result.text) if text else result.text
+            text = f"{text} {piece}".strip() if piece else text
+        return AudioTranscriptionOutputDTO(text=text, segments=results)
+
+    def _transcribe_segment(
+        self, audio_service: str, audio_url: WavSource, segment: WavSegment
+    ) -> AudioSegmentDTO:
+        started = time.monotonic()
+        response = self.transcribe_audio(
+            audio_service,
+            read_segment(audio_url, segment),
+            filename=f"segment_{segment.index}.wav",
+        )
+        if not response.get("success"):
+            raise AudioTranscriptionException(
+                f"Failed to transcribe segment {segment.index}: {response.get('error')}"
+            )
+        return AudioSegmentDTO(
+            index=segment.index,
+            start=segment.start,
+            end=segment.end,
+            text=_transcription_text(response.get("response")),
+            elapsed=time.monotonic() - started,
+        )
+
+
+def _transcription_text(response: Any) -> str:
+    """Extracts the transcribed text from the service response."""
+    if isinstance(response, dict):
+        return str(response.get("text", "")).strip()
+    return str(response or "").strip()
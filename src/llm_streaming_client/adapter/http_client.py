@@ -1,54 +1,296 @@
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, Optional, Tuple, Type
 import requests
+from requests.adapters import HTTPAdapter
 from ..config.config import CONFIG
-from ..utils.http_client_utils import build_success_response, build_error_response
+from ..utils.http_client_utils import (
+    build_success_response,
+    build_error_response,
+    build_error_payload,
+    get_error_info,
+)
+from ..utils.retry import RetryPolicy
+from ..utils.error_classifier import ErrorInfo, ErrorKind
+from ..utils.rate_limiter import RateKey, RateLimiter
+from ..utils.load_balancer import LoadBalancer, is_replica_failure
+from ..utils.tracing import get_tracer
+from ..utils.json_codec import BACKEND, dumps
+
+
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def create_session(
+    pool_connections: int = CONFIG.POOL_CONNECTIONS,
+    pool_maxsize: int = CONFIG.POOL_MAXSIZE,
+    pool_block: bool = CONFIG.POOL_BLOCK,
+    keep_alive: bool = CONFIG.KEEP_ALIVE,
+) -> requests.Session:
+    """
+    Creates a requests session with a tuned connection pool.
+
+    Args:
+        pool_connections: Number of per-host pools to cache.
+        pool_maxsize: Maximum number of connections kept per host.
+        pool_block: Wait for a free connection instead of opening (and then
+            discarding) an extra one when the pool is exhausted.
+        keep_alive: Reuse connections between requests.
+
+    Returns:
+        A session that can be shared by every adapter.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
 
 
 class HttpClient:
     """HTTP client for making requests to the llm-streaming service."""
 
-    def __init__(self, timeout: int = CONFIG.TIMEOUT) -> None:
+    def __init__(
+        self,
+        timeout: int = CONFIG.TIMEOUT,
+        session: Optional[requests.Session] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        load_balancer: Optional[LoadBalancer] = None,
+    ) -> None:
         self.timeout: int = timeout
-        self.session = requests.Session()
+        self.session = session if session is not None else create_session()
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.load_balancer = load_balancer
 
-    def _make_request(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
+    def _make_request(
+        self,
+        method: str,
+        url: str,
+        response_type: Optional[Type[Any]] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
         """Make HTTP request expecting JSON response."""
+        return self._send(method, url, response_type=response_type, **kwargs)[0]
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        response_type: Optional[Type[Any]] = None,
+        rate_key: Optional[RateKey] = None,
+        **kwargs,
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[requests.Response]]:
+        """
+        Make HTTP request returning the response structure and the raw response.
+
+        Transient failures are retried according to ``retry_policy`` while the
+        request body can be replayed, and calls to an endpoint whose circuit is
+        open fail immediately. A ``304 Not Modified`` reply yields ``None`` as
+        structure so callers doing conditional requests can reuse their cached copy.
+        With ``response_type`` the response value is decoded into that DTO.
+        With a ``rate_key`` every attempt first waits for the ``rate_limiter``,
+        which learns from the rate limit responses. Relative URLs are resolved
+        per attempt against the endpoint chosen by the ``load_balancer``, so a
+        retry may go to another replica.
+        """
+        tracer = get_tracer()
+        attributes = {"http.method": method, "http.url": url}
+        with tracer.span("http.request", attributes) as span:
+            if tracer.enabled:
+                headers = dict(kwargs.get("headers") or {})
+                tracer.inject(headers)
+                kwargs["headers"] = headers
+            result, response, attempts = self._send_with_retries(
+                method, url, response_type, rate_key, **kwargs
+            )
+            if tracer.enabled:
+                span.set_attribute("http.attempts", attempts)
+                if response is not None:
+                    span.set_attribute("http.status_code", response.status_code)
+            return result, response
+
+    def _send_with_retries(
+        self,
+        method: str,
+        url: str,
+        response_type: Optional[Type[Any]] = None,
+        rate_key: Optional[RateKey] = None,
+        **kwargs,
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[requests.Response], int]:
+        """Runs the retry loop of ``_send``, also returning the number of attempts."""
+        policy = self.retry_policy
+        limiter = self.rate_limiter if rate_key is not None else None
+        balancer = self.load_balancer if url.startswith("/") else None
+        attempts = policy.max_attempts if _is_replayable(kwargs) else 1
+        policy.budget.deposit()
+
+        attempt = 0
+        while True:
+            if limiter is not None and not limiter.acquire(rate_key):
+                return _rate_limited_locally(rate_key), None, attempt
+            endpoint = balancer.acquire() if balancer is not None else None
+            target = url if endpoint is None else endpoint.url + url
+            breaker = policy.breaker_for(target)
+            if not breaker.allow():
+                if endpoint is not None:
+                    balancer.release(endpoint, None, False)
+                return build_error_payload(f"Circuit open for {target}"), None, attempt
+
+            started = time.perf_counter()
+            result, response, retry_after, retryable = self._attempt(
+                method, target, response_type, **kwargs
+            )
+            info = get_error_info(result)
+            if endpoint is not None:
+                elapsed = time.perf_counter() - started
+                balancer.release(endpoint, elapsed, not is_replica_failure(info))
+            if limiter is not None:
+                _record_rate_outcome(limiter, rate_key, result, info)
+            if retryable and info.kind is not ErrorKind.RATE_LIMIT:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+            attempt += 1
+            if not retryable or attempt >= attempts:
+                return result, response, attempt
+            delay = policy.backoff(attempt - 1, retry_after)
+            if delay > policy.max_delay or not policy.budget.withdraw():
+                return result, response, attempt
+            policy.sleep(delay)
+
+    def _attempt(
+        self,
+        method: str,
+        url: str,
+        response_type: Optional[Type[Any]] = None,
+        **kwargs,
+    ) -> Tuple[
+        Optional[Dict[str, Any]], Optional[requests.Response], Optional[float], bool
+    ]:
+        """Performs one attempt, returning the result, raw response, Retry-After and
+        whether the failure is transient, as decided by the error classifier."""
+        tracer = get_tracer()
         try:
-            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
-            response.raise_for_status()
-            return build_success_response(response)
+            with tracer.span("http.attempt") as span:
+                response = self.session.request(
+                    method, url, timeout=self.timeout, **kwargs
+                )
+                if tracer.enabled:
+                    # Time from sending the request until the response headers
+                    # were parsed: connect, upload and server processing.
+                    span.set_attribute(
+                        "http.server_wait", response.elapsed.total_seconds()
+                    )
+                response.raise_for_status()
+                if response.status_code == 304:
+                    return None, response, None, False
+                with tracer.span("http.parse"):
+                    try:
+                        result = build_success_response(response, response_type)
+                    except ValueError as e:
+                        result = build_error_payload(f"Invalid response body: {e}")
+                return result, response, None, False
         except requests.exceptions.RequestException as e:
-            return build_error_response(e)
+            policy = self.retry_policy
+            idempotent = method in _IDEMPOTENT_METHODS or policy.replay_read_timeouts
+            result = build_error_response(e, policy.retry_statuses, idempotent)
+            info = get_error_info(result)
+            response = getattr(e, "response", None)
+            return result, response, info.retry_after, info.retryable
 
-    def _get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def _get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        response_type: Optional[Type[Any]] = None,
+    ) -> Dict[str, Any]:
         """
         Performs a GET request and returns the JSON response.
 
         Args:
             url: The URL to send the GET request to.
             params: Optional query parameters.
+            response_type: Optional DTO type the response value is decoded into.
 
         Returns:
             A dictionary containing the JSON response.
         """
-        return self._make_request("GET", url, params=params)
+        return self._make_request(
+            "GET", url, response_type=response_type, params=params
+        )
 
     def _post(
         self,
         url: str,
-        data: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
         files: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        rate_key: Optional[RateKey] = None,
     ) -> Dict[str, Any]:
         """
         Performs a POST request and returns the JSON response.
 
         Args:
             url: The URL to send the POST request to.
-            data: Optional form data to include in the request.
+            data: Optional form data, or an iterable body streamed as it is sent.
             files: Optional files to include in the request.
+            json: Optional JSON body, encoded with the fast JSON backend when one
+                is installed.
+            headers: Optional extra request headers.
+            rate_key: Optional ``(llm_name, model_name)`` the call is rate limited by.
 
         Returns:
             A dictionary containing the JSON response.
         """
-        return self._make_request("POST", url, data=data, files=files, json=json)
+        if json is not None and data is None and BACKEND != "json":
+            data, json = dumps(json), None
+            headers = {**(headers or {}), "Content-Type": "application/json"}
+        return self._make_request(
+            "POST",
+            url,
+            data=data,
+            files=files,
+            json=json,
+            headers=headers,
+            rate_key=rate_key,
+        )
+
+
+def _record_rate_outcome(
+    limiter: RateLimiter,
+    rate_key: RateKey,
+    result: Optional[Dict[str, Any]],
+    info: Optional[ErrorInfo],
+) -> None:
+    """Feeds the outcome of an attempt back into the rate limiter."""
+    if info is not None and info.kind is ErrorKind.RATE_LIMIT:
+        limiter.record_throttle(rate_key, info.retry_after)
+    elif result is None or result.get("success"):
+        limiter.record_success(rate_key)
+
+
+def _rate_limited_locally(rate_key: RateKey) -> Dict[str, Any]:
+    llm_name, model_name = rate_key
+    info = ErrorInfo(
+        message=f"Rate limit for {llm_name}/{model_name} exceeded locally",
+        kind=ErrorKind.RATE_LIMIT,
+        retryable=True,
+    )
+    return build_error_payload(error_info=info)
+
+
+def _is_replayable(kwargs: Dict[str, Any]) -> bool:
+    """Whether the request body can be sent again on retry."""
+    if kwargs.get("files"):
+        return False
+    data = kwargs.get("data")
+    return data is None or isinstance(data, (dict, str, bytes, list, tuple))
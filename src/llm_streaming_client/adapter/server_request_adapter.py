@@ -1,17 +1,47 @@
-from typing import Dict, Any, Optional
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple
+import requests
 from .http_client import HttpClient
+from ..utils.retry import RetryPolicy
 from ..config.config import CONFIG
 from ..dtos.input import MessageInputDTO
 from ..adapter.exceptions import RequestHandlingException
+from ..utils.http_client_utils import build_error_payload
+from ..utils.response_cache import ResponseCache, make_cache_key
+from ..utils.single_flight import SingleFlight
+from ..utils.hedging import Hedger
+from ..utils.rate_limiter import RateLimiter
+from ..utils.load_balancer import LoadBalancer
 
 
 class ServerRequestAdapter(HttpClient):
     """Adapter to interact with the request handling microservice paths."""
 
-    def __init__(self, base_url: str, timeout: int = CONFIG.TIMEOUT) -> None:
-        super().__init__(timeout=timeout)
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = CONFIG.TIMEOUT,
+        session: Optional[requests.Session] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        response_cache: Optional[ResponseCache] = None,
+        coalesce: bool = False,
+        hedger: Optional[Hedger] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        load_balancer: Optional[LoadBalancer] = None,
+    ) -> None:
+        super().__init__(
+            timeout=timeout,
+            session=session,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            load_balancer=load_balancer,
+        )
         self._config = CONFIG.server_request_adapter
         self.base_url = base_url
+        self.response_cache = response_cache
+        self._single_flight = SingleFlight() if coalesce else None
+        self.hedger = hedger
 
     def handle_request(self, dto: MessageInputDTO) -> Dict[str, Any]:
         """
@@ -29,21 +59,92 @@ class ServerRequestAdapter(HttpClient):
             A dictionary containing the response from the LLM service.
         """
         try:
-            data = {
-                "llm_name": dto.llm_name,
-                "model_name": dto.model_name,
-                "text": dto.text,
-                "language": dto.language.value,
-                "action_key": dto.action_key.value,
-            }
-            if dto.image_object:
-                data["image"] = dto.image_object
-            if dto.session_id:
-                data["session_id"] = dto.session_id
-            if dto.context_info:
-                data["context_info"] = dto.context_info
+            cache_key = None
+            if self.response_cache and self.response_cache.is_cacheable(dto):
+                cache_key = make_cache_key(dto)
+                cached = self.response_cache.get(cache_key)
+                if cached is not None:
+                    return cached
 
+            data = self.build_payload(dto)
             url = self.base_url + self._config["request"]
-            return self._post(url, json=data)
+            rate_key = (dto.llm_name, dto.model_name)
+
+            def post() -> Dict[str, Any]:
+                if self.rate_limiter is None:
+                    return self._post(url, json=data)
+                return self._post(url, json=data, rate_key=rate_key)
+
+            def send() -> Dict[str, Any]:
+                result = self.hedger.run(post) if self.hedger is not None else post()
+                if cache_key and result.get("success"):
+                    self.response_cache.set(cache_key, result)
+                return result
+
+            if self._single_flight is None:
+                return send()
+            flight_key = (cache_key or make_cache_key(dto), dto.session_id)
+            return self._single_flight.do(flight_key, send)
         except Exception:
             return {}
+
+    def handle_requests_batch(
+        self,
+        dtos: Iterable[MessageInputDTO],
+        max_concurrency: int = CONFIG.BATCH_MAX_CONCURRENCY,
+        ordered: bool = True,
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Sends many requests over a bounded pool of worker threads.
+
+        The input iterable is consumed lazily, so at most ``max_concurrency``
+        requests are in flight and pending at any time.
+
+        Args:
+            dtos: The MessageInputDTOs to send.
+            max_concurrency: Maximum number of concurrent requests.
+            ordered: Yield results in input order; otherwise in completion order.
+
+        Yields:
+            Tuples of (input index, response envelope). Failed items carry the
+            same envelope shape as ``build_error_response``.
+        """
+        items = enumerate(dtos)
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            pending: "deque[Tuple[int, Future]]" = deque()
+
+            def submit_next() -> bool:
+                for index, dto in items:
+                    pending.append((index, executor.submit(self._handle_one, dto)))
+                    return True
+                return False
+
+            while len(pending) < max_concurrency and submit_next():
+                pass
+
+            while pending:
+                if ordered:
+                    index, future = pending.popleft()
+                else:
+                    done, _ = wait(
+                        [f for _, f in pending], return_when=FIRST_COMPLETED
+                    )
+                    index, future = next(item for item in pending if item[1] in done)
+                    pending.remove((index, future))
+                yield index, future.result()
+                submit_next()
+
+    def _handle_one(self, dto: MessageInputDTO) -> Dict[str, Any]:
+        """Runs a single batch item, always returning a response envelope."""
+        try:
+            result = self.handle_request(dto)
+        except Exception as e:
+            return build_error_payload(str(RequestHandlingException(error=e)))
+        if not result:
+            return build_error_payload(RequestHandlingException.default_message)
+        return result
+
+    @staticmethod
+    def build_payload(dto: MessageInputDTO) -> Dict[str, Any]:
+        """Builds the JSON body sent to the request endpoint."""
+        return dto.to_payload()
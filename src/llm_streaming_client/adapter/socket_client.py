@@ -1,20 +1,110 @@
+import threading
+import time
+import uuid
 import socketio
 from ..config.config import CONFIG
 from ..dtos.input import StreamingInputDTO
+from ..dtos.output import SocketOutputDTO
 from ..adapter.exceptions import SocketCommunicationException
-from typing import Callable, Optional
+from .stream_handle import StreamHandle
+from ..utils.token_buffer import TokenCoalescer
+from ..utils.metrics import StreamMetrics, StreamTiming
+from ..utils.tracing import get_tracer
+from ..utils.rate_limiter import RateKey, RateLimiter
+from ..utils.error_classifier import ErrorInfo, ErrorKind, classify_payload
+from ..utils.load_balancer import Endpoint, LoadBalancer, is_replica_failure
+from typing import Any, Callable, Dict, Optional, Union
+
+
+class _StreamState:
+    """Routing state for a single in-flight stream delivered through ``on_token``."""
+
+    def __init__(
+        self,
+        request_id: str,
+        on_token: Optional[Callable[[str, bool], None]],
+        coalesce: bool = False,
+    ) -> None:
+        self.request_id = request_id
+        self.on_token = on_token
+        self.done = threading.Event()
+        self._deliver = TokenCoalescer(on_token) if on_token and coalesce else on_token
+
+    def feed(self, content: str, finished: bool) -> None:
+        if self._deliver:
+            try:
+                self._deliver(content, finished)
+            except Exception:
+                pass
+        else:
+            print(content, end="", flush=True)
+        if finished:
+            self.done.set()
+
+    def flush_due(self) -> None:
+        """Delivers coalesced tokens that have waited their flush interval."""
+        if isinstance(self._deliver, TokenCoalescer):
+            try:
+                self._deliver.flush_due()
+            except Exception:
+                pass
+
+    def fail(self, message: Any) -> None:
+        if isinstance(self._deliver, TokenCoalescer):
+            try:
+                self._deliver.flush()
+            except Exception:
+                pass
+        if self.on_token:
+            self.on_token(f"[ERROR] {message}", True)
+        else:
+            print(f"Error: {message}")
+        self.done.set()
 
 
 class SocketAdapter:
     """Adapter to interact with the Socket.IO server using StreamingInputDTO."""
 
-    def __init__(self, base_url: str, timeout: int = CONFIG.TIMEOUT) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = CONFIG.TIMEOUT,
+        persistent: bool = CONFIG.SOCKET_PERSISTENT,
+        coalesce_tokens: bool = CONFIG.COALESCE_TOKENS,
+        metrics: Optional[StreamMetrics] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        load_balancer: Optional[LoadBalancer] = None,
+        max_concurrent_streams: Optional[int] = CONFIG.SOCKET_MAX_CONCURRENT_STREAMS,
+        first_token_timeout: Optional[float] = CONFIG.SOCKET_FIRST_TOKEN_TIMEOUT,
+        idle_timeout: Optional[float] = CONFIG.SOCKET_IDLE_TIMEOUT,
+        stream_timeout: Optional[float] = CONFIG.SOCKET_STREAM_TIMEOUT,
+    ) -> None:
         """
         Initialize the Socket.IO adapter.
 
         Args:
             base_url: The base URL to connect to.
             timeout: Maximum wait time for the connection (in seconds).
+            persistent: Keep the connection open across calls instead of
+                connecting and disconnecting for every stream.
+            coalesce_tokens: Batch the tokens passed to ``on_token`` by size, count
+                and time (see ``CONFIG.TOKEN_COALESCE_*``) instead of one call
+                per server event.
+            metrics: Aggregator receiving the connect time, time to first token,
+                inter-token gaps, token count and duration of every stream.
+            rate_limiter: Optional limiter every stream waits for, keyed by its
+                llm_name and model_name, and slowed down by rate limit errors.
+            load_balancer: Optional balancer over several replicas. Each new
+                connection goes to the endpoint it picks, and a persistent
+                connection moves when its endpoint is ejected and no stream uses it.
+            max_concurrent_streams: Streams in flight at once on this adapter
+                (None for no limit). Further streams wait up to ``timeout``
+                seconds for a free slot.
+            first_token_timeout: Seconds a stream may wait for its first token.
+            idle_timeout: Seconds a stream may wait between two tokens.
+            stream_timeout: Seconds a stream may last in total.
+                A stream that exceeds any of these (None disables it) is cancelled
+                on the server and ends with an error.
         """
         self.sio = socketio.Client(
             reconnection_attempts=CONFIG.RECONNECT_ATTEMPTS, request_timeout=timeout
@@ -22,64 +112,435 @@ class SocketAdapter:
         self.namespace = CONFIG.SOCKET_NAMESPACE
         self.timeout = timeout
         self.base_url = base_url
+        self.persistent = persistent
+        self.coalesce_tokens = coalesce_tokens
+        self.metrics = metrics or StreamMetrics()
+        self._timings: Dict[str, StreamTiming] = {}
+        self.rate_limiter = rate_limiter
+        self._rate_keys: Dict[str, RateKey] = {}
+        self.load_balancer = load_balancer
+        self._endpoint: Optional[Endpoint] = None
+        self._stream_endpoints: Dict[str, Endpoint] = {}
+        self.max_concurrent_streams = max_concurrent_streams
+        self._slots = (
+            threading.BoundedSemaphore(max_concurrent_streams)
+            if max_concurrent_streams
+            else None
+        )
+        self.first_token_timeout = first_token_timeout
+        self.idle_timeout = idle_timeout
+        self.stream_timeout = stream_timeout
+        timeouts = [
+            t for t in (first_token_timeout, idle_timeout, stream_timeout) if t
+        ]
+        # The watchdog checks the deadlines about ten times per shortest timeout
+        # and flushes idle coalesced tokens about twice per flush interval.
+        intervals = [t / 10 for t in timeouts]
+        if coalesce_tokens and CONFIG.TOKEN_COALESCE_INTERVAL > 0:
+            intervals.append(CONFIG.TOKEN_COALESCE_INTERVAL / 2)
+        self._watch_interval = (
+            max(0.01, min(1.0, min(intervals))) if intervals else None
+        )
+        self._watchdog: Optional[threading.Thread] = None
+        self._streams: Dict[str, Union[_StreamState, StreamHandle]] = {}
+        # Reentrant: Socket.IO runs the disconnect handler inside disconnect().
+        self._lock = threading.RLock()
+
+        self.sio.on(
+            "response_message", self._on_response_message, namespace=self.namespace
+        )
+        self.sio.on("error", self._on_error, namespace=self.namespace)
+        self.sio.on("disconnect", self._on_disconnect, namespace=self.namespace)
+
+    def connect(self) -> bool:
+        """
+        Opens the Socket.IO connection if it is not already established.
+
+        A connection that dropped and is being re-established in the background
+        is abandoned and opened again, since Socket.IO refuses to connect a
+        client in that state.
+
+        Returns:
+            True if a new connection was opened.
+        """
+        with self._lock:
+            if self.sio.connected:
+                return False
+            if self.sio.eio.state != "disconnected":
+                self.sio.shutdown()
+                if self.sio.connected:
+                    return False
+            url = self.base_url
+            if self.load_balancer is not None:
+                self._endpoint = self.load_balancer.pick()
+                url = self._endpoint.url
+            try:
+                self.sio.connect(url, namespaces=[self.namespace])
+            except Exception:
+                if self.load_balancer is not None:
+                    # Count the failed connection against the endpoint's health.
+                    self.load_balancer.begin(self._endpoint)
+                    self.load_balancer.release(self._endpoint, None, False)
+                raise
+            return True
+
+    def close(self) -> None:
+        """Closes the Socket.IO connection and stops any reconnection attempts."""
+        with self._lock:
+            if self.sio.connected:
+                self.sio.disconnect()
+            else:
+                self.sio.shutdown()
 
     def send_messages(
         self,
         dto: StreamingInputDTO,
         on_token: Optional[Callable[[str, bool], None]] = None,
+        request_id: Optional[str] = None,
     ) -> None:
         """
         Sends a StreamingInputDTO to the Socket.IO server and streams the response tokens.
 
+        Every stream is tagged with a ``request_id`` that the server echoes back in
+        its ``response_message`` events, so several streams, from any number of
+        threads, can share one connection and finish independently.
+
         Args:
             dto: A StreamingInputDTO containing messages, llm_name, model_name, action_key, language, etc.
+            on_token: Optional callback receiving each token and the finished flag.
+            request_id: Optional id for the stream, so that another thread can
+                stop it with ``cancel(request_id)``. A random one by default.
         """
+        stream = _StreamState(
+            request_id or str(uuid.uuid4()), on_token, self.coalesce_tokens
+        )
+        tracer = get_tracer()
+        with tracer.span("socket.stream", self._span_attributes(dto)) as span:
+            try:
+                timing = self._open(dto, stream)
+                stream.done.wait()
+                if tracer.enabled:
+                    span.set_attribute("llm.request_id", stream.request_id)
+                    span.set_attribute("llm.tokens", timing.tokens)
+                    if timing.first_token is not None:
+                        span.set_attribute(
+                            "llm.ttft", timing.first_token - timing.started
+                        )
 
-        @self.sio.on("response_message", namespace=self.namespace)
-        def on_response_message(data):
-            content = data.get("content", "")
-            finished = data.get("finished", False)
-            if on_token:
-                try:
-                    on_token(content, finished)
-                except Exception:
-                    pass
-            else:
-                print(content, end="", flush=True)
+            except Exception as e:
+                if on_token:
+                    on_token(f"[EXCEPTION] {e}", True)
+                raise SocketCommunicationException(error=e)
+            finally:
+                self._release(stream)
 
-            if finished:
-                self.sio.disconnect()
+    def stream(
+        self,
+        dto: StreamingInputDTO,
+        maxsize: Optional[int] = CONFIG.STREAM_QUEUE_SIZE,
+    ) -> StreamHandle:
+        """
+        Starts a stream and returns a handle to iterate its tokens.
 
-        @self.sio.on("error", namespace=self.namespace)
-        def on_error(data):
-            if on_token:
-                on_token(f"[ERROR] {data}", True)
-            else:
-                print(f"Error: {data}")
-            self.sio.disconnect()
+        Args:
+            dto: A StreamingInputDTO describing the request.
+            maxsize: Unread tokens the handle keeps (None for no limit). A
+                consumer that falls further behind gets an error, and the stream
+                is cancelled on the server.
 
+        Returns:
+            A StreamHandle usable with ``for`` or ``async for``. Closing or
+            cancelling it before the end also cancels the stream on the server.
+        """
+        handle = StreamHandle(str(uuid.uuid4()), maxsize=maxsize, on_cancel=self.cancel)
         try:
-            self.sio.connect(self.base_url, namespaces=[self.namespace])
-
-            payload = {
-                "text": dto.text,
-                "llm_name": dto.llm_name,
-                "model_name": dto.model_name,
-                "action_key": dto.action_key.value,
-                "language": dto.language.value,
-                "session_id": dto.session_id,
-                "context_info": dto.context_info,
-            }
-            if dto.image_object:
-                payload["image_object"] = dto.image_object
-
-            self.sio.emit("send_message", payload, namespace=self.namespace)
-            self.sio.wait()
-
+            self._open(dto, handle)
         except Exception as e:
-            if on_token:
-                on_token(f"[EXCEPTION] {e}", True)
+            self._release(handle)
             raise SocketCommunicationException(error=e)
-        finally:
-            if self.sio.connected:
-                self.sio.disconnect()
+        return handle
+
+    def cancel(self, request_id: str) -> bool:
+        """
+        Stops an in-flight stream and asks the server to abort its generation.
+
+        An ``on_token`` stream receives a last empty token with ``finished`` set,
+        and iteration over a StreamHandle simply ends.
+
+        Returns:
+            False if no unfinished stream has this ``request_id``.
+        """
+        with self._lock:
+            stream = self._streams.get(request_id)
+        if stream is None or stream.done.is_set():
+            return False
+        self._abort(stream)
+        return True
+
+    def _open(
+        self, dto: StreamingInputDTO, stream: Union[_StreamState, StreamHandle]
+    ) -> StreamTiming:
+        """
+        Registers the stream, connects if needed and emits the request.
+
+        The current trace context, if any, travels in the ``trace_context``
+        field of the payload. With a ``rate_limiter`` the call first waits for
+        its turn, and then for a free stream slot, before the timing starts.
+        """
+        rate_key = (dto.llm_name, dto.model_name)
+        if self.rate_limiter is not None and not self.rate_limiter.acquire(rate_key):
+            raise SocketCommunicationException(
+                f"Rate limit for {dto.llm_name}/{dto.model_name} exceeded locally"
+            )
+        if self._slots is not None and not self._slots.acquire(timeout=self.timeout):
+            raise SocketCommunicationException(
+                f"No stream slot free after {self.timeout}s "
+                f"({self.max_concurrent_streams} streams in flight)"
+            )
+        timing = self.metrics.start(dto.llm_name, dto.model_name, dto.action_key.value)
+        with self._lock:
+            if self.load_balancer is not None:
+                self._rebalance()
+            self._streams[stream.request_id] = stream
+            self._timings[stream.request_id] = timing
+            if self.rate_limiter is not None:
+                self._rate_keys[stream.request_id] = rate_key
+            if self._watch_interval is not None and self._watchdog is None:
+                self._watchdog = threading.Thread(target=self._watch, daemon=True)
+                self._watchdog.start()
+        connect_started = time.perf_counter()
+        if self.connect():
+            timing.connect = time.perf_counter() - connect_started
+        if self.load_balancer is not None and self._endpoint is not None:
+            with self._lock:
+                self._stream_endpoints[stream.request_id] = self._endpoint
+            self.load_balancer.begin(self._endpoint)
+        payload = self.build_payload(dto, stream.request_id)
+        tracer = get_tracer()
+        if tracer.enabled:
+            carrier: Dict[str, str] = {}
+            tracer.inject(carrier)
+            if carrier:
+                payload["trace_context"] = carrier
+        self.sio.emit("send_message", payload, namespace=self.namespace)
+        return timing
+
+    def _release(self, stream: Union[_StreamState, StreamHandle]) -> None:
+        """Forgets a finished stream and drops the connection when not persistent."""
+        if not stream.done.is_set():
+            # Abandoned before the server ended it; the handlers record the
+            # outcome of every stream they end before marking it done.
+            self._record_timing(stream.request_id, error=True)
+        with self._lock:
+            self._rate_keys.pop(stream.request_id, None)
+            if self._streams.pop(stream.request_id, None) is None:
+                return
+            if self._slots is not None:
+                self._slots.release()
+            # Disconnect while holding the lock so a stream opened concurrently
+            # waits and reconnects instead of emitting on the closing connection.
+            if not self._streams and not self.persistent:
+                self.close()
+
+    def _abort(
+        self,
+        stream: Union[_StreamState, StreamHandle],
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        Ends a stream locally, cancelled or failed with ``error``, and tells the
+        server to stop generating it.
+        """
+        if self.sio.connected:
+            try:
+                self.sio.emit(
+                    "cancel_message",
+                    {"request_id": stream.request_id},
+                    namespace=self.namespace,
+                )
+            except Exception:
+                pass
+        if error is None:
+            self._record_timing(stream.request_id, cancelled=True)
+            stream.feed("", True)
+        else:
+            self._record_timing(stream.request_id, error=True)
+            stream.fail(error)
+        if isinstance(stream, StreamHandle):
+            self._release(stream)
+
+    def _watch(self) -> None:
+        """
+        Aborts streams past their deadlines and delivers coalesced tokens left
+        waiting by a quiet stream; runs while any stream is open.
+        """
+        while True:
+            now = time.perf_counter()
+            expired = []
+            with self._lock:
+                if not self._streams:
+                    self._watchdog = None
+                    return
+                streams = list(self._streams.values())
+                for stream in streams:
+                    error = self._deadline_error(stream, now)
+                    if error is not None:
+                        expired.append((stream, error))
+            for stream, error in expired:
+                self._abort(stream, error)
+            for stream in streams:
+                if isinstance(stream, _StreamState):
+                    stream.flush_due()
+            time.sleep(self._watch_interval)
+
+    def _deadline_error(
+        self, stream: Union[_StreamState, StreamHandle], now: float
+    ) -> Optional[str]:
+        timing = self._timings.get(stream.request_id)
+        if timing is None or stream.done.is_set():
+            return None
+        elapsed = now - timing.started
+        if self.stream_timeout and elapsed > self.stream_timeout:
+            return f"Stream timed out after {self.stream_timeout}s"
+        if timing.first_token is None:
+            if self.first_token_timeout and elapsed > self.first_token_timeout:
+                return f"No token received within {self.first_token_timeout}s"
+        elif self.idle_timeout and now - timing.last_token > self.idle_timeout:
+            return f"No token received for {self.idle_timeout}s"
+        return None
+
+    def _rebalance(self) -> None:
+        """Drops an idle connection whose endpoint has been ejected (under the lock)."""
+        if not self._streams and self._endpoint is not None and self.sio.connected:
+            if not self.load_balancer.is_available(self._endpoint):
+                self.close()
+
+    def _record_timing(
+        self,
+        request_id: str,
+        error: bool = False,
+        replica_ok: Optional[bool] = None,
+        cancelled: bool = False,
+    ) -> None:
+        """
+        Hands the timing of an ended stream to the metrics, once, and its time
+        to first token and outcome to the load balancer. ``replica_ok`` defaults
+        to ``not error``. A ``cancelled`` stream is counted as such and gives
+        the load balancer neither a latency sample nor an outcome.
+        """
+        with self._lock:
+            timing = self._timings.pop(request_id, None)
+            endpoint = self._stream_endpoints.pop(request_id, None)
+        if timing is not None and timing.finish(error, cancelled):
+            self.metrics.record(timing)
+        if endpoint is not None:
+            if cancelled:
+                self.load_balancer.release(endpoint, None, None)
+                return
+            latency = None
+            if timing is not None:
+                latency = (timing.first_token or timing.ended) - timing.started
+            ok = not error if replica_ok is None else replica_ok
+            self.load_balancer.release(endpoint, latency, ok)
+
+    def _record_rate_outcome(
+        self, request_id: str, info: Optional[ErrorInfo] = None
+    ) -> None:
+        """Tells the rate limiter whether a stream ended normally or was throttled."""
+        rate_key = self._rate_keys.get(request_id)
+        if rate_key is None:
+            return
+        if info is None:
+            self.rate_limiter.record_success(rate_key)
+            return
+        if info.kind is ErrorKind.RATE_LIMIT:
+            self.rate_limiter.record_throttle(rate_key, info.retry_after)
+
+    @staticmethod
+    def _span_attributes(dto: StreamingInputDTO) -> Dict[str, Any]:
+        return {
+            "llm.name": dto.llm_name,
+            "llm.model": dto.model_name,
+            "llm.action_key": dto.action_key.value,
+        }
+
+    @staticmethod
+    def build_payload(dto: StreamingInputDTO, request_id: str) -> Dict[str, Any]:
+        """Builds the ``send_message`` payload for a stream."""
+        return dto.to_payload(request_id)
+
+    def _resolve_stream(
+        self, data: Any
+    ) -> Optional[Union[_StreamState, StreamHandle]]:
+        """
+        Finds the stream an incoming event belongs to.
+
+        Events without a ``request_id`` are routed to the only active stream,
+        which keeps servers that do not echo the id working. Events for a
+        stream that has already ended or been cancelled are dropped.
+        """
+        request_id = data.get("request_id") if isinstance(data, dict) else None
+        return self._stream_for(request_id)
+
+    def _stream_for(
+        self, request_id: Optional[str]
+    ) -> Optional[Union[_StreamState, StreamHandle]]:
+        with self._lock:
+            if request_id in self._streams:
+                return self._streams[request_id]
+            if request_id is None and len(self._streams) == 1:
+                return next(iter(self._streams.values()))
+        return None
+
+    def _on_response_message(self, data: Dict[str, Any]) -> None:
+        event = SocketOutputDTO.from_wire(data)
+        stream = self._stream_for(event.request_id)
+        if stream is None:
+            return
+
+        content, finished = event.content, event.finished
+        timing = self._timings.get(stream.request_id)
+        if timing is not None and content:
+            timing.token()
+        if finished:
+            # Before ``feed`` marks the stream done and its caller releases it.
+            self._record_timing(stream.request_id)
+            self._record_rate_outcome(stream.request_id)
+        stream.feed(content, finished)
+        if not isinstance(stream, StreamHandle):
+            return
+        if finished:
+            self._release(stream)
+        elif stream.overflowed:
+            # The consumer fell behind; stop the server from producing more.
+            self.cancel(stream.request_id)
+
+    def _on_error(self, data: Any) -> None:
+        stream = self._resolve_stream(data)
+        if stream is not None:
+            targets = [stream]
+        else:
+            with self._lock:
+                targets = list(self._streams.values())
+
+        info = classify_payload(data)
+        replica_ok = not is_replica_failure(info)
+        for target in targets:
+            self._record_timing(target.request_id, error=True, replica_ok=replica_ok)
+            self._record_rate_outcome(target.request_id, info)
+            target.fail(data)
+            if isinstance(target, StreamHandle):
+                self._release(target)
+
+    def _on_disconnect(self, *args: Any) -> None:
+        # Socket.IO passes the reason; closing the connection ourselves says
+        # nothing about the health of the replica.
+        reason = args[0] if args else None
+        replica_ok = reason == socketio.Client.reason.CLIENT_DISCONNECT
+        with self._lock:
+            pending = [s for s in self._streams.values() if not s.done.is_set()]
+        for stream in pending:
+            self._record_timing(stream.request_id, error=True, replica_ok=replica_ok)
+            stream.fail("Socket disconnected")
+            if isinstance(stream, StreamHandle):
+                self._release(stream)
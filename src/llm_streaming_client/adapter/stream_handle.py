@@ -0,0 +1,220 @@
+import asyncio
+import collections
+import threading
+from typing import Any, AsyncIterator, Callable, Iterator, List, Optional, Tuple
+from ..config.config import CONFIG
+from ..utils.json_stream import IncrementalJSONParser, JSONEvent
+from ..adapter.exceptions import SocketCommunicationException
+
+
+class StreamHandle:
+    """
+    Iterable view over a response streamed through the SocketAdapter.
+
+    Tokens are appended by the Socket.IO event handlers to a per-stream buffer
+    and pulled by the consumer with ``for`` or ``async for``. Socket.IO runs
+    every event on its own thread, so the handlers never wait and no user code
+    ever runs on the Socket.IO threads; tokens are buffered in the order the
+    handlers reach the lock. At most ``maxsize`` unread tokens are kept (None for
+    no limit): a token past that overflows the handle, which drops it and every
+    later one and raises an error to the consumer once the buffered tokens are
+    read. Closing the handle before the stream finishes cancels it through
+    ``on_cancel``.
+    """
+
+    _END = object()
+
+    def __init__(
+        self,
+        request_id: str,
+        maxsize: Optional[int] = CONFIG.STREAM_QUEUE_SIZE,
+        on_cancel: Optional[Callable[[str], Any]] = None,
+    ) -> None:
+        self.request_id = request_id
+        self._on_cancel = on_cancel
+        self.done = threading.Event()
+        self.maxsize = maxsize
+        self._buffer: "collections.deque[Any]" = collections.deque()
+        self._ready = threading.Condition(threading.Lock())
+        self._chunks: List[str] = []
+        self._error: Optional[SocketCommunicationException] = None
+        self._closed = False
+        self._overflowed = False
+        self._exhausted = False
+        self._waiter: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = None
+
+    @property
+    def text(self) -> str:
+        """The text consumed so far; the full response once iteration has ended."""
+        return "".join(self._chunks)
+
+    @property
+    def finished(self) -> bool:
+        """Whether the server has finished the stream."""
+        return self.done.is_set()
+
+    @property
+    def backlogged(self) -> bool:
+        """Whether ``maxsize`` tokens are waiting, so the next one overflows."""
+        return bool(self.maxsize) and len(self._buffer) >= self.maxsize
+
+    @property
+    def overflowed(self) -> bool:
+        """Whether tokens were dropped because the consumer fell behind."""
+        return self._overflowed
+
+    def feed(self, content: str, finished: bool) -> None:
+        """Buffers a token received from the server (Socket.IO side); never blocks."""
+        with self._ready:
+            if content:
+                self._put(content)
+            if finished:
+                self._put(self._END)
+                self.done.set()
+        self._notify()
+
+    def fail(self, message: Any) -> None:
+        """Terminates the stream with an error raised to the consumer."""
+        with self._ready:
+            if self._error is None:
+                self._error = SocketCommunicationException(str(message))
+            self._put(self._END)
+            self.done.set()
+        self._notify()
+
+    def cancel(self) -> None:
+        """Stops the stream, here and on the server; iteration simply ends."""
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stops local delivery; tokens that arrive afterwards are dropped. An
+        unfinished stream is also cancelled on the server.
+        """
+        with self._ready:
+            self._closed = True
+            self._exhausted = True
+            self._buffer.clear()
+            # Wakes a consumer blocked on the buffer in another thread.
+            self._buffer.append(self._END)
+            self._ready.notify_all()
+        self._notify()
+        if not self.done.is_set() and self._on_cancel is not None:
+            self._on_cancel(self.request_id)
+
+    def result(self) -> str:
+        """Consumes the remaining tokens and returns the full text."""
+        for _ in self:
+            pass
+        return self.text
+
+    async def aresult(self) -> str:
+        """Asynchronously consumes the remaining tokens and returns the full text."""
+        async for _ in self:
+            pass
+        return self.text
+
+    def json_events(self, max_depth: Optional[int] = None) -> Iterator[JSONEvent]:
+        """
+        Consumes a stream of JSON (e.g. ``ActionKeys.IMAGE_EXTRACTION``) and yields
+        every field, row and object as soon as it closes, the whole document last.
+
+        Raises:
+            ValueError: If the streamed text is not a complete JSON document.
+        """
+        parser = IncrementalJSONParser(max_depth=max_depth)
+        for token in self:
+            yield from parser.feed(token)
+        parser.close()
+
+    async def ajson_events(
+        self, max_depth: Optional[int] = None
+    ) -> AsyncIterator[JSONEvent]:
+        """Asynchronous ``json_events``."""
+        parser = IncrementalJSONParser(max_depth=max_depth)
+        async for token in self:
+            for event in parser.feed(token):
+                yield event
+        parser.close()
+
+    def __enter__(self) -> "StreamHandle":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __iter__(self) -> "StreamHandle":
+        return self
+
+    def __next__(self) -> str:
+        if self._exhausted:
+            raise StopIteration
+        with self._ready:
+            while not self._buffer:
+                self._ready.wait()
+            item = self._buffer.popleft()
+        if item is self._END:
+            self._end()
+            raise StopIteration
+        self._chunks.append(item)
+        return item
+
+    def __aiter__(self) -> "StreamHandle":
+        return self
+
+    async def __anext__(self) -> str:
+        if self._exhausted:
+            raise StopAsyncIteration
+        while True:
+            if self._exhausted:
+                raise StopAsyncIteration
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            with self._ready:
+                if self._buffer:
+                    item = self._buffer.popleft()
+                    break
+                # Registered under the lock, so the next feed wakes this waiter.
+                self._waiter = (loop, future)
+            try:
+                await future
+            finally:
+                self._waiter = None
+        if item is self._END:
+            self._end()
+            raise StopAsyncIteration
+        self._chunks.append(item)
+        return item
+
+    def _end(self) -> None:
+        self._exhausted = True
+        if self._error is not None:
+            raise self._error
+
+    def _put(self, item: Any) -> None:
+        # Called with ``_ready`` held; tokens after ``close`` are dropped.
+        if self._closed:
+            return
+        if item is not self._END and self.backlogged:
+            self._overflowed = True
+            self._closed = True
+            self._error = SocketCommunicationException(
+                f"Stream overflowed: more than {self.maxsize} unread tokens"
+            )
+            item = self._END
+        self._buffer.append(item)
+        self._ready.notify()
+
+    def _notify(self) -> None:
+        waiter = self._waiter
+        if waiter is not None:
+            loop, future = waiter
+            try:
+                loop.call_soon_threadsafe(_wake, future)
+            except RuntimeError:
+                pass
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
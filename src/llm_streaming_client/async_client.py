@@ -0,0 +1,199 @@
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+from .adapter.async_server_request_adapter import AsyncServerRequestAdapter
+from .adapter.async_config_audio_adapter import AsyncConfigAudioAdapter
+from .adapter.async_config_adapter import AsyncConfigAdapter
+from .adapter.async_socket_client import AsyncSocketAdapter
+from .client import build_message_input, build_streaming_input
+from .config.config import CONFIG
+from .dtos.output import (
+    StatusOutputDTO,
+    AvailableModelsOutputDTO,
+    AvailableLLMsOutputDTO,
+    AvailablePromptsOutputDTO,
+    AudioTranscriptionOutputDTO,
+)
+from .enums.action_keys import ActionKeys
+from .enums.language_keys import LanguageEnum
+from .dtos.prompt_dto import PromptTemplate
+
+
+class AsyncLLMStreamingClient:
+    """Asyncio twin of LLMStreamingClient for the llm_streaming."""
+
+    def __init__(
+        self,
+        base_url: Optional[str] = CONFIG.BASE_URL,
+        timeout: int = CONFIG.TIMEOUT,
+        persistent_socket: bool = CONFIG.SOCKET_PERSISTENT,
+    ) -> None:
+        """
+        Initialize the client. No connection is opened until the first call.
+
+        Args:
+            base_url: Base URL of the service
+            timeout: Maximum wait time for requests
+            persistent_socket: Keep the Socket.IO connection open across calls
+        """
+        self.base_url = base_url
+        self.config_adapter = AsyncConfigAdapter(
+            timeout=timeout, base_url=self.base_url
+        )
+        self.config_audio_adapter = AsyncConfigAudioAdapter(
+            timeout=timeout, base_url=self.base_url
+        )
+        self.server_request_adapter = AsyncServerRequestAdapter(
+            timeout=timeout, base_url=self.base_url
+        )
+        self.socket_adapter = AsyncSocketAdapter(
+            timeout=timeout, base_url=self.base_url, persistent=persistent_socket
+        )
+
+    async def __aenter__(self) -> "AsyncLLMStreamingClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the HTTP sessions and the Socket.IO connection.
+        """
+        await self.config_adapter.close()
+        await self.config_audio_adapter.close()
+        await self.server_request_adapter.close()
+        await self.socket_adapter.close()
+
+    async def get_status(self) -> StatusOutputDTO:
+        """
+        Get the status of the service.
+
+        Returns:
+            Dictionary with the status information.
+        """
+        return await self.config_adapter.status()
+
+    async def get_models(self) -> AvailableModelsOutputDTO:
+        """
+        Get the list of available models.
+
+        Returns:
+            Dictionary with the available models.
+        """
+        return await self.config_adapter.get_available_models()
+
+    async def get_llms(self) -> AvailableLLMsOutputDTO:
+        """
+        Get the list of available LLMs.
+
+        Returns:
+            Dictionary with the available LLMs.
+        """
+        return await self.config_adapter.get_available_llms()
+
+    async def get_prompts(self) -> AvailablePromptsOutputDTO:
+        """
+        Get the list of available prompts with their metadata.
+
+        Returns:
+            List of dictionaries containing prompt metadata.
+        """
+        return await self.config_adapter.get_available_prompts()
+
+    async def transcribe_audio(
+        self, audio_service: str, audio_url: str
+    ) -> AudioTranscriptionOutputDTO:
+        """
+        Transcribe an audio file using the specified audio service.
+
+        Args:
+            audio_service: The name of the audio service to use.
+            audio_url: Path of the audio file.
+
+        Returns:
+            A dictionary containing the transcription result.
+        """
+        return await self.config_audio_adapter.transcribe_audio(
+            audio_service, audio_url
+        )
+
+    async def handle_request(
+        self,
+        text: str,
+        action_key: ActionKeys,
+        llm_name: str = "openai",
+        model_name: str = "gpt-4o-mini",
+        language: LanguageEnum = LanguageEnum.SPANISH,
+        context_info: Optional[str] = None,
+        image_object: Optional[Any] = None,
+        session_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Handle a request to the LLM service.
+
+        Args:
+            text: The input text for the request.
+            action_key: The action key to determine the type of request.
+            llm_name: The name of the LLM to use (default: "openai").
+            model_name: The name of the model to use (default: "gpt-4o-mini").
+            image_object: Optional image object for the request.
+            session_id: Optional session ID for the request.
+
+        Returns:
+            A dictionary containing the response from the LLM service.
+        """
+        dto = build_message_input(
+            text=text,
+            action_key=action_key,
+            llm_name=llm_name,
+            model_name=model_name,
+            language=language,
+            context_info=context_info,
+            image_object=image_object,
+            session_id=session_id,
+        )
+        return await self.server_request_adapter.handle_request(dto)
+
+    async def send_messages_via_socket(
+        self,
+        text: str,
+        action_key: ActionKeys = "default",
+        llm: Optional[str] = "google",
+        model: Optional[str] = "gemini-2.5-flash-lite",
+        language: Optional[LanguageEnum] = LanguageEnum.SPANISH,
+        prompt: Optional[PromptTemplate] = None,
+        image_object: Optional[Any] = None,
+        session_id: Optional[str] = None,
+        context_info: Optional[str] = None,
+        on_token: Optional[
+            Callable[[str, bool], Union[None, Awaitable[None]]]
+        ] = None,
+    ) -> None:
+        """
+        Send messages to the LLM service via Socket.IO and stream the response tokens.
+        Args:
+            text: The input text to send.
+            action_key: The action key to determine the type of request (default: "default").
+            llm: The name of the LLM to use (default: "google").
+            model: The name of the model to use (default: "gemini-2.5-flash-lite").
+            language: The language of the input text (default: LanguageEnum.SPANISH).
+            prompt: Optional prompt template to use.
+            image_object: Optional image object for the request.
+            session_id: Optional session ID for the request.
+            context_info: Optional context information for the request.
+            on_token: Optional callback, plain or ``async``, to handle each token received.
+                        It receives the token content (str) and whether the stream is finished.
+        Returns:
+            None
+        """
+        dto = build_streaming_input(
+            text=text,
+            action_key=action_key,
+            llm=llm,
+            model=model,
+            language=language,
+            prompt=prompt,
+            image_object=image_object,
+            session_id=session_id,
+            context_info=context_info,
+        )
+        await self.socket_adapter.send_messages(dto, on_token=on_token)
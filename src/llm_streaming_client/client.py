@@ -1,9 +1,8 @@
-from typing import BinaryIO, Union, List, Dict, Any, Optional, Callable
-from .adapter.server_request_adapter import ServerRequestAdapter
-from .adapter.config_audio_adapter import ConfigAudioAdapter
-from .adapter.config_adapter import ConfigAdapter
-from .adapter.socket_client import SocketAdapter
-from typing import Dict, Any, Optional
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Union, List, Dict, Any, Optional, Callable
+from typing import Iterable, Iterator, Sequence, Tuple
 from .config.config import CONFIG
 from .dtos.output import (
     StatusOutputDTO,
@@ -19,80 +18,490 @@ from .enums.language_keys import LanguageEnum
 from .dtos.prompt_dto import PromptTemplate
 from .dtos.core_dto import IMessage
 
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+    import requests
+
+    from .adapter.config_adapter import ConfigAdapter
+    from .adapter.config_audio_adapter import ConfigAudioAdapter
+    from .adapter.server_request_adapter import ServerRequestAdapter
+    from .adapter.socket_client import SocketAdapter
+    from .adapter.stream_handle import StreamHandle
+    from .utils.audio_segments import WavSource
+    from .utils.hedging import Hedger
+    from .utils.metrics import StreamMetrics
+    from .utils.multipart import AudioSource
+    from .utils.rate_limiter import RateLimiter
+    from .utils.load_balancer import LoadBalancer
+    from .utils.response_cache import ResponseCache
+    from .utils.retry import RetryPolicy
+
+
+def build_message_input(
+    text: str,
+    action_key: ActionKeys,
+    llm_name: str,
+    model_name: str,
+    language: LanguageEnum,
+    context_info: Optional[str] = None,
+    image_object: Optional[Any] = None,
+    session_id: Optional[str] = None,
+) -> MessageInputDTO:
+    """
+    Build the MessageInputDTO for a request, accepting enum values as strings.
+    """
+    return MessageInputDTO(
+        llm_name=llm_name,
+        model_name=model_name,
+        text=text or "",
+        context_info=context_info,
+        language=(LanguageEnum(language) if isinstance(language, str) else language),
+        action_key=(
+            ActionKeys(action_key) if isinstance(action_key, str) else action_key
+        ),
+        image_object=image_object,
+        session_id=session_id,
+    )
+
+
+def build_streaming_input(
+    text: str,
+    action_key: ActionKeys,
+    llm: Optional[str],
+    model: Optional[str],
+    language: Optional[LanguageEnum],
+    prompt: Optional[PromptTemplate] = None,
+    image_object: Optional[Any] = None,
+    session_id: Optional[str] = None,
+    context_info: Optional[str] = None,
+) -> StreamingInputDTO:
+    """
+    Build the StreamingInputDTO for a socket stream, accepting the action key as a string.
+    """
+    return StreamingInputDTO(
+        llm_name=llm,
+        model_name=model,
+        text=text,
+        prompt=prompt,
+        language=language,
+        action_key=(
+            ActionKeys(action_key) if isinstance(action_key, str) else action_key
+        ),
+        image_object=image_object,
+        session_id=session_id,
+        context_info=context_info,
+    )
+
 
 class LLMStreamingClient:
     """Simplified client for the llm_streaming."""
 
     def __init__(
-        self, base_url: Optional[str] = CONFIG.BASE_URL, timeout: int = CONFIG.TIMEOUT
+        self,
+        base_url: Union[str, Sequence[str], None] = CONFIG.BASE_URL,
+        timeout: int = CONFIG.TIMEOUT,
+        persistent_socket: bool = CONFIG.SOCKET_PERSISTENT,
+        max_concurrent_streams: Optional[int] = CONFIG.SOCKET_MAX_CONCURRENT_STREAMS,
+        first_token_timeout: Optional[float] = CONFIG.SOCKET_FIRST_TOKEN_TIMEOUT,
+        idle_timeout: Optional[float] = CONFIG.SOCKET_IDLE_TIMEOUT,
+        stream_timeout: Optional[float] = CONFIG.SOCKET_STREAM_TIMEOUT,
+        session: Optional[requests.Session] = None,
+        pool_connections: int = CONFIG.POOL_CONNECTIONS,
+        pool_maxsize: int = CONFIG.POOL_MAXSIZE,
+        pool_block: bool = CONFIG.POOL_BLOCK,
+        keep_alive: bool = CONFIG.KEEP_ALIVE,
+        discovery_cache_ttls: Optional[Dict[str, float]] = CONFIG.DISCOVERY_CACHE_TTLS,
+        stale_while_revalidate: float = CONFIG.DISCOVERY_STALE_WHILE_REVALIDATE,
+        response_cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = CONFIG.COALESCE_REQUESTS,
+        coalesce_discovery: bool = CONFIG.COALESCE_DISCOVERY,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedger: Optional[Hedger] = None,
+        coalesce_tokens: bool = CONFIG.COALESCE_TOKENS,
+        stream_metrics: Optional[StreamMetrics] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        load_balancing_policy: str = CONFIG.LB_POLICY,
+        health_check_interval: Optional[float] = CONFIG.LB_PROBE_INTERVAL,
     ) -> None:
         """
         Initialize the client.
 
         Args:
-            base_url: Base URL of the service
+            base_url: Base URL of the service, or a list of the base URLs of its
+                replicas to balance HTTP requests and socket streams over them
             timeout: Maximum wait time for requests
+            persistent_socket: Keep the Socket.IO connection open across calls
+            max_concurrent_streams: Socket streams in flight at once; further
+                streams wait for a free slot (None for no limit)
+            first_token_timeout: Seconds a socket stream may wait for its first token
+            idle_timeout: Seconds a socket stream may wait between two tokens
+            stream_timeout: Seconds a socket stream may last in total. A stream
+                past any of these deadlines (None disables one) is cancelled
+                on the server and ends with an error
+            session: Optional requests session shared by every HTTP adapter.
+                When omitted one is created from the pool settings below.
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum number of connections kept per host
+            pool_block: Wait for a free connection when the pool is exhausted
+            keep_alive: Reuse HTTP connections between requests
+            discovery_cache_ttls: Seconds status/models/llms/prompts are cached
+                (None disables the cache)
+            stale_while_revalidate: Seconds a stale discovery response may be served
+                while it is refreshed in the background
+            response_cache: Optional ResponseCache reused for deterministic
+                handle_request actions (summarize, topic_classifier, extract)
+            coalesce_requests: Share one upstream call, and so one completion,
+                between concurrent identical handle_request calls
+            coalesce_discovery: Share one upstream call between concurrent
+                status/models/llms/prompts calls
+            retry_policy: Retry, retry budget and circuit breaker settings shared by
+                every HTTP adapter (defaults to a RetryPolicy built from CONFIG)
+            hedger: Optional Hedger that duplicates slow handle_request calls to cut
+                tail latency
+            coalesce_tokens: Batch the tokens passed to ``on_token`` in
+                send_messages_via_socket; finished and error events are never delayed
+            stream_metrics: Optional StreamMetrics collecting Socket.IO stream timings
+                (a private one is created by default)
+            rate_limiter: Optional RateLimiter that queues handle_request calls and
+                socket streams locally per llm_name/model_name and adapts to the
+                provider's rate limit errors
+            load_balancing_policy: With several base URLs, "least_outstanding" or
+                "ewma" (see LoadBalancer)
+            health_check_interval: Seconds between the status probes of every
+                replica when several base URLs are given (None disables them)
         """
-        self.base_url = base_url
-        self.config_adapter = ConfigAdapter(timeout=timeout, base_url=self.base_url)
-        self.config_audio_adapter = ConfigAudioAdapter(
-            timeout=timeout, base_url=self.base_url
+        self._lazy_lock = threading.RLock()
+        if isinstance(base_url, (list, tuple)):
+            self.base_urls: List[str] = list(base_url)
+        else:
+            self.base_urls = [base_url]
+        # With several replicas the adapters get relative paths, resolved per
+        # request against the endpoint chosen by the load balancer.
+        self.base_url = self.base_urls[0] if len(self.base_urls) == 1 else ""
+        self.timeout = timeout
+        self._owns_session = session is None
+        if session is not None:
+            self.session = session
+        if retry_policy is not None:
+            self.retry_policy = retry_policy
+        if stream_metrics is not None:
+            self.stream_metrics = stream_metrics
+        self._options: Dict[str, Any] = {
+            "persistent_socket": persistent_socket,
+            "max_concurrent_streams": max_concurrent_streams,
+            "first_token_timeout": first_token_timeout,
+            "idle_timeout": idle_timeout,
+            "stream_timeout": stream_timeout,
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+            "keep_alive": keep_alive,
+            "discovery_cache_ttls": discovery_cache_ttls,
+            "stale_while_revalidate": stale_while_revalidate,
+            "response_cache": response_cache,
+            "coalesce_requests": coalesce_requests,
+            "coalesce_discovery": coalesce_discovery,
+            "hedger": hedger,
+            "coalesce_tokens": coalesce_tokens,
+            "rate_limiter": rate_limiter,
+            "load_balancing_policy": load_balancing_policy,
+            "health_check_interval": health_check_interval,
+        }
+        self._probe_adapters: Dict[str, ConfigAdapter] = {}
+
+    # Attributes built on first access, so a process that only sends HTTP requests
+    # never imports socketio, and importing this module loads no transport library.
+    _LAZY_ATTRIBUTES = {
+        "session": "_create_session",
+        "retry_policy": "_create_retry_policy",
+        "stream_metrics": "_create_stream_metrics",
+        "load_balancer": "_create_load_balancer",
+        "config_adapter": "_create_config_adapter",
+        "config_audio_adapter": "_create_config_audio_adapter",
+        "server_request_adapter": "_create_server_request_adapter",
+        "socket_adapter": "_create_socket_adapter",
+    }
+
+    def __getattr__(self, name: str) -> Any:
+        factory = type(self)._LAZY_ATTRIBUTES.get(name)
+        if factory is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        with self._lazy_lock:
+            if name not in self.__dict__:
+                self.__dict__[name] = getattr(self, factory)()
+        return self.__dict__[name]
+
+    def _create_session(self) -> requests.Session:
+        from .adapter.http_client import create_session
+
+        return create_session(
+            pool_connections=self._options["pool_connections"],
+            pool_maxsize=self._options["pool_maxsize"],
+            pool_block=self._options["pool_block"],
+            keep_alive=self._options["keep_alive"],
+        )
+
+    def _create_retry_policy(self) -> RetryPolicy:
+        from .utils.retry import RetryPolicy
+
+        return RetryPolicy()
+
+    def _create_stream_metrics(self) -> StreamMetrics:
+        from .utils.metrics import StreamMetrics
+
+        return StreamMetrics()
+
+    def _create_load_balancer(self) -> Optional[LoadBalancer]:
+        if len(self.base_urls) == 1:
+            return None
+        from .utils.load_balancer import LoadBalancer
+
+        balancer = LoadBalancer(
+            self.base_urls, policy=self._options["load_balancing_policy"]
+        )
+        interval = self._options["health_check_interval"]
+        if interval:
+            balancer.start_probing(self._probe_endpoint, interval)
+        return balancer
+
+    def _probe_endpoint(self, url: str) -> bool:
+        """Health probe of one replica: a single, uncached status call."""
+        adapter = self._probe_adapters.get(url)
+        if adapter is None:
+            from .adapter.config_adapter import ConfigAdapter
+            from .utils.retry import RetryPolicy
+
+            adapter = self._probe_adapters[url] = ConfigAdapter(
+                base_url=url,
+                timeout=self.timeout,
+                session=self.session,
+                retry_policy=RetryPolicy(max_attempts=1),
+                cache_ttls=None,
+            )
+        return bool(adapter.status().get("success"))
+
+    def _create_config_adapter(self) -> ConfigAdapter:
+        from .adapter.config_adapter import ConfigAdapter
+
+        return ConfigAdapter(
+            timeout=self.timeout,
+            base_url=self.base_url,
+            session=self.session,
+            retry_policy=self.retry_policy,
+            cache_ttls=self._options["discovery_cache_ttls"],
+            stale_while_revalidate=self._options["stale_while_revalidate"],
+            coalesce=self._options["coalesce_discovery"],
+            load_balancer=self.load_balancer,
+        )
+
+    def _create_config_audio_adapter(self) -> ConfigAudioAdapter:
+        from .adapter.config_audio_adapter import ConfigAudioAdapter
+
+        return ConfigAudioAdapter(
+            timeout=self.timeout,
+            base_url=self.base_url,
+            session=self.session,
+            retry_policy=self.retry_policy,
+            load_balancer=self.load_balancer,
         )
-        self.server_request_adapter = ServerRequestAdapter(
-            timeout=timeout, base_url=self.base_url
+
+    def _create_server_request_adapter(self) -> ServerRequestAdapter:
+        from .adapter.server_request_adapter import ServerRequestAdapter
+
+        return ServerRequestAdapter(
+            timeout=self.timeout,
+            base_url=self.base_url,
+            session=self.session,
+            retry_policy=self.retry_policy,
+            response_cache=self._options["response_cache"],
+            coalesce=self._options["coalesce_requests"],
+            hedger=self._options["hedger"],
+            rate_limiter=self._options["rate_limiter"],
+            load_balancer=self.load_balancer,
+        )
+
+    def _create_socket_adapter(self) -> SocketAdapter:
+        from .adapter.socket_client import SocketAdapter
+
+        return SocketAdapter(
+            timeout=self.timeout,
+            base_url=self.base_url,
+            persistent=self._options["persistent_socket"],
+            max_concurrent_streams=self._options["max_concurrent_streams"],
+            first_token_timeout=self._options["first_token_timeout"],
+            idle_timeout=self._options["idle_timeout"],
+            stream_timeout=self._options["stream_timeout"],
+            coalesce_tokens=self._options["coalesce_tokens"],
+            metrics=self.stream_metrics,
+            rate_limiter=self._options["rate_limiter"],
+            load_balancer=self.load_balancer,
         )
-        self.socket_adapter = SocketAdapter(timeout=timeout, base_url=self.base_url)
 
-    def get_status(self) -> StatusOutputDTO:
+    def close(self) -> None:
+        """
+        Close the persistent Socket.IO connection, if any, and the HTTP pool.
+        """
+        if self.__dict__.get("load_balancer") is not None:
+            self.load_balancer.stop_probing()
+        if "socket_adapter" in self.__dict__:
+            self.socket_adapter.close()
+        if self._owns_session and "session" in self.__dict__:
+            self.session.close()
+
+    def get_endpoints(self) -> List[Dict[str, Any]]:
+        """
+        Get the health and load of every replica when several base URLs are used.
+
+        Returns:
+            One entry per base URL with its availability, outstanding calls, EWMA
+            latency, slow start weight and request, error and ejection counts;
+            an empty list with a single base URL.
+        """
+        if self.load_balancer is None:
+            return []
+        return self.load_balancer.snapshot()
+
+    def get_stream_metrics(self) -> List[Dict[str, Any]]:
+        """
+        Get the Socket.IO streaming metrics collected so far.
+
+        Returns:
+            One entry per llm_name / model_name / action_key with the stream and
+            error counts and the connect, ttft, inter_token, duration and tokens
+            histograms.
+        """
+        return self.stream_metrics.snapshot()
+
+    def export_metrics_prometheus(self) -> str:
+        """
+        Render the streaming metrics in the Prometheus text format.
+
+        Returns:
+            The metrics in the Prometheus text exposition format.
+        """
+        return self.stream_metrics.to_prometheus()
+
+    def serve_metrics_prometheus(
+        self, port: int, addr: str = "0.0.0.0"
+    ) -> ThreadingHTTPServer:
+        """
+        Serve the streaming metrics for Prometheus scraping from a background thread.
+
+        Args:
+            port: Port to listen on.
+            addr: Address to bind.
+
+        Returns:
+            The HTTP server; call ``shutdown()`` on it to stop serving.
+        """
+        from .utils.metrics import start_prometheus_server
+
+        return start_prometheus_server(self.stream_metrics, port, addr)
+
+    def get_status(self, as_dto: bool = False) -> StatusOutputDTO:
         """
         Get the status of the service.
 
+        Args:
+            as_dto: Return the response value as an output DTO instead of a dict.
+
         Returns:
             Dictionary with the status information.
         """
-        return self.config_adapter.status()
+        return self.config_adapter.status(as_dto=as_dto)
 
-    def get_models(self) -> AvailableModelsOutputDTO:
+    def get_models(self, as_dto: bool = False) -> AvailableModelsOutputDTO:
         """
         Get the list of available models.
 
+        Args:
+            as_dto: Return the response value as an output DTO instead of a dict.
+
         Returns:
             Dictionary with the available models.
         """
-        return self.config_adapter.get_available_models()
+        return self.config_adapter.get_available_models(as_dto=as_dto)
 
-    def get_llms(self) -> AvailableLLMsOutputDTO:
+    def get_llms(self, as_dto: bool = False) -> AvailableLLMsOutputDTO:
         """
         Get the list of available LLMs.
 
+        Args:
+            as_dto: Return the response value as an output DTO instead of a dict.
+
         Returns:
             Dictionary with the available LLMs.
         """
-        return self.config_adapter.get_available_llms()
+        return self.config_adapter.get_available_llms(as_dto=as_dto)
 
-    def get_prompts(self) -> AvailablePromptsOutputDTO:
+    def get_prompts(self, as_dto: bool = False) -> AvailablePromptsOutputDTO:
         """
         Get the list of available prompts with their metadata.
 
+        Args:
+            as_dto: Return the response value as an output DTO instead of a dict.
+
         Returns:
             List of dictionaries containing prompt metadata.
         """
-        return self.config_adapter.get_available_prompts()
+        return self.config_adapter.get_available_prompts(as_dto=as_dto)
 
     def transcribe_audio(
-        self, audio_service: str, audio_url: str
+        self,
+        audio_service: str,
+        audio_url: AudioSource,
+        filename: Optional[str] = None,
     ) -> AudioTranscriptionOutputDTO:
         """
         Transcribe an audio file using the specified audio service.
 
         Args:
             audio_service: The name of the audio service to use.
-            audio_url: The audio file in binary format.
+            audio_url: Path, bytes, memoryview, binary file object or iterable of
+                byte chunks with the audio. It is streamed, never fully buffered.
+            filename: Optional name sent for the audio part.
 
         Returns:
             A dictionary containing the transcription result.
         """
-        return self.config_audio_adapter.transcribe_audio(audio_service, audio_url)
+        return self.config_audio_adapter.transcribe_audio(
+            audio_service, audio_url, filename=filename
+        )
+
+    def transcribe_audio_chunked(
+        self,
+        audio_service: str,
+        audio_url: WavSource,
+        segment_seconds: float = CONFIG.AUDIO_SEGMENT_SECONDS,
+        overlap_seconds: float = CONFIG.AUDIO_SEGMENT_OVERLAP_SECONDS,
+        silence_search_seconds: float = CONFIG.AUDIO_SILENCE_SEARCH_SECONDS,
+        max_concurrency: int = CONFIG.AUDIO_MAX_CONCURRENCY,
+    ) -> AudioTranscriptionOutputDTO:
+        """
+        Transcribe a long WAV file as overlapping segments processed in parallel.
+
+        Args:
+            audio_service: The name of the audio service to use.
+            audio_url: Path or bytes-like object with WAV audio.
+            segment_seconds: Target length of each segment.
+            overlap_seconds: Audio shared by consecutive segments.
+            silence_search_seconds: How far before each cut to look for silence.
+            max_concurrency: Maximum number of segments transcribed at once.
+
+        Returns:
+            An AudioTranscriptionOutputDTO with the stitched text and per-segment timings.
+        """
+        return self.config_audio_adapter.transcribe_audio_chunked(
+            audio_service,
+            audio_url,
+            segment_seconds=segment_seconds,
+            overlap_seconds=overlap_seconds,
+            silence_search_seconds=silence_search_seconds,
+            max_concurrency=max_concurrency,
+        )
 
     def handle_request(
         self,
@@ -119,22 +528,40 @@ class LLMStreamingClient:
         Returns:
             A dictionary containing the response from the LLM service.
         """
-        dto = MessageInputDTO(
+        dto = build_message_input(
+            text=text,
+            action_key=action_key,
             llm_name=llm_name,
             model_name=model_name,
-            text=text or "",
+            language=language,
             context_info=context_info,
-            language=(
-                LanguageEnum(language) if isinstance(language, str) else language
-            ),
-            action_key=(
-                ActionKeys(action_key) if isinstance(action_key, str) else action_key
-            ),
             image_object=image_object,
             session_id=session_id,
         )
         return self.server_request_adapter.handle_request(dto)
 
+    def handle_requests_batch(
+        self,
+        inputs: Iterable[MessageInputDTO],
+        max_concurrency: int = CONFIG.BATCH_MAX_CONCURRENCY,
+        ordered: bool = True,
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Handle many requests to the LLM service with bounded concurrency.
+
+        Args:
+            inputs: Iterable of MessageInputDTOs, consumed lazily.
+            max_concurrency: Maximum number of requests in flight.
+            ordered: Yield results in input order (True) or completion order (False).
+
+        Returns:
+            An iterator of (input index, response dictionary) tuples. Each response
+            has the usual ``success`` / ``response`` / ``error`` keys.
+        """
+        return self.server_request_adapter.handle_requests_batch(
+            inputs, max_concurrency=max_concurrency, ordered=ordered
+        )
+
     def send_messages_via_socket(
         self,
         text: str,
@@ -147,6 +574,7 @@ class LLMStreamingClient:
         session_id: Optional[str] = None,
         context_info: Optional[str] = None,
         on_token: Optional[Callable[[str, bool], None]] = None,
+        request_id: Optional[str] = None,
     ) -> None:
         """
         Send messages to the LLM service via Socket.IO and stream the response tokens.
@@ -162,21 +590,82 @@ class LLMStreamingClient:
             context_info: Optional context information for the request.
             on_token: Optional callback function to handle each token received. It should accept two parameters:
                         the token content (str) and a boolean indicating if the stream is finished.
+            request_id: Optional id of the stream, to stop it from another thread
+                with ``cancel_stream``.
         Returns:
             None
         """
 
-        dto = StreamingInputDTO(
-            llm_name=llm,
-            model_name=model,
+        dto = build_streaming_input(
             text=text,
+            action_key=action_key,
+            llm=llm,
+            model=model,
+            language=language,
             prompt=prompt,
+            image_object=image_object,
+            session_id=session_id,
+            context_info=context_info,
+        )
+        self.socket_adapter.send_messages(
+            dto, on_token=on_token, request_id=request_id
+        )
+
+    def stream(
+        self,
+        text: str,
+        action_key: ActionKeys = "default",
+        llm: Optional[str] = "google",
+        model: Optional[str] = "gemini-2.5-flash-lite",
+        language: Optional[LanguageEnum] = LanguageEnum.SPANISH,
+        prompt: Optional[PromptTemplate] = None,
+        image_object: Optional[Any] = None,
+        session_id: Optional[str] = None,
+        context_info: Optional[str] = None,
+        max_queue: Optional[int] = CONFIG.STREAM_QUEUE_SIZE,
+    ) -> StreamHandle:
+        """
+        Start a Socket.IO stream and return a handle to iterate its tokens.
+
+        Args:
+            text: The input text to send.
+            action_key: The action key to determine the type of request (default: "default").
+            llm: The name of the LLM to use (default: "google").
+            model: The name of the model to use (default: "gemini-2.5-flash-lite").
+            language: The language of the input text (default: LanguageEnum.SPANISH).
+            prompt: Optional prompt template to use.
+            image_object: Optional image object for the request.
+            session_id: Optional session ID for the request.
+            context_info: Optional context information for the request.
+            max_queue: Unread tokens kept for the consumer (None for no limit).
+                Falling further behind cancels the stream and raises an error.
+        Returns:
+            A StreamHandle that yields tokens with ``for`` or ``async for``, exposes the
+            joined text through ``text`` and raises stream errors as exceptions.
+        """
+        dto = build_streaming_input(
+            text=text,
+            action_key=action_key,
+            llm=llm,
+            model=model,
             language=language,
-            action_key=(
-                ActionKeys(action_key) if isinstance(action_key, str) else action_key
-            ),
+            prompt=prompt,
             image_object=image_object,
             session_id=session_id,
             context_info=context_info,
         )
-        self.socket_adapter.send_messages(dto, on_token=on_token)
+        return self.socket_adapter.stream(dto, maxsize=max_queue)
+
+    def cancel_stream(self, request_id: str) -> bool:
+        """
+        Stop an in-flight socket stream and ask the server to abort its generation.
+
+        Args:
+            request_id: The id passed to send_messages_via_socket, or the
+                ``request_id`` of a StreamHandle (``handle.cancel()`` does the same).
+        Returns:
+            False if no unfinished stream has this id.
+        """
+        if "socket_adapter" not in self.__dict__:
+            return False
+        return self.socket_adapter.cancel(request_id)
@@ -5,13 +5,107 @@ class CONFIG:
     SOCKET_NAMESPACE = API_PREFIX
 
     TIMEOUT = 30
+    # "auto" picks orjson, then msgspec, then the standard library json module.
+    JSON_BACKEND = "auto"
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 32
+    POOL_BLOCK = False
+    KEEP_ALIVE = True
     RECONNECT_ATTEMPTS = 3
+    RETRY_MAX_ATTEMPTS = 3
+    RETRY_BASE_DELAY = 0.2
+    RETRY_MAX_DELAY = 10
+    RETRY_STATUSES = (429, 502, 503, 504)
+    RETRY_REPLAY_READ_TIMEOUTS = False
+    RETRY_BUDGET_RATIO = 0.2
+    RETRY_BUDGET_MAX_TOKENS = 20
+    CIRCUIT_FAILURE_THRESHOLD = 5
+    CIRCUIT_RESET_TIMEOUT = 30
+    # Provider error codes/types that override the status based retry decision.
+    TRANSIENT_ERROR_CODES = frozenset(
+        {
+            "rate_limit_exceeded",
+            "rate_limit_error",
+            "overloaded_error",
+            "server_error",
+            "RESOURCE_EXHAUSTED",
+            "UNAVAILABLE",
+        }
+    )
+    PERMANENT_ERROR_CODES = frozenset(
+        {
+            "insufficient_quota",
+            "invalid_api_key",
+            "model_not_found",
+            "context_length_exceeded",
+        }
+    )
+    QUOTA_ERROR_CODES = frozenset({"insufficient_quota"})
+    # Codes that mean a rate limit when an error carries no HTTP status (socket errors).
+    RATE_LIMIT_ERROR_CODES = frozenset(
+        {"rate_limit_exceeded", "rate_limit_error", "RESOURCE_EXHAUSTED"}
+    )
+    BATCH_MAX_CONCURRENCY = 8
+    # "least_outstanding" or "ewma"; used when the client gets several base URLs.
+    LB_POLICY = "least_outstanding"
+    LB_PROBE_INTERVAL = 5
+    LB_FAILURE_THRESHOLD = 3
+    LB_EJECT_SECONDS = 10
+    LB_MAX_EJECT_SECONDS = 300
+    LB_SLOW_START_SECONDS = 30
+    LB_EWMA_ALPHA = 0.3
+    # Client-side limits in requests per second, keyed "llm/model" or "llm".
+    RATE_LIMITS = {}
+    RATE_LIMIT_DEFAULT_RATE = 10
+    RATE_LIMIT_BURST = 10
+    RATE_LIMIT_MIN_RATE = 0.1
+    RATE_LIMIT_DECREASE = 0.5
+    RATE_LIMIT_RECOVERY = 0.05
+    RATE_LIMIT_MAX_WAIT = 60
+    HEDGE_PERCENTILE = 0.95
+    HEDGE_INITIAL_DELAY = 5
+    HEDGE_MIN_SAMPLES = 20
+    HEDGE_LATENCY_WINDOW = 500
+    HEDGE_MAX_IN_FLIGHT = 4
+    HEDGE_MAX_WORKERS = 64
+    # Shares one call between identical concurrent handle_request calls, which
+    # also share one completion, so it is opt-in; discovery calls are idempotent.
+    COALESCE_REQUESTS = False
+    COALESCE_DISCOVERY = True
+    RESPONSE_CACHE_MAX_ENTRIES = 1024
+    RESPONSE_CACHE_TTL = 24 * 60 * 60
+    RESPONSE_CACHE_MAX_ROWS = 10000
+    SOCKET_PERSISTENT = False
+    SOCKET_MAX_CONCURRENT_STREAMS = 32
+    SOCKET_FIRST_TOKEN_TIMEOUT = 60
+    SOCKET_IDLE_TIMEOUT = 30
+    SOCKET_STREAM_TIMEOUT = 600
+    STREAM_QUEUE_SIZE = 4096
+    COALESCE_TOKENS = False
+    TOKEN_COALESCE_MAX_BYTES = 512
+    TOKEN_COALESCE_MAX_TOKENS = 32
+    TOKEN_COALESCE_INTERVAL = 0.05
+    METRICS_PREFIX = "llm_stream"
+    METRICS_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+    METRICS_TOKEN_BUCKETS = (1, 10, 50, 100, 250, 500, 1000, 2500, 5000)
     config_adapter = {
         "status": f"{API_PREFIX}/status",
         "available_models": f"{API_PREFIX}/available_models",
         "available_llms": f"{API_PREFIX}/available_llms",
         "available_prompts": f"{API_PREFIX}/available_prompts",
     }
+    # Seconds each discovery endpoint is served from the client cache.
+    DISCOVERY_CACHE_TTLS = {
+        "status": 5,
+        "available_models": 300,
+        "available_llms": 300,
+        "available_prompts": 300,
+    }
+    DISCOVERY_STALE_WHILE_REVALIDATE = 60
+    AUDIO_SEGMENT_SECONDS = 120
+    AUDIO_SEGMENT_OVERLAP_SECONDS = 2
+    AUDIO_SILENCE_SEARCH_SECONDS = 10
+    AUDIO_MAX_CONCURRENCY = 4
     config_audio_adapter = {
         "audio": f"{API_PREFIX}/audio",
     }
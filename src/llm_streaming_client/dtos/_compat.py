@@ -0,0 +1,7 @@
+import sys
+from typing import Any, Dict
+
+# Keyword arguments for @dataclass on the DTOs. Slotted instances have no
+# per-instance __dict__, which roughly halves their size; ``slots`` is only
+# accepted by dataclass() from Python 3.10, older versions keep plain classes.
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
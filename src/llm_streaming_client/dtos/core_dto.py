@@ -7,6 +7,7 @@ from typing import List, Optional
 from ..dtos.prompt_dto import PromptTemplate
 from ..enums.language_keys import LanguageEnum
 from ..enums.action_keys import ActionKeys
+from ..dtos._compat import DATACLASS_SLOTS
 
 
 class EMessageType(Enum):
@@ -15,7 +16,7 @@ class EMessageType(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class IMessage:
     id: str
     content: str
@@ -23,7 +24,7 @@ class IMessage:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class StreamingDTO:
     """
     DTO for streaming responses from LLMs.
@@ -57,7 +58,7 @@ class StreamingDTO:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MessageDTO:
     """
     DTO for messages in the request.
@@ -1,13 +1,14 @@
 # These DTOs have been extracted from the LLM_Streaming microservice to ensure consistency across projects.
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from ..dtos.core_dto import IMessage
 from ..enums.action_keys import ActionKeys
 from ..dtos.prompt_dto import PromptTemplate
 from ..enums.language_keys import LanguageEnum
+from ..dtos._compat import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class StreamingInputDTO:
     """
     DTO for inputs to streaming responses from LLMs.
@@ -24,8 +25,24 @@ class StreamingInputDTO:
     image_object: Optional[str] = None
     session_id: Optional[str] = None
 
+    def to_payload(self, request_id: str) -> Dict[str, Any]:
+        """Serializes the DTO as the ``send_message`` Socket.IO payload."""
+        payload = {
+            "request_id": request_id,
+            "text": self.text,
+            "llm_name": self.llm_name,
+            "model_name": self.model_name,
+            "action_key": self.action_key.value,
+            "language": self.language.value,
+            "session_id": self.session_id,
+            "context_info": self.context_info,
+        }
+        if self.image_object:
+            payload["image_object"] = self.image_object
+        return payload
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class MessageInputDTO:
     """
     DTO for non-streaming request inputs from clients.
@@ -40,3 +57,20 @@ class MessageInputDTO:
     context_info: Optional[str] = None
     image_object: Optional[str] = None
     session_id: Optional[str] = None
+
+    def to_payload(self) -> Dict[str, Any]:
+        """Serializes the DTO as the JSON body of the request endpoint."""
+        payload = {
+            "llm_name": self.llm_name,
+            "model_name": self.model_name,
+            "text": self.text,
+            "language": self.language.value,
+            "action_key": self.action_key.value,
+        }
+        if self.image_object:
+            payload["image"] = self.image_object
+        if self.session_id:
+            payload["session_id"] = self.session_id
+        if self.context_info:
+            payload["context_info"] = self.context_info
+        return payload
@@ -1,9 +1,10 @@
 # These DTOs have been extracted from the LLM_Streaming microservice to ensure consistency across projects.
 from dataclasses import dataclass
-from typing import Optional, List, Dict
+from typing import Any, Optional, List, Dict
+from ..dtos._compat import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ResponseOutputDTO:
     """
     DTO for HTTP responses sent to clients.
@@ -14,7 +15,7 @@ class ResponseOutputDTO:
     error_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ErrorResponseDTO:
     """
     DTO for error responses sent to clients.
@@ -23,18 +24,29 @@ class ErrorResponseDTO:
     error: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SocketOutputDTO:
     """
     DTO for responses sent over socket connections.
-    Contains the streaming response token and completion status.
+    Contains the streaming response token and completion status, plus the
+    ``request_id`` of the stream when the server echoes it.
     """
 
     content: str
     finished: bool
+    request_id: Optional[str] = None
 
+    @classmethod
+    def from_wire(cls, data: Dict[str, Any]) -> "SocketOutputDTO":
+        """Builds the event from a ``response_message`` payload, tolerating missing keys."""
+        return cls(
+            data.get("content") or "",
+            bool(data.get("finished", False)),
+            data.get("request_id"),
+        )
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class SocketErrorDTO:
     """
     DTO for error messages sent over socket connections.
@@ -43,7 +55,7 @@ class SocketErrorDTO:
     error_message: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class StatusOutputDTO:
     """
     DTO for status endpoint response.
@@ -52,7 +64,7 @@ class StatusOutputDTO:
     status: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AvailableModelsOutputDTO:
     """
     DTO for available models endpoint response.
@@ -61,7 +73,7 @@ class AvailableModelsOutputDTO:
     models: Dict[str, List[str]]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AvailableLLMsOutputDTO:
     """
     DTO for available LLMs endpoint response.
@@ -70,7 +82,7 @@ class AvailableLLMsOutputDTO:
     llms: List[str]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PromptInfoDTO:
     """
     DTO for prompt information.
@@ -80,7 +92,7 @@ class PromptInfoDTO:
     action_key: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AvailablePromptsOutputDTO:
     """
     DTO for available prompts endpoint response.
@@ -89,10 +101,25 @@ class AvailablePromptsOutputDTO:
     prompts: List[PromptInfoDTO]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
+class AudioSegmentDTO:
+    """
+    DTO for one segment of a chunked audio transcription.
+    Start and end are offsets in the audio; elapsed is the request duration, in seconds.
+    """
+
+    index: int
+    start: float
+    end: float
+    text: str
+    elapsed: float
+
+
+@dataclass(**DATACLASS_SLOTS)
 class AudioTranscriptionOutputDTO:
     """
     DTO for audio transcription endpoint response.
     """
 
     text: str
+    segments: Optional[List[AudioSegmentDTO]] = None
@@ -1,8 +1,9 @@
 # These DTOs have been extracted from the LLM_Streaming microservice to ensure consistency across projects.
 from dataclasses import dataclass
 from ..enums.language_keys import LanguageEnum
+from ..dtos._compat import DATACLASS_SLOTS
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PromptTemplate:
     """
     Data class representing a prompt template with title and content.
@@ -1,3 +1,15 @@
-from .http_client_utils import build_success_response, build_error_response
+from .http_client_utils import (
+    build_success_response,
+    build_success_payload,
+    build_error_response,
+    build_status_error_response,
+    build_error_payload,
+)
 
-__all__ = ["build_success_response", "build_error_response"]
+__all__ = [
+    "build_success_response",
+    "build_success_payload",
+    "build_error_response",
+    "build_status_error_response",
+    "build_error_payload",
+]
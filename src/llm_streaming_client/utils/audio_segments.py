@@ -0,0 +1,133 @@
+import io
+import os
+import re
+import sys
+import wave
+from array import array
+from typing import List, Optional, Tuple, Union
+
+WavSource = Union[str, "os.PathLike[str]", bytes, bytearray, memoryview]
+
+_SILENCE_FRAME_SECONDS = 0.02
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+class WavSegment:
+    """A slice of a WAV file, expressed in frames."""
+
+    def __init__(self, index: int, start_frame: int, end_frame: int, rate: int):
+        self.index = index
+        self.start_frame = start_frame
+        self.end_frame = end_frame
+        self.rate = rate
+
+    @property
+    def start(self) -> float:
+        return self.start_frame / self.rate
+
+    @property
+    def end(self) -> float:
+        return self.end_frame / self.rate
+
+
+def open_wav(source: WavSource) -> wave.Wave_read:
+    """Opens a WAV path or in-memory buffer for reading."""
+    if isinstance(source, (str, os.PathLike)):
+        return wave.open(os.fspath(source), "rb")
+    return wave.open(io.BytesIO(source), "rb")
+
+
+def plan_segments(
+    source: WavSource,
+    window_seconds: float,
+    overlap_seconds: float = 0.0,
+    silence_search_seconds: float = 0.0,
+) -> List[WavSegment]:
+    """
+    Splits a WAV file into consecutive windows.
+
+    Each cut is moved to the quietest point within the last
+    ``silence_search_seconds`` of its window (16-bit audio only), and every
+    segment is extended by ``overlap_seconds`` into the next one so words cut
+    at the boundary are heard by both requests.
+    """
+    with open_wav(source) as wav:
+        rate = wav.getframerate()
+        total = wav.getnframes()
+        window = max(1, int(window_seconds * rate))
+        overlap = int(overlap_seconds * rate)
+        search = int(silence_search_seconds * rate)
+        if wav.getsampwidth() != 2:
+            search = 0
+
+        segments: List[WavSegment] = []
+        start = 0
+        while start < total:
+            end = min(start + window, total)
+            if end < total and search:
+                end = _quietest_frame(wav, max(start + window // 2, end - search), end)
+            segments.append(
+                WavSegment(len(segments), start, min(end + overlap, total), rate)
+            )
+            start = end
+        return segments
+
+
+def read_segment(source: WavSource, segment: WavSegment) -> bytes:
+    """Returns a standalone WAV file with the frames of one segment."""
+    with open_wav(source) as wav:
+        wav.setpos(segment.start_frame)
+        frames = wav.readframes(segment.end_frame - segment.start_frame)
+        params = wav.getparams()
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as out:
+        out.setparams(params)
+        out.writeframes(frames)
+    return buffer.getvalue()
+
+
+def merge_overlap(
+    previous: str, following: str, max_words: int = 30, min_words: int = 2
+) -> str:
+    """
+    Drops from ``following`` the leading words already present at the end of
+    ``previous`` and returns the part that should be appended. Matches shorter
+    than ``min_words`` are ignored, since a single repeated word ("the", "and")
+    is usually a coincidence rather than overlapping audio.
+    """
+    tail = [m.group().lower() for m in _WORD.finditer(previous)][-max_words:]
+    head = list(_WORD.finditer(following))[:max_words]
+    head_words = [m.group().lower() for m in head]
+
+    for size in range(min(len(tail), len(head_words)), max(min_words, 1) - 1, -1):
+        if tail[-size:] == head_words[:size]:
+            return following[head[size - 1].end() :].lstrip(" ,.;:")
+    return following
+
+
+def _quietest_frame(wav: wave.Wave_read, lo: int, hi: int) -> int:
+    """
+    Returns the frame in [lo, hi) at the centre of the lowest-energy block, the
+    last one on ties so segments stay as close as possible to the full window.
+    """
+    rate = wav.getframerate()
+    channels = wav.getnchannels()
+    block = max(1, int(rate * _SILENCE_FRAME_SECONDS))
+
+    wav.setpos(lo)
+    samples = array("h")
+    samples.frombytes(wav.readframes(hi - lo))
+    if sys.byteorder == "big":
+        samples.byteswap()
+
+    best: Optional[Tuple[int, int]] = None
+    step = block * channels
+    for offset in range(0, len(samples) - step + 1, step):
+        energy = sum(abs(s) for s in samples[offset : offset + step])
+        if best is None or energy <= best[0]:
+            best = (energy, offset // channels)
+    if best is None:
+        return hi
+    return lo + best[1] + block // 2
+
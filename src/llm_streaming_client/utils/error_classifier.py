@@ -0,0 +1,210 @@
+import ast
+import re
+from dataclasses import asdict, dataclass
+from enum import Enum
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+from ..config.config import CONFIG
+from .json_codec import loads
+from .retry import parse_retry_after
+
+# 'Error code: 429 - {'error': {...}}' as relayed from the provider SDKs.
+_FORMATTED_ERROR = re.compile(r"Error code: (\d{3}) - (\{.*\})\s*\Z", re.DOTALL)
+# 'Please try again in 20s' / '... in 350ms' in rate limit messages.
+_TRY_AGAIN_IN = re.compile(r"try again in (\d+(?:\.\d+)?)\s*(ms|s)\b", re.IGNORECASE)
+
+
+class ErrorKind(Enum):
+    """Coarse category of a failed call."""
+
+    CONNECTION = "connection"
+    TIMEOUT = "timeout"
+    RATE_LIMIT = "rate_limit"
+    QUOTA = "quota"
+    AUTH = "auth"
+    NOT_FOUND = "not_found"
+    INVALID_REQUEST = "invalid_request"
+    SERVER = "server"
+    UNKNOWN = "unknown"
+
+
+@dataclass(frozen=True)
+class ErrorInfo:
+    """
+    Typed description of a failed call, built once when the error is received.
+
+    ``message`` is the text also placed in the envelope's ``error`` field,
+    ``status`` the HTTP status (the provider's own status when the service relays
+    one) and ``code`` the provider error code or type, when present.
+    """
+
+    message: str
+    kind: ErrorKind = ErrorKind.UNKNOWN
+    status: Optional[int] = None
+    code: Optional[str] = None
+    retryable: bool = False
+    retry_after: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form, with ``kind`` as its string value."""
+        return dict(asdict(self), kind=self.kind.value)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ErrorInfo":
+        """Rebuilds an ErrorInfo from ``to_dict`` output."""
+        return cls(**dict(data, kind=ErrorKind(data["kind"])))
+
+
+def classify_connection_error(
+    exception: BaseException, timeout: bool = False, retryable: bool = True
+) -> ErrorInfo:
+    """Describes a call that failed before any response was received."""
+    return ErrorInfo(
+        message="Connection error: " + str(exception),
+        kind=ErrorKind.TIMEOUT if timeout else ErrorKind.CONNECTION,
+        retryable=retryable,
+    )
+
+
+def classify_response(
+    status_code: int,
+    body: Any,
+    retry_after: Optional[str] = None,
+    retry_statuses: Iterable[int] = CONFIG.RETRY_STATUSES,
+) -> ErrorInfo:
+    """
+    Describes an HTTP error response from its status, body and ``Retry-After``.
+
+    ``body`` may be raw bytes or text, or an already decoded JSON value.
+    """
+    if isinstance(body, (bytes, bytearray, str)):
+        try:
+            decoded = loads(body)
+        except ValueError:
+            decoded = None
+    else:
+        decoded = body
+    if isinstance(decoded, dict):
+        message, status, code = _parse_error_body(decoded, status_code)
+    else:
+        if isinstance(body, (bytes, bytearray)):
+            body = body.decode("utf-8", "replace")
+        message = _format_status_error(status_code, str(body))
+        status, code = status_code, None
+    return _build(message, status, code, parse_retry_after(retry_after), retry_statuses)
+
+
+def classify_payload(
+    data: Any, retry_statuses: Iterable[int] = CONFIG.RETRY_STATUSES
+) -> ErrorInfo:
+    """Describes an error event payload, e.g. a Socket.IO ``error`` message."""
+    if isinstance(data, dict):
+        error = data.get("error") or data.get("error_message")
+    else:
+        error = data
+    if isinstance(error, str):
+        match = _FORMATTED_ERROR.search(error)
+        if match is not None:
+            message, status, code = _parse_formatted_error(match, error)
+            return _build(message, status, code, None, retry_statuses)
+    elif isinstance(error, dict):
+        message = f"Error: {error.get('message', error)}"
+        return _build(message, None, _provider_code(error), None, retry_statuses)
+    return _build(f"Error: {error}", None, None, None, retry_statuses)
+
+
+def _build(
+    message: str,
+    status: Optional[int],
+    code: Optional[str],
+    retry_after: Optional[float],
+    retry_statuses: Iterable[int],
+) -> ErrorInfo:
+    kind = _kind(status, code)
+    if code in CONFIG.PERMANENT_ERROR_CODES:
+        retryable = False
+    elif code in CONFIG.TRANSIENT_ERROR_CODES:
+        retryable = True
+    else:
+        retryable = status in retry_statuses
+    if retry_after is None and retryable:
+        retry_after = _hinted_retry_after(message)
+    return ErrorInfo(message, kind, status, code, retryable, retry_after)
+
+
+def _kind(status: Optional[int], code: Optional[str]) -> ErrorKind:
+    if code in CONFIG.QUOTA_ERROR_CODES:
+        return ErrorKind.QUOTA
+    if status is None:
+        if code in CONFIG.RATE_LIMIT_ERROR_CODES:
+            return ErrorKind.RATE_LIMIT
+        return ErrorKind.UNKNOWN
+    if status == 429:
+        return ErrorKind.RATE_LIMIT
+    if status in (401, 403):
+        return ErrorKind.AUTH
+    if status == 404:
+        return ErrorKind.NOT_FOUND
+    if status in (408, 504):
+        return ErrorKind.TIMEOUT
+    if status >= 500:
+        return ErrorKind.SERVER
+    if status >= 400:
+        return ErrorKind.INVALID_REQUEST
+    return ErrorKind.UNKNOWN
+
+
+def _hinted_retry_after(message: str) -> Optional[float]:
+    match = _TRY_AGAIN_IN.search(message)
+    if match is None:
+        return None
+    value = float(match.group(1))
+    return value / 1000 if match.group(2).lower() == "ms" else value
+
+
+def _parse_error_body(
+    body: dict, status_code: int
+) -> Tuple[str, Optional[int], Optional[str]]:
+    """Returns the message, status and provider code of an API error body."""
+    error = body.get("error")
+    if not error:
+        error = body.get("error_message", "Unknown error")
+        if isinstance(error, str):
+            match = _FORMATTED_ERROR.search(error)
+            if match is not None:
+                return _parse_formatted_error(match, error)
+    if isinstance(error, dict):
+        message = f"Code: {status_code}, Error: {error.get('message', error)}"
+        return message, status_code, _provider_code(error)
+    return f"Code: {status_code}, Error: {error}", status_code, None
+
+
+def _parse_formatted_error(
+    match: "re.Match[str]", error: str
+) -> Tuple[str, Optional[int], Optional[str]]:
+    """Parses 'Error code: X - {...}' with literal evaluation only."""
+    status = int(match.group(1))
+    try:
+        details = ast.literal_eval(match.group(2))
+        inner = details["error"]
+        message = inner["message"]
+    except (ValueError, SyntaxError, TypeError, KeyError, MemoryError, RecursionError):
+        return f"Error: {error}", status, None
+    return f"Code: {status}, Error: {message}", status, _provider_code(inner)
+
+
+def _provider_code(error: dict) -> Optional[str]:
+    """The first symbolic code of an error object (numeric codes repeat the status)."""
+    for key in ("code", "type", "status"):
+        value = error.get(key)
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+
+def _format_status_error(status_code: int, response_text: str) -> str:
+    """Format a status code and a truncated response body as an error message."""
+    truncated_text = response_text[:200]
+    if len(response_text) > 200:
+        truncated_text += "..."
+    return f"Code: {status_code}, Error: {truncated_text}"
@@ -0,0 +1,123 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional
+
+from ..config.config import CONFIG
+
+
+class LatencyTracker:
+    """Keeps a sliding window of recent latencies to derive percentiles."""
+
+    def __init__(self, window: int = CONFIG.HEDGE_LATENCY_WINDOW) -> None:
+        self._samples: "deque[float]" = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Returns the given percentile (0-1) of the window, or None when empty."""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(fraction * len(samples)))
+        return samples[index]
+
+
+class Hedger:
+    """
+    Runs a request and, if it has not answered after a delay, a duplicate of it.
+
+    The delay is fixed when ``delay`` is given, otherwise it is the observed
+    ``percentile`` latency once ``min_samples`` requests have completed (and
+    ``initial_delay`` before that). The first successful response wins and the
+    slower call is abandoned. At most ``max_in_flight`` hedges run at once, which
+    bounds the extra load sent to the backend. Calls run on a worker pool of
+    ``max_workers`` threads, which should exceed the expected request concurrency.
+    """
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        percentile: float = CONFIG.HEDGE_PERCENTILE,
+        initial_delay: float = CONFIG.HEDGE_INITIAL_DELAY,
+        min_samples: int = CONFIG.HEDGE_MIN_SAMPLES,
+        max_in_flight: int = CONFIG.HEDGE_MAX_IN_FLIGHT,
+        max_workers: int = CONFIG.HEDGE_MAX_WORKERS,
+    ) -> None:
+        self.delay = delay
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.max_in_flight = max_in_flight
+        self.latencies = LatencyTracker()
+        self.hedges_sent = 0
+        self.hedges_won = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="hedge"
+        )
+
+    def current_delay(self) -> float:
+        """Seconds to wait for the primary request before hedging it."""
+        if self.delay is not None:
+            return self.delay
+        if len(self.latencies) < self.min_samples:
+            return self.initial_delay
+        return self.latencies.percentile(self.percentile)
+
+    def run(self, fn: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Runs ``fn`` with hedging and returns the first successful envelope."""
+        primary = self._executor.submit(self._timed, fn, time.monotonic())
+        if wait([primary], timeout=self.current_delay()).done:
+            return primary.result()
+
+        hedge = self._start_hedge(fn)
+        if hedge is None:
+            return primary.result()
+
+        pending = {primary, hedge}
+        first_failure: Optional[Future] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None and future.result().get("success"):
+                    if future is hedge:
+                        with self._lock:
+                            self.hedges_won += 1
+                    return future.result()
+                first_failure = first_failure or future
+        return first_failure.result()
+
+    def close(self) -> None:
+        """Stops the worker threads once the abandoned calls finish."""
+        self._executor.shutdown(wait=False)
+
+    def _start_hedge(self, fn: Callable[[], Dict[str, Any]]) -> Optional[Future]:
+        with self._lock:
+            if self._in_flight >= self.max_in_flight:
+                return None
+            self._in_flight += 1
+            self.hedges_sent += 1
+
+        def hedged() -> Dict[str, Any]:
+            try:
+                return self._timed(fn, time.monotonic())
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+
+        return self._executor.submit(hedged)
+
+    def _timed(self, fn: Callable[[], Dict[str, Any]], started: float) -> Dict[str, Any]:
+        result = fn()
+        self.latencies.record(time.monotonic() - started)
+        return result
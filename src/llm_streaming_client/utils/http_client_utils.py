@@ -1,11 +1,35 @@
-from typing import Any, Dict
-import requests
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Type, Union
+from ..config.config import CONFIG
+from .error_classifier import (
+    ErrorInfo,
+    classify_connection_error,
+    classify_response,
+)
+from .json_codec import convert, loads
 
+if TYPE_CHECKING:
+    import requests
 
-def build_success_response(response: requests.Response) -> Dict[str, Any]:
-    """Build successful response structure."""
-    json_response = response.json()
 
+def build_success_response(
+    response: "requests.Response", response_type: Optional[Type[Any]] = None
+) -> Dict[str, Any]:
+    """
+    Build successful response structure, decoding the body once.
+
+    With ``response_type`` the unwrapped response value is converted to that DTO.
+
+    Raises:
+        ValueError: If the body is not valid JSON or does not match ``response_type``.
+    """
+    payload = build_success_payload(loads(response.content))
+    if response_type is not None:
+        payload["response"] = convert(payload["response"], response_type)
+    return payload
+
+
+def build_success_payload(json_response: Any) -> Dict[str, Any]:
+    """Build successful response structure from an already decoded body."""
     if "response" in json_response:
         json_response = json_response["response"]
     return {
@@ -16,77 +40,79 @@ def build_success_response(response: requests.Response) -> Dict[str, Any]:
 
 
 def build_error_response(
-    exception: requests.exceptions.RequestException,
+    exception: "requests.exceptions.RequestException",
+    retry_statuses: Iterable[int] = CONFIG.RETRY_STATUSES,
+    idempotent: bool = True,
 ) -> Dict[str, Any]:
-    """Build error response structure."""
-    error_message = _extract_error_message(exception)
-    return {"success": False, "response": None, "error": error_message}
-
-
-def _extract_error_message(exception: requests.exceptions.RequestException) -> str:
-    """Extract error message from request exception."""
-    if not hasattr(exception, "response") or exception.response is None:
-        return "Connection error: " + str(exception)
-
-    try:
-        response_json = exception.response.json()
-        return _parse_api_error_message(response_json, exception.response.status_code)
-    except Exception:
-        return _get_response_parsing_error_message(exception.response)
-
+    """Build error response structure, classifying the failure once."""
+    info = classify_exception(exception, retry_statuses, idempotent)
+    return build_error_payload(error_info=info)
 
-def _parse_api_error_message(response_json: Dict[str, Any], status_code: int) -> str:
-    """Parse error message from API response JSON."""
-    if "error" in response_json and response_json["error"]:
-        return _extract_from_error_field(response_json["error"], status_code)
 
-    error_data = response_json.get("error_message", "Unknown error")
-    return _extract_from_error_message_field(error_data, status_code)
-
-
-def _extract_from_error_field(error_data: Any, status_code: int) -> str:
-    """Extract error message from 'error' field."""
-    if isinstance(error_data, dict) and "message" in error_data:
-        return f"Code: {status_code}, Error: {error_data['message']}"
-    else:
-        return f"Code: {status_code}, Error: {error_data}"
+def build_status_error_response(
+    status_code: int,
+    body: Union[str, bytes],
+    retry_after: Optional[str] = None,
+    retry_statuses: Iterable[int] = CONFIG.RETRY_STATUSES,
+) -> Dict[str, Any]:
+    """Build error response structure from a raw HTTP status code and body."""
+    info = classify_response(status_code, body, retry_after, retry_statuses)
+    return build_error_payload(error_info=info)
 
 
-def _extract_from_error_message_field(error_data: Any, status_code: int) -> str:
-    """Extract error message from 'error_message' field."""
-    if _is_formatted_error_string(error_data):
-        return _parse_formatted_error_string(error_data)
-    elif isinstance(error_data, dict) and "message" in error_data:
-        return f"Code: {status_code}, Error: {error_data['message']}"
-    else:
-        return f"Code: {status_code}, Error: {error_data}"
+def build_error_payload(
+    error_message: Optional[str] = None, error_info: Optional[ErrorInfo] = None
+) -> Dict[str, Any]:
+    """
+    Build error response structure from an error message.
+
+    With ``error_info`` the envelope also carries it, as a plain dict (see
+    ``ErrorInfo.to_dict``), under ``error_info`` and its message becomes the
+    ``error`` text.
+    """
+    if error_info is None:
+        return {"success": False, "response": None, "error": error_message}
+    return {
+        "success": False,
+        "response": None,
+        "error": error_message or error_info.message,
+        "error_info": error_info.to_dict(),
+    }
 
 
-def _is_formatted_error_string(error_data: Any) -> bool:
-    """Check if error_data is a formatted error string."""
-    return (
-        isinstance(error_data, str)
-        and "Error code:" in error_data
-        and "{'error':" in error_data
+def get_error_info(result: Optional[Dict[str, Any]]) -> Optional[ErrorInfo]:
+    """The ErrorInfo of a response structure, if it carries one."""
+    data = result.get("error_info") if result else None
+    return ErrorInfo.from_dict(data) if data else None
+
+
+def classify_exception(
+    exception: "requests.exceptions.RequestException",
+    retry_statuses: Iterable[int] = CONFIG.RETRY_STATUSES,
+    idempotent: bool = True,
+) -> ErrorInfo:
+    """
+    Describes a failed requests call from its exception and response, if any.
+
+    A read timeout may come after the server has already run the request, so it
+    is only retryable when the request is ``idempotent``; connection errors and
+    connect timeouts always are.
+    """
+    from requests.exceptions import ConnectionError, ConnectTimeout, Timeout
+
+    response = getattr(exception, "response", None)
+    if response is None:
+        timeout = isinstance(exception, Timeout)
+        if timeout and not isinstance(exception, ConnectTimeout):
+            retryable = idempotent
+        else:
+            retryable = isinstance(exception, ConnectionError)
+        return classify_connection_error(
+            exception, timeout=timeout, retryable=retryable
+        )
+    return classify_response(
+        response.status_code,
+        response.content,
+        response.headers.get("Retry-After"),
+        retry_statuses,
     )
-
-
-def _parse_formatted_error_string(error_string: str) -> str:
-    """Parse formatted error string like 'Error code: X - {'error': {'message': 'Y'}}'."""
-    try:
-        code = error_string.split(" - ")[0].replace("Error code: ", "")
-        dict_part = error_string.split(" - ", 1)[1]
-        error_dict = eval(dict_part)
-        message = error_dict["error"]["message"]
-        return f"Code: {code}, Error: {message}"
-    except Exception:
-        return f"Error: {error_string}"
-
-
-def _get_response_parsing_error_message(response: requests.Response) -> str:
-    """Get error message when response JSON parsing fails."""
-    response_text = getattr(response, "text", "No response text available")
-    truncated_text = response_text[:200]
-    if len(response_text) > 200:
-        truncated_text += "..."
-    return f"Code: {response.status_code}, Error: {truncated_text}"
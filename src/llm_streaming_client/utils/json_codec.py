@@ -0,0 +1,143 @@
+import dataclasses
+import enum
+import json
+from functools import lru_cache
+from typing import Any, Callable, Dict, Type, TypeVar, Union
+from typing import get_args, get_origin, get_type_hints
+
+from ..config.config import CONFIG
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+T = TypeVar("T")
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+
+def _select_backend(name: str) -> str:
+    """Resolves ``auto`` to the fastest installed backend and checks the others."""
+    if name == "auto":
+        if orjson is not None:
+            return "orjson"
+        if msgspec is not None:
+            return "msgspec"
+        return "json"
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend {name!r}, expected one of {BACKENDS}")
+    if (name == "orjson" and orjson is None) or (name == "msgspec" and msgspec is None):
+        raise ImportError(f"The {name!r} JSON backend is not installed")
+    return name
+
+
+BACKEND = _select_backend(CONFIG.JSON_BACKEND)
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# loads(data) decodes JSON bytes or text; dumps(obj) encodes to UTF-8 bytes.
+if BACKEND == "orjson":
+    loads: Callable[[Union[bytes, str]], Any] = orjson.loads
+    dumps: Callable[[Any], bytes] = orjson.dumps
+elif BACKEND == "msgspec":
+    loads = msgspec.json.Decoder().decode
+    dumps = msgspec.json.Encoder().encode
+else:
+    loads = json.loads
+    dumps = _stdlib_dumps
+
+
+def decode_as(data: Union[bytes, str], type_: Type[T]) -> T:
+    """
+    Decodes JSON straight into ``type_`` (a DTO dataclass or a typing construct).
+
+    With msgspec installed the document is decoded and validated in one pass
+    without intermediate dicts; otherwise it is decoded with the active backend
+    and then converted.
+
+    Raises:
+        ValueError: If the data is not valid JSON or does not match ``type_``.
+    """
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(data, type=type_)
+        except msgspec.ValidationError as e:
+            raise ValueError(str(e)) from e
+    return convert(loads(data), type_)
+
+
+def convert(value: Any, type_: Type[T]) -> T:
+    """
+    Builds ``type_`` from already decoded JSON. Unknown object fields are ignored.
+
+    Raises:
+        ValueError: If ``value`` does not match ``type_``.
+    """
+    if msgspec is not None:
+        try:
+            return msgspec.convert(value, type_)
+        except msgspec.ValidationError as e:
+            raise ValueError(str(e)) from e
+    try:
+        return _convert(value, type_)
+    except (TypeError, KeyError) as e:
+        raise ValueError(f"Expected {_type_name(type_)}: {e}") from e
+
+
+def _convert(value: Any, tp: Any) -> Any:
+    if tp is Any:
+        return value
+    origin = get_origin(tp)
+    if origin is Union:
+        args = get_args(tp)
+        if value is None and type(None) in args:
+            return None
+        for arg in args:
+            if arg is type(None):
+                continue
+            try:
+                return _convert(value, arg)
+            except (TypeError, KeyError, ValueError):
+                continue
+        raise TypeError(f"{value!r} matches none of {args}")
+    if origin is list:
+        if not isinstance(value, list):
+            raise TypeError(f"expected an array, got {type(value).__name__}")
+        (item,) = get_args(tp) or (Any,)
+        return [_convert(v, item) for v in value]
+    if origin is dict:
+        if not isinstance(value, dict):
+            raise TypeError(f"expected an object, got {type(value).__name__}")
+        _, item = get_args(tp) or (str, Any)
+        return {k: _convert(v, item) for k, v in value.items()}
+    if dataclasses.is_dataclass(tp):
+        if not isinstance(value, dict):
+            raise TypeError(f"expected an object, got {type(value).__name__}")
+        hints = _field_types(tp)
+        return tp(**{k: _convert(value[k], t) for k, t in hints.items() if k in value})
+    if isinstance(tp, type) and issubclass(tp, enum.Enum):
+        return tp(value)
+    if tp is float and isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    if tp in (str, int, float, bool) and not isinstance(value, tp):
+        raise TypeError(f"expected {tp.__name__}, got {type(value).__name__}")
+    return value
+
+
+@lru_cache(maxsize=None)
+def _field_types(cls: type) -> Dict[str, Any]:
+    hints = get_type_hints(cls)
+    return {f.name: hints[f.name] for f in dataclasses.fields(cls) if f.init}
+
+
+def _type_name(tp: Any) -> str:
+    return getattr(tp, "__name__", str(tp))
@@ -0,0 +1,240 @@
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+from .json_codec import loads
+
+PathItem = Union[str, int]
+
+_WHITESPACE = frozenset(" \t\r\n")
+_NUMBER_CHARS = frozenset("-+0123456789.eE")
+_NUMBER_START = frozenset("-0123456789")
+_LITERALS = {"true": True, "false": False, "null": None}
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+# Parser states.
+_SEEK = 0
+_VALUE = 1
+_KEY = 2
+_COLON = 3
+_AFTER_VALUE = 4
+_STRING = 5
+_NUMBER = 6
+_LITERAL = 7
+_DONE = 8
+
+
+@dataclass(frozen=True)
+class JSONEvent:
+    """
+    A value of the streamed document that has just been closed.
+
+    ``path`` holds the keys and list indexes leading to it from the root, e.g.
+    ``("tables", 0, "rows", 2)`` for the third row of the first table; the root
+    itself is reported last with an empty path.
+    """
+
+    path: Tuple[PathItem, ...]
+    value: Any
+
+
+class IncrementalJSONParser:
+    """
+    Parses a JSON document as it is streamed, token by token.
+
+    Every value is reported as a JSONEvent as soon as it closes, so a field, a
+    table row or a whole object can be used before the rest of the document
+    has arrived. Text before the first ``{`` or ``[`` (e.g. a Markdown code
+    fence) and after the root value is ignored, and trailing commas are
+    tolerated. Values deeper than ``max_depth`` are parsed but not reported.
+    """
+
+    def __init__(
+        self,
+        on_event: Optional[Callable[[JSONEvent], None]] = None,
+        max_depth: Optional[int] = None,
+    ) -> None:
+        self.on_event = on_event
+        self.max_depth = max_depth
+        self.value: Any = None
+        self._containers: List[Union[dict, list]] = []
+        # Key or index of the value being parsed inside each open container.
+        self._path: List[Any] = []
+        self._state = _SEEK
+        self._token: List[str] = []
+        self._escaped = False
+        self._is_key = False
+        self._consumed = 0
+
+    @property
+    def done(self) -> bool:
+        """Whether the root value has been closed; it is then in ``value``."""
+        return self._state == _DONE
+
+    def feed(self, text: str) -> List[JSONEvent]:
+        """
+        Parses the next chunk of the document.
+
+        Returns:
+            The values closed by this chunk, innermost first.
+
+        Raises:
+            ValueError: If the chunk cannot continue a valid JSON document.
+        """
+        events: List[JSONEvent] = []
+        i, n = 0, len(text)
+        while i < n:
+            state = self._state
+            if state == _STRING:
+                i = self._read_string(text, i, events)
+                continue
+            ch = text[i]
+            if state == _NUMBER or state == _LITERAL:
+                if ch in _NUMBER_CHARS if state == _NUMBER else ch.isalpha():
+                    self._token.append(ch)
+                    i += 1
+                else:
+                    # The character after a scalar is handled in the next state.
+                    self._end_scalar(i, events)
+                continue
+            pos, i = i, i + 1
+            if ch in _WHITESPACE or state == _DONE:
+                continue
+            if state == _SEEK:
+                if ch == "{" or ch == "[":
+                    self._start_value(ch, pos, events)
+            elif state == _VALUE:
+                self._start_value(ch, pos, events)
+            elif state == _KEY:
+                if ch == '"':
+                    self._start_string(is_key=True)
+                elif ch == "}":
+                    self._close(ch, pos, events)
+                else:
+                    self._unexpected(ch, pos)
+            elif state == _COLON:
+                if ch != ":":
+                    self._unexpected(ch, pos)
+                self._state = _VALUE
+            elif ch == ",":
+                if isinstance(self._containers[-1], dict):
+                    self._state = _KEY
+                else:
+                    self._path[-1] += 1
+                    self._state = _VALUE
+            elif ch == "}" or ch == "]":
+                self._close(ch, pos, events)
+            else:
+                self._unexpected(ch, pos)
+        self._consumed += n
+        return events
+
+    def close(self) -> Any:
+        """
+        Ends the document.
+
+        Returns:
+            The parsed root value.
+
+        Raises:
+            ValueError: If the stream ended before the root value was closed.
+        """
+        if self._state != _DONE:
+            raise ValueError(
+                f"Incomplete JSON document after {self._consumed} characters"
+            )
+        return self.value
+
+    def _read_string(self, text: str, i: int, events: List[JSONEvent]) -> int:
+        if self._escaped:
+            self._token.append(text[i])
+            self._escaped = False
+            return i + 1
+        match = _STRING_SPECIAL.search(text, i)
+        if match is None:
+            self._token.append(text[i:])
+            return len(text)
+        j = match.start()
+        self._token.append(text[i:j])
+        if text[j] == "\\":
+            self._token.append("\\")
+            self._escaped = True
+            return j + 1
+        raw = '"' + "".join(self._token) + '"'
+        try:
+            value = loads(raw)
+        except ValueError:
+            self._unexpected(raw, j)
+        if self._is_key:
+            self._path[-1] = value
+            self._state = _COLON
+        else:
+            self._complete(value, events)
+        return j + 1
+
+    def _start_string(self, is_key: bool) -> None:
+        self._token = []
+        self._is_key = is_key
+        self._state = _STRING
+
+    def _start_value(self, ch: str, i: int, events: List[JSONEvent]) -> None:
+        if ch == "{" or ch == "[":
+            self._containers.append({} if ch == "{" else [])
+            self._path.append(None if ch == "{" else 0)
+            self._state = _KEY if ch == "{" else _VALUE
+        elif ch == '"':
+            self._start_string(is_key=False)
+        elif ch in _NUMBER_START:
+            self._token = [ch]
+            self._state = _NUMBER
+        elif ch.isalpha():
+            self._token = [ch]
+            self._state = _LITERAL
+        elif ch == "]" and self._containers and isinstance(self._containers[-1], list):
+            # Empty array or trailing comma.
+            self._close(ch, i, events)
+        else:
+            self._unexpected(ch, i)
+
+    def _end_scalar(self, i: int, events: List[JSONEvent]) -> None:
+        raw = "".join(self._token)
+        if self._state == _LITERAL:
+            if raw not in _LITERALS:
+                self._unexpected(raw, i)
+            value = _LITERALS[raw]
+        else:
+            try:
+                value = loads(raw)
+            except ValueError:
+                self._unexpected(raw, i)
+        self._complete(value, events)
+
+    def _close(self, ch: str, i: int, events: List[JSONEvent]) -> None:
+        container = self._containers[-1]
+        if isinstance(container, dict) != (ch == "}"):
+            self._unexpected(ch, i)
+        self._containers.pop()
+        self._path.pop()
+        self._complete(container, events)
+
+    def _complete(self, value: Any, events: List[JSONEvent]) -> None:
+        if self._containers:
+            parent = self._containers[-1]
+            if isinstance(parent, dict):
+                parent[self._path[-1]] = value
+            else:
+                parent.append(value)
+            self._state = _AFTER_VALUE
+        else:
+            self.value = value
+            self._state = _DONE
+        if self.max_depth is None or len(self._path) <= self.max_depth:
+            event = JSONEvent(tuple(self._path), value)
+            events.append(event)
+            if self.on_event is not None:
+                self.on_event(event)
+
+    def _unexpected(self, found: str, i: int) -> None:
+        raise ValueError(
+            f"Invalid JSON: unexpected {found!r} at character {self._consumed + i}"
+        )
@@ -0,0 +1,261 @@
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+from ..config.config import CONFIG
+from .error_classifier import ErrorInfo, ErrorKind
+
+LEAST_OUTSTANDING = "least_outstanding"
+EWMA = "ewma"
+
+# Failures that say something about the replica rather than about the request.
+_REPLICA_FAILURES = frozenset(
+    {ErrorKind.CONNECTION, ErrorKind.TIMEOUT, ErrorKind.SERVER}
+)
+
+
+def is_replica_failure(info: Optional[ErrorInfo]) -> bool:
+    """Whether a classified error should count against the endpoint's health."""
+    return info is not None and info.kind in _REPLICA_FAILURES
+
+
+class Endpoint:
+    """Health and load of one replica, updated under the balancer's lock."""
+
+    __slots__ = (
+        "url",
+        "outstanding",
+        "ewma",
+        "failures",
+        "ejections",
+        "ejected_until",
+        "readmitted_at",
+        "requests",
+        "errors",
+    )
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.outstanding = 0
+        self.ewma: Optional[float] = None
+        self.failures = 0
+        self.ejections = 0
+        self.ejected_until: Optional[float] = None
+        self.readmitted_at: Optional[float] = None
+        self.requests = 0
+        self.errors = 0
+
+
+class LoadBalancer:
+    """
+    Spreads calls over several replicas of the service.
+
+    Each call goes to the available endpoint with the fewest outstanding calls
+    (``least_outstanding``) or the lowest EWMA latency weighted by its
+    outstanding calls (``ewma``). After ``failure_threshold`` consecutive
+    failures, or a failed health probe, an endpoint is ejected for
+    ``eject_seconds`` (doubling on every new ejection up to
+    ``max_eject_seconds``). It is then re-admitted, once a probe succeeds when
+    probing, and its share of traffic ramps up over ``slow_start`` seconds. When
+    every endpoint is ejected the one due back first is used.
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        policy: str = CONFIG.LB_POLICY,
+        failure_threshold: int = CONFIG.LB_FAILURE_THRESHOLD,
+        eject_seconds: float = CONFIG.LB_EJECT_SECONDS,
+        max_eject_seconds: float = CONFIG.LB_MAX_EJECT_SECONDS,
+        slow_start: float = CONFIG.LB_SLOW_START_SECONDS,
+        ewma_alpha: float = CONFIG.LB_EWMA_ALPHA,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not urls:
+            raise ValueError("LoadBalancer needs at least one URL")
+        if policy not in (LEAST_OUTSTANDING, EWMA):
+            raise ValueError(f"Unknown load balancing policy {policy!r}")
+        self.endpoints = [Endpoint(url) for url in urls]
+        self.policy = policy
+        self.failure_threshold = failure_threshold
+        self.eject_seconds = eject_seconds
+        self.max_eject_seconds = max_eject_seconds
+        self.slow_start = slow_start
+        self.ewma_alpha = ewma_alpha
+        self._clock = clock
+        self._probing = False
+        self._next = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._prober: Optional[threading.Thread] = None
+
+    def acquire(self) -> Endpoint:
+        """Picks the endpoint for a new call and counts the call as outstanding."""
+        with self._lock:
+            endpoint = self._pick(self._clock())
+            endpoint.outstanding += 1
+            endpoint.requests += 1
+            return endpoint
+
+    def pick(self) -> Endpoint:
+        """Returns the endpoint ``acquire`` would choose, without counting a call."""
+        with self._lock:
+            return self._pick(self._clock())
+
+    def begin(self, endpoint: Endpoint) -> None:
+        """Counts a call sent to an endpoint chosen earlier, e.g. a socket's."""
+        with self._lock:
+            endpoint.outstanding += 1
+            endpoint.requests += 1
+
+    def release(
+        self, endpoint: Endpoint, latency: Optional[float], success: Optional[bool]
+    ) -> None:
+        """
+        Ends a call started with ``acquire`` or ``begin``.
+
+        ``latency`` feeds the endpoint's EWMA; failures count towards ejection.
+        A ``success`` of None, e.g. for a cancelled call, says nothing about
+        the endpoint's health.
+        """
+        with self._lock:
+            endpoint.outstanding -= 1
+            if success is None:
+                return
+            if latency is not None:
+                if endpoint.ewma is None:
+                    endpoint.ewma = latency
+                else:
+                    endpoint.ewma += self.ewma_alpha * (latency - endpoint.ewma)
+            if success:
+                endpoint.failures = 0
+                if endpoint.readmitted_at is None:
+                    endpoint.ejections = 0
+                return
+            endpoint.errors += 1
+            endpoint.failures += 1
+            if endpoint.failures >= self.failure_threshold:
+                self._eject(endpoint, self._clock())
+
+    def is_available(self, endpoint: Endpoint) -> bool:
+        with self._lock:
+            return self._available(endpoint, self._clock())
+
+    def start_probing(
+        self, probe: Callable[[str], bool], interval: float = CONFIG.LB_PROBE_INTERVAL
+    ) -> None:
+        """
+        Checks every endpoint with ``probe(url)`` each ``interval`` seconds on a
+        daemon thread. Failed probes eject an endpoint; while probing, an ejected
+        endpoint only comes back after a successful probe.
+        """
+        if self._prober is not None:
+            return
+        self._probing = True
+        self._stop.clear()
+        self._prober = threading.Thread(
+            target=self._probe_loop, args=(probe, interval), daemon=True
+        )
+        self._prober.start()
+
+    def stop_probing(self) -> None:
+        self._stop.set()
+        if self._prober is not None:
+            self._prober.join(timeout=1)
+        self._prober = None
+        self._probing = False
+
+    def probe_once(self, probe: Callable[[str], bool]) -> None:
+        """Runs one round of health probes."""
+        for endpoint in self.endpoints:
+            try:
+                healthy = bool(probe(endpoint.url))
+            except Exception:
+                healthy = False
+            with self._lock:
+                now = self._clock()
+                ejected_until = endpoint.ejected_until
+                if not healthy:
+                    if self._available(endpoint, now):
+                        self._eject(endpoint, now)
+                elif ejected_until is not None and now >= ejected_until:
+                    self._readmit(endpoint, now)
+
+    def snapshot(self) -> List[Dict[str, object]]:
+        """Current state of every endpoint."""
+        with self._lock:
+            now = self._clock()
+            return [
+                {
+                    "url": e.url,
+                    "available": self._available(e, now),
+                    "outstanding": e.outstanding,
+                    "ewma": e.ewma,
+                    "weight": self._weight(e, now),
+                    "requests": e.requests,
+                    "errors": e.errors,
+                    "ejections": e.ejections,
+                }
+                for e in self.endpoints
+            ]
+
+    def _probe_loop(self, probe: Callable[[str], bool], interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.probe_once(probe)
+
+    def _pick(self, now: float) -> Endpoint:
+        count = len(self.endpoints)
+        start, self._next = self._next, (self._next + 1) % count
+        known = [e.ewma for e in self.endpoints if e.ewma is not None]
+        # Endpoints without samples are scored as an average one.
+        default_ewma = sum(known) / len(known) if known else 0.0
+        best, best_score = None, float("inf")
+        # Scanning from a rotating offset spreads ties across endpoints.
+        for i in range(count):
+            endpoint = self.endpoints[(start + i) % count]
+            if not self._available(endpoint, now):
+                continue
+            score = self._score(endpoint, default_ewma) / self._weight(endpoint, now)
+            if score < best_score:
+                best, best_score = endpoint, score
+        if best is None:
+            best = min(self.endpoints, key=lambda e: e.ejected_until)
+        return best
+
+    def _score(self, endpoint: Endpoint, default_ewma: float) -> float:
+        if self.policy == EWMA:
+            ewma = default_ewma if endpoint.ewma is None else endpoint.ewma
+            # The small floor keeps the outstanding count and the slow start
+            # weight meaningful before any latency has been observed.
+            return (ewma + 1e-3) * (endpoint.outstanding + 1)
+        return endpoint.outstanding + 1
+
+    def _weight(self, endpoint: Endpoint, now: float) -> float:
+        if endpoint.readmitted_at is None or self.slow_start <= 0:
+            return 1.0
+        ramp = (now - endpoint.readmitted_at) / self.slow_start
+        if ramp >= 1:
+            endpoint.readmitted_at = None
+            return 1.0
+        return max(0.1, ramp)
+
+    def _available(self, endpoint: Endpoint, now: float) -> bool:
+        if endpoint.ejected_until is None:
+            return True
+        if self._probing or now < endpoint.ejected_until:
+            return False
+        self._readmit(endpoint, now)
+        return True
+
+    def _eject(self, endpoint: Endpoint, now: float) -> None:
+        endpoint.ejections += 1
+        seconds = self.eject_seconds * 2 ** (endpoint.ejections - 1)
+        endpoint.ejected_until = now + min(self.max_eject_seconds, seconds)
+        endpoint.failures = 0
+
+    def _readmit(self, endpoint: Endpoint, now: float) -> None:
+        # Latencies from before the ejection no longer describe the replica.
+        endpoint.ewma = None
+        endpoint.ejected_until = None
+        endpoint.readmitted_at = now
+        endpoint.failures = 0
@@ -0,0 +1,230 @@
+import threading
+import time
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from ..config.config import CONFIG
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+Labels = Tuple[str, str, str]
+LABEL_NAMES = ("llm_name", "model_name", "action_key")
+
+
+class Histogram:
+    """Fixed-bucket histogram with Prometheus ``le`` (less or equal) semantics."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns the count, sum and cumulative count of every bucket."""
+        cumulative, total = {}, 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            cumulative[bound] = total
+        return {"count": self.count, "sum": self.sum, "buckets": cumulative}
+
+
+class StreamTiming:
+    """
+    Timestamps of one stream, filled on the hot path without locking.
+
+    Inter-token gaps are kept locally and only aggregated when the stream ends.
+    """
+
+    __slots__ = (
+        "labels",
+        "started",
+        "connect",
+        "first_token",
+        "last_token",
+        "tokens",
+        "gaps",
+        "ended",
+        "error",
+        "cancelled",
+    )
+
+    def __init__(self, labels: Labels) -> None:
+        self.labels = labels
+        self.started = time.perf_counter()
+        self.connect: Optional[float] = None
+        self.first_token: Optional[float] = None
+        self.last_token = 0.0
+        self.tokens = 0
+        self.gaps: List[float] = []
+        self.ended: Optional[float] = None
+        self.error = False
+        self.cancelled = False
+
+    def token(self) -> None:
+        now = time.perf_counter()
+        if self.first_token is None:
+            self.first_token = now
+        else:
+            self.gaps.append(now - self.last_token)
+        self.last_token = now
+        self.tokens += 1
+
+    def finish(self, error: bool = False, cancelled: bool = False) -> bool:
+        """Marks the stream as ended; returns False if it already was."""
+        if self.ended is not None:
+            return False
+        self.ended = time.perf_counter()
+        self.error = error
+        self.cancelled = cancelled
+        return True
+
+
+class _SeriesMetrics:
+    def __init__(self, latency_buckets: Sequence[float], token_buckets: Sequence[float]):
+        self.streams = 0
+        self.errors = 0
+        self.cancelled = 0
+        self.connect = Histogram(latency_buckets)
+        self.ttft = Histogram(latency_buckets)
+        self.inter_token = Histogram(latency_buckets)
+        self.duration = Histogram(latency_buckets)
+        self.tokens = Histogram(token_buckets)
+
+
+class StreamMetrics:
+    """
+    Aggregates stream timings into histograms keyed by llm, model and action.
+
+    Collected histograms: ``connect`` (only for streams that opened the
+    connection), ``ttft`` (time to first token), ``inter_token``, ``duration``
+    and ``tokens`` per stream. Cancelled streams are counted apart from errors
+    and left out of ``duration`` and ``tokens``, which they would cut short.
+    """
+
+    HISTOGRAMS = ("connect", "ttft", "inter_token", "duration", "tokens")
+
+    def __init__(
+        self,
+        latency_buckets: Sequence[float] = CONFIG.METRICS_LATENCY_BUCKETS,
+        token_buckets: Sequence[float] = CONFIG.METRICS_TOKEN_BUCKETS,
+    ) -> None:
+        self.latency_buckets = latency_buckets
+        self.token_buckets = token_buckets
+        self._series: Dict[Labels, _SeriesMetrics] = {}
+        self._lock = threading.Lock()
+
+    def start(self, llm_name: str, model_name: str, action_key: str) -> StreamTiming:
+        """Returns the timing object of a stream that starts now."""
+        return StreamTiming((str(llm_name), str(model_name), str(action_key)))
+
+    def record(self, timing: StreamTiming) -> None:
+        """Adds a finished stream to the aggregates."""
+        ended = timing.ended if timing.ended is not None else time.perf_counter()
+        with self._lock:
+            series = self._series.get(timing.labels)
+            if series is None:
+                series = self._series[timing.labels] = _SeriesMetrics(
+                    self.latency_buckets, self.token_buckets
+                )
+            series.streams += 1
+            series.errors += timing.error
+            series.cancelled += timing.cancelled
+            if timing.connect is not None:
+                series.connect.observe(timing.connect)
+            if timing.first_token is not None:
+                series.ttft.observe(timing.first_token - timing.started)
+            for gap in timing.gaps:
+                series.inter_token.observe(gap)
+            if not timing.cancelled:
+                series.duration.observe(ended - timing.started)
+                series.tokens.observe(timing.tokens)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Returns one entry per label combination with its stream, error and
+        cancellation counts and a ``count`` / ``sum`` / cumulative ``buckets`` view of each histogram.
+        """
+        with self._lock:
+            result = []
+            for labels, series in self._series.items():
+                entry: Dict[str, Any] = dict(zip(LABEL_NAMES, labels))
+                entry["streams"] = series.streams
+                entry["errors"] = series.errors
+                entry["cancelled"] = series.cancelled
+                for name in self.HISTOGRAMS:
+                    entry[name] = getattr(series, name).snapshot()
+                result.append(entry)
+            return result
+
+    def to_prometheus(self, prefix: str = CONFIG.METRICS_PREFIX) -> str:
+        """Renders the aggregates in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = []
+        for name, kind in (
+            ("streams", "total"),
+            ("errors", "total"),
+            ("cancelled", "total"),
+        ):
+            metric = f"{prefix}_{name}_{kind}"
+            lines.append(f"# TYPE {metric} counter")
+            for entry in snapshot:
+                lines.append(f"{metric}{{{_labels(entry)}}} {entry[name]}")
+
+        for name in self.HISTOGRAMS:
+            metric = f"{prefix}_{name}" + ("" if name == "tokens" else "_seconds")
+            lines.append(f"# TYPE {metric} histogram")
+            for entry in snapshot:
+                labels = _labels(entry)
+                histogram = entry[name]
+                for bound, count in histogram["buckets"].items():
+                    le = "+Inf" if bound == float("inf") else repr(float(bound))
+                    lines.append(f'{metric}_bucket{{{labels},le="{le}"}} {count}')
+                lines.append(f"{metric}_sum{{{labels}}} {histogram['sum']}")
+                lines.append(f"{metric}_count{{{labels}}} {histogram['count']}")
+        return "\n".join(lines) + "\n"
+
+
+def start_prometheus_server(
+    metrics: StreamMetrics, port: int, addr: str = "0.0.0.0"
+) -> "ThreadingHTTPServer":
+    """
+    Serves ``metrics`` in the Prometheus text format from a daemon thread.
+
+    Returns the server; call ``shutdown()`` on it to stop serving.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            body = metrics.to_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer((addr, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _labels(entry: Dict[str, Any]) -> str:
+    return ",".join(f'{name}="{_escape(entry[name])}"' for name in LABEL_NAMES)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
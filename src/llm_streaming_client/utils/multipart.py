@@ -0,0 +1,132 @@
+import os
+import uuid
+from typing import BinaryIO, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+AudioSource = Union[
+    str, "os.PathLike[str]", bytes, bytearray, memoryview, BinaryIO, Iterable[bytes]
+]
+
+CHUNK_SIZE = 64 * 1024
+
+
+class MultipartStream:
+    """
+    Streaming ``multipart/form-data`` body with one file part.
+
+    The body is produced chunk by chunk while it is sent, so memory stays flat
+    regardless of the file size. When the file size is known the stream reports
+    its length and is sent with ``Content-Length``; otherwise requests falls
+    back to chunked transfer encoding.
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, str],
+        file_field: str,
+        filename: str,
+        content_type: str,
+        source: AudioSource,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self._chunks, size = iter_source(source, chunk_size)
+
+        head = b"".join(
+            self._part_header(name, None, None) + value.encode("utf-8") + b"\r\n"
+            for name, value in fields.items()
+        )
+        self._head = head + self._part_header(file_field, filename, content_type)
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("ascii")
+        self._length = (
+            None if size is None else len(self._head) + size + len(self._tail)
+        )
+
+    def _part_header(
+        self, name: str, filename: Optional[str], content_type: Optional[str]
+    ) -> bytes:
+        disposition = f'form-data; name="{_quote(name)}"'
+        if filename is not None:
+            disposition += f'; filename="{_quote(filename)}"'
+        header = f"--{self.boundary}\r\nContent-Disposition: {disposition}\r\n"
+        if content_type:
+            header += f"Content-Type: {content_type}\r\n"
+        return (header + "\r\n").encode("utf-8")
+
+    def __iter__(self) -> Iterator[Union[bytes, memoryview]]:
+        yield self._head
+        yield from self._chunks
+        yield self._tail
+
+    @property
+    def len(self) -> Optional[int]:
+        """
+        Total body size in bytes, or None when it is not known upfront.
+
+        requests reads this attribute to choose between ``Content-Length`` and
+        chunked transfer encoding.
+        """
+        return self._length
+
+
+def iter_source(
+    source: AudioSource, chunk_size: int = CHUNK_SIZE
+) -> Tuple[Iterator[Union[bytes, memoryview]], Optional[int]]:
+    """
+    Returns a lazy chunk iterator over an audio source and its size when known.
+
+    Paths are opened lazily, buffers are sliced without copying, file objects
+    are read incrementally and iterables of chunks are passed through.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return _iter_path(os.fspath(source), chunk_size), os.path.getsize(source)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source).cast("B")
+        return _iter_view(view, chunk_size), view.nbytes
+    if hasattr(source, "read"):
+        return _iter_file(source, chunk_size), _remaining_size(source)
+    return iter(source), None
+
+
+def guess_filename(source: AudioSource, default: str = "audio") -> str:
+    """Returns the name to send for a source: its path, or the file object's name."""
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    name = getattr(source, "name", None)
+    if isinstance(name, str):
+        return os.path.basename(name)
+    return default
+
+
+def _iter_path(path: str, chunk_size: int) -> Iterator[bytes]:
+    with open(path, "rb") as file:
+        yield from _iter_file(file, chunk_size)
+
+
+def _iter_view(view: memoryview, chunk_size: int) -> Iterator[memoryview]:
+    for start in range(0, view.nbytes, chunk_size):
+        yield view[start : start + chunk_size]
+
+
+def _iter_file(file: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+def _remaining_size(file: BinaryIO) -> Optional[int]:
+    try:
+        if not file.seekable():
+            return None
+        position = file.tell()
+        end = file.seek(0, os.SEEK_END)
+        file.seek(position)
+        return end - position
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _quote(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\r\n", " ")
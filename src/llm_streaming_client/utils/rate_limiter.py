@@ -0,0 +1,163 @@
+import threading
+import time
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+from ..config.config import CONFIG
+
+RateKey = Tuple[str, str]
+
+
+class TokenBucket:
+    """
+    Token bucket whose rate backs off multiplicatively when the provider
+    throttles and recovers additively on every success.
+
+    Callers reserve a token and wait for it outside the lock, so queued calls
+    are released in order at ``rate`` per second once ``burst`` is spent.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float = CONFIG.RATE_LIMIT_BURST,
+        min_rate: float = CONFIG.RATE_LIMIT_MIN_RATE,
+        decrease: float = CONFIG.RATE_LIMIT_DECREASE,
+        recovery: float = CONFIG.RATE_LIMIT_RECOVERY,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = self.max_rate = rate
+        self.burst = burst
+        self.min_rate = min(min_rate, rate)
+        self.decrease = decrease
+        self.recovery = recovery
+        self.throttles = 0
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Takes a token and returns the seconds to wait before using it, or None
+        (taking nothing) when that would exceed ``max_wait``.
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            start = max(now, self._blocked_until)
+            wait = start - now + max(0.0, 1 - self._tokens) / self.rate
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._tokens -= 1
+            return wait
+
+    def record_throttle(self, retry_after: Optional[float] = None) -> None:
+        """
+        Slows the bucket down after a rate limit response.
+
+        A burst of concurrent 429s only lowers the rate once per interval of
+        one token, and ``retry_after`` pauses every caller until it has passed.
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self.throttles += 1
+            if now - self._last_decrease >= 1 / self.rate:
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                self._last_decrease = now
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.recovery)
+
+    def _refill(self, now: float) -> None:
+        # No tokens accrue while a Retry-After pause is in force.
+        start = max(self._updated, self._blocked_until)
+        if now > start:
+            self._tokens = min(self.burst, self._tokens + (now - start) * self.rate)
+        self._updated = now
+
+
+class RateLimiter:
+    """
+    Client-side rate limits per ``(llm_name, model_name)``.
+
+    Each pair gets its own TokenBucket seeded from ``limits``, which maps
+    ``"llm/model"`` or ``"llm"`` to requests per second (``default_rate`` for the
+    rest). Calls over the limit wait locally for up to ``max_wait`` seconds
+    instead of being sent and rejected by the provider.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Mapping[str, float]] = None,
+        default_rate: float = CONFIG.RATE_LIMIT_DEFAULT_RATE,
+        burst: float = CONFIG.RATE_LIMIT_BURST,
+        max_wait: float = CONFIG.RATE_LIMIT_MAX_WAIT,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.limits = dict(CONFIG.RATE_LIMITS if limits is None else limits)
+        self.default_rate = default_rate
+        self.burst = burst
+        self.max_wait = max_wait
+        self.sleep = sleep
+        self._clock = clock
+        self._buckets: Dict[RateKey, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, key: RateKey) -> TokenBucket:
+        """Returns the bucket of an ``(llm_name, model_name)`` pair."""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    bucket = self._buckets[key] = TokenBucket(
+                        self._seed_rate(key), self.burst, clock=self._clock
+                    )
+        return bucket
+
+    def acquire(self, key: RateKey, max_wait: Optional[float] = None) -> bool:
+        """
+        Waits until a call for ``key`` may be sent.
+
+        Returns:
+            False, without waiting, if the call would have to wait longer than
+            ``max_wait`` (``self.max_wait`` by default).
+        """
+        wait = self.bucket(key).reserve(self.max_wait if max_wait is None else max_wait)
+        if wait is None:
+            return False
+        if wait > 0:
+            self.sleep(wait)
+        return True
+
+    def record_throttle(self, key: RateKey, retry_after: Optional[float] = None) -> None:
+        self.bucket(key).record_throttle(retry_after)
+
+    def record_success(self, key: RateKey) -> None:
+        self.bucket(key).record_success()
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Current rate and throttle count of every bucket, keyed ``llm/model``."""
+        with self._lock:
+            buckets = list(self._buckets.items())
+        return {
+            f"{llm}/{model}": {
+                "rate": bucket.rate,
+                "max_rate": bucket.max_rate,
+                "throttles": bucket.throttles,
+            }
+            for (llm, model), bucket in buckets
+        }
+
+    def _seed_rate(self, key: RateKey) -> float:
+        llm, model = key
+        rate = self.limits.get(f"{llm}/{model}", self.limits.get(llm))
+        return self.default_rate if rate is None else rate
@@ -0,0 +1,143 @@
+import copy
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from ..config.config import CONFIG
+from ..dtos.input import MessageInputDTO
+from ..enums.action_keys import ActionKeys
+
+
+DEFAULT_CACHEABLE_ACTIONS: FrozenSet[ActionKeys] = frozenset(
+    {ActionKeys.SUMMARIZE, ActionKeys.TOPIC_CLASSIFIER, ActionKeys.IMAGE_EXTRACTION}
+)
+
+
+def make_cache_key(dto: MessageInputDTO) -> str:
+    """Builds a stable hash of the fields that determine a request's result."""
+    fields = {
+        "llm": dto.llm_name,
+        "model": dto.model_name,
+        "text": dto.text,
+        "language": dto.language.value,
+        "action": dto.action_key.value,
+        "context_info": dto.context_info,
+        "image": dto.image_object,
+    }
+    encoded = json.dumps(fields, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    Two-tier cache for ``handle_request`` responses.
+
+    The first tier is an in-memory LRU bounded by ``max_entries`` and ``ttl``. The
+    optional second tier is a SQLite file that survives restarts and can be shared
+    by worker processes on the same host; every write purges its expired rows and
+    keeps at most ``max_rows``, dropping those closest to expiry. Only successful
+    responses of the actions listed in ``actions`` are stored, and callers always
+    get their own copy of a cached response.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = CONFIG.RESPONSE_CACHE_MAX_ENTRIES,
+        ttl: float = CONFIG.RESPONSE_CACHE_TTL,
+        sqlite_path: Optional[str] = None,
+        actions: Iterable[ActionKeys] = DEFAULT_CACHEABLE_ACTIONS,
+        max_rows: int = CONFIG.RESPONSE_CACHE_MAX_ROWS,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self.ttl = ttl
+        self.actions = frozenset(actions)
+        self._memory: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if sqlite_path:
+            self._db = sqlite3.connect(
+                sqlite_path, timeout=30, check_same_thread=False, isolation_level=None
+            )
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS response_cache_expires_at "
+                "ON response_cache (expires_at)"
+            )
+
+    def is_cacheable(self, dto: MessageInputDTO) -> bool:
+        """Whether responses for this request may be cached."""
+        return dto.action_key in self.actions
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Returns the cached response for ``key`` or None when missing or expired."""
+        now = time.time()
+        with self._lock:
+            item = self._memory.get(key)
+            if item is not None:
+                if item[0] > now:
+                    self._memory.move_to_end(key)
+                    return copy.deepcopy(item[1])
+                del self._memory[key]
+
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                "SELECT value, expires_at FROM response_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] <= now:
+                return None
+            self._remember(key, row[1], json.loads(row[0]))
+            return json.loads(row[0])
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Stores a copy of a response in every tier."""
+        now = time.time()
+        expires_at = now + self.ttl
+        with self._lock:
+            self._remember(key, expires_at, copy.deepcopy(value))
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO response_cache VALUES (?, ?, ?)",
+                    (key, json.dumps(value, default=str), expires_at),
+                )
+                self._prune(now)
+
+    def clear(self) -> None:
+        """Removes every entry from every tier."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM response_cache")
+
+    def close(self) -> None:
+        """Closes the SQLite tier, if any."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _prune(self, now: float) -> None:
+        """Deletes expired rows and the rows past ``max_rows`` closest to expiry."""
+        # Writes only follow cache misses, i.e. a full LLM call, and both
+        # deletes walk the expires_at index, so pruning on every write is cheap.
+        self._db.execute("DELETE FROM response_cache WHERE expires_at <= ?", (now,))
+        self._db.execute(
+            "DELETE FROM response_cache WHERE key IN (SELECT key FROM response_cache "
+            "ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_rows,),
+        )
+
+    def _remember(self, key: str, expires_at: float, value: Dict[str, Any]) -> None:
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
@@ -0,0 +1,157 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, FrozenSet, Iterable, Optional
+from urllib.parse import urlsplit
+
+from ..config.config import CONFIG
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of the traffic.
+
+    Every first attempt deposits ``ratio`` tokens and every retry withdraws one,
+    so during an outage retries stop once the budget is spent instead of
+    multiplying the load. The budget starts full, holding ``max_tokens``.
+    """
+
+    def __init__(
+        self,
+        ratio: float = CONFIG.RETRY_BUDGET_RATIO,
+        max_tokens: float = CONFIG.RETRY_BUDGET_MAX_TOKENS,
+    ) -> None:
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class CircuitBreaker:
+    """
+    Fails fast while an endpoint keeps failing.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and calls
+    are rejected for ``reset_timeout`` seconds; then a single probe is let
+    through and its outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = CONFIG.CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CONFIG.CIRCUIT_RESET_TIMEOUT,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self.state = self.CLOSED
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+class RetryPolicy:
+    """
+    Retry settings shared by every adapter of a client.
+
+    Failed attempts on connection errors and on ``retry_statuses`` are retried
+    up to ``max_attempts`` in total with exponential backoff and full jitter,
+    honouring ``Retry-After``. Retries draw from a shared RetryBudget and each
+    endpoint has its own CircuitBreaker. A non-idempotent request (e.g. a POST
+    running an LLM call) that timed out waiting for the response may already
+    have run on the server, so it is only replayed with ``replay_read_timeouts``.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = CONFIG.RETRY_MAX_ATTEMPTS,
+        base_delay: float = CONFIG.RETRY_BASE_DELAY,
+        max_delay: float = CONFIG.RETRY_MAX_DELAY,
+        retry_statuses: Iterable[int] = CONFIG.RETRY_STATUSES,
+        budget: Optional[RetryBudget] = None,
+        failure_threshold: int = CONFIG.CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CONFIG.CIRCUIT_RESET_TIMEOUT,
+        sleep: Callable[[float], None] = time.sleep,
+        replay_read_timeouts: bool = CONFIG.RETRY_REPLAY_READ_TIMEOUTS,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses: FrozenSet[int] = frozenset(retry_statuses)
+        self.budget = budget or RetryBudget()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.sleep = sleep
+        self.replay_read_timeouts = replay_read_timeouts
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker_for(self, url: str) -> CircuitBreaker:
+        """Returns the circuit breaker of the endpoint ``url`` belongs to."""
+        parts = urlsplit(url)
+        key = f"{parts.scheme}://{parts.netloc}{parts.path}"
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = self._breakers[key] = CircuitBreaker(
+                    self.failure_threshold, self.reset_timeout
+                )
+            return breaker
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Delay before retry number ``attempt`` (0-based)."""
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a ``Retry-After`` header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,74 @@
+import threading
+import time
+from typing import Callable, List
+
+from ..config.config import CONFIG
+
+
+class TokenCoalescer:
+    """
+    Batches streamed tokens before handing them to an ``on_token`` callback.
+
+    Tokens are joined and delivered once ``max_bytes`` (UTF-8) or ``max_tokens``
+    have accumulated, or ``flush_interval`` seconds after the first buffered token.
+    That deadline is checked on every call; a buffer left waiting by a quiet
+    stream is delivered by whoever calls ``flush_due`` periodically, e.g. the
+    SocketAdapter watchdog. A finished token is always delivered immediately
+    together with whatever is still buffered. The coalescer is itself an
+    ``on_token(content, finished)`` callable, so it can wrap any existing callback.
+    """
+
+    def __init__(
+        self,
+        on_token: Callable[[str, bool], None],
+        max_bytes: int = CONFIG.TOKEN_COALESCE_MAX_BYTES,
+        max_tokens: int = CONFIG.TOKEN_COALESCE_MAX_TOKENS,
+        flush_interval: float = CONFIG.TOKEN_COALESCE_INTERVAL,
+    ) -> None:
+        self.on_token = on_token
+        self.max_bytes = max_bytes
+        self.max_tokens = max_tokens
+        self.flush_interval = flush_interval
+        self._parts: List[str] = []
+        self._size = 0
+        self._first_at = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self, content: str, finished: bool = False) -> None:
+        with self._lock:
+            if content:
+                if not self._parts:
+                    self._first_at = time.monotonic()
+                self._parts.append(content)
+                self._size += len(content.encode("utf-8"))
+
+            if (
+                finished
+                or len(self._parts) >= self.max_tokens
+                or self._size >= self.max_bytes
+                or self._due()
+            ):
+                self._flush_locked(finished)
+
+    def flush(self) -> None:
+        """Delivers the buffered tokens, if any, as a non-final chunk."""
+        with self._lock:
+            if self._parts:
+                self._flush_locked(False)
+
+    def flush_due(self) -> None:
+        """Delivers the buffered tokens if they have waited ``flush_interval``."""
+        with self._lock:
+            if self._due():
+                self._flush_locked(False)
+
+    def _due(self) -> bool:
+        return bool(self._parts) and (
+            time.monotonic() - self._first_at >= self.flush_interval
+        )
+
+    def _flush_locked(self, finished: bool) -> None:
+        content = "".join(self._parts)
+        self._parts = []
+        self._size = 0
+        self.on_token(content, finished)
@@ -0,0 +1,82 @@
+from typing import Any, Dict, Optional
+
+
+class Span:
+    """Span interface used by the adapters; this base implementation does nothing."""
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+
+_NOOP_SPAN = Span()
+
+
+class Tracer:
+    """
+    Tracing hook called by the adapters. The default does nothing.
+
+    Subclasses return context managers yielding span objects with the Span
+    interface from ``span()`` and write the trace context to outgoing
+    carriers in ``inject()``. Adapters skip the tracing work entirely while
+    ``enabled`` is False.
+    """
+
+    enabled = False
+
+    def span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Any:
+        return _NOOP_SPAN
+
+    def inject(self, carrier: Dict[str, str]) -> None:
+        pass
+
+
+class OpenTelemetryTracer(Tracer):
+    """Tracer backed by the OpenTelemetry API (``pip install opentelemetry-api``)."""
+
+    enabled = True
+
+    def __init__(self, tracer: Any = None, name: str = "llm_streaming_client") -> None:
+        """
+        Args:
+            tracer: OpenTelemetry tracer to use; defaults to the global provider's.
+            name: Instrumentation name used when ``tracer`` is not given.
+        """
+        try:
+            from opentelemetry import propagate, trace
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetryTracer requires the 'opentelemetry-api' package"
+            ) from e
+        self._tracer = tracer or trace.get_tracer(name)
+        self._propagate = propagate
+
+    def span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Any:
+        return self._tracer.start_as_current_span(name, attributes=attributes)
+
+    def inject(self, carrier: Dict[str, str]) -> None:
+        self._propagate.inject(carrier)
+
+
+_tracer: Tracer = Tracer()
+
+
+def set_tracer(tracer: Optional[Tracer]) -> None:
+    """Installs the tracer used by every adapter; None restores the no-op one."""
+    global _tracer
+    _tracer = tracer if tracer is not None else Tracer()
+
+
+def get_tracer() -> Tracer:
+    return _tracer
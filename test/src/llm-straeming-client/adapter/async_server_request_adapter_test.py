@@ -0,0 +1,89 @@
+import asyncio
+import sys
+import os
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../.."))
+)
+
+from src.llm_streaming_client.adapter.async_server_request_adapter import (
+    AsyncServerRequestAdapter,
+)
+from src.llm_streaming_client.dtos.input import MessageInputDTO
+from src.llm_streaming_client.enums.action_keys import ActionKeys
+from src.llm_streaming_client.enums.language_keys import LanguageEnum
+from src.llm_streaming_client.utils.http_client_utils import (
+    build_status_error_response,
+)
+
+
+def test_handle_request_sends_correct_payload(monkeypatch):
+    adapter = AsyncServerRequestAdapter(base_url="http://mock-base-url")
+    dto = MessageInputDTO(
+        llm_name="openai",
+        model_name="gpt-4o-mini",
+        text="Hola mundo",
+        language=LanguageEnum.SPANISH,
+        action_key=ActionKeys.SUMMARIZE,
+        context_info="ctx",
+    )
+    called = {}
+
+    async def fake_post(url, json):
+        called["url"] = url
+        called["json"] = json
+        return {"success": True, "response": "ok", "error": None}
+
+    monkeypatch.setattr(adapter, "_post", fake_post)
+
+    result = asyncio.run(adapter.handle_request(dto))
+
+    assert result["response"] == "ok"
+    assert called["url"] == "http://mock-base-url" + adapter._config["request"]
+    assert called["json"] == {
+        "llm_name": "openai",
+        "model_name": "gpt-4o-mini",
+        "text": "Hola mundo",
+        "language": "spanish",
+        "action_key": "summarize",
+        "context_info": "ctx",
+    }
+
+
+def test_status_error_response_matches_sync_shape():
+    body = '{"error": {"message": "model not found"}}'
+
+    result = build_status_error_response(404, body)
+
+    assert result["success"] is False and result["response"] is None
+    assert result["error"] == "Code: 404, Error: model not found"
+    assert result["error_info"]["status"] == 404
+    assert result["error_info"]["retryable"] is False
+    assert build_status_error_response(502, "Bad gateway")["error"] == (
+        "Code: 502, Error: Bad gateway"
+    )
+
+
+class _FakeResponse:
+    status = 200
+    headers: dict = {}
+
+    async def read(self):
+        return b"<html>gateway</html>"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+def test_non_json_success_body_returns_an_error_envelope(monkeypatch):
+    adapter = AsyncServerRequestAdapter(base_url="http://mock-base-url")
+    session = type("FakeSession", (), {"request": lambda *a, **k: _FakeResponse()})()
+    monkeypatch.setattr(adapter, "_get_session", lambda: session)
+
+    result = asyncio.run(adapter._get("http://mock-base-url/status"))
+
+    assert result["success"] is False and result["response"] is None
+    assert result["error"].startswith("Invalid response body: ")
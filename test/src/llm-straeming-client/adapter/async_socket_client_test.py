@@ -0,0 +1,199 @@
+import asyncio
+import pytest
+import sys
+import os
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../.."))
+)
+from src.llm_streaming_client.adapter.async_socket_client import AsyncSocketAdapter
+from src.llm_streaming_client.adapter.exceptions import SocketCommunicationException
+from src.llm_streaming_client.dtos.input import StreamingInputDTO
+from src.llm_streaming_client.enums.action_keys import ActionKeys
+from src.llm_streaming_client.enums.language_keys import LanguageEnum
+from unittest.mock import AsyncMock, patch
+
+
+def _make_dto(text):
+    return StreamingInputDTO(
+        llm_name="openai",
+        model_name="gpt-4o-mini",
+        text=text,
+        prompt=None,
+        language=LanguageEnum.SPANISH,
+        action_key=ActionKeys.DEFAULT,
+    )
+
+
+def test_concurrent_streams_are_routed_by_request_id():
+    adapter = AsyncSocketAdapter(base_url="http://mock-base-url", persistent=True)
+    received = {}
+
+    async def run():
+        with patch.object(adapter, "sio") as mock_sio:
+            mock_sio.connected = False
+            mock_sio.eio.state = "disconnected"
+
+            async def fake_connect(*args, **kwargs):
+                mock_sio.connected = True
+
+            async def fake_emit(event, payload, namespace):
+                async def reply():
+                    await asyncio.sleep(0)
+                    for token in (payload["text"], "!"):
+                        await adapter._on_response_message(
+                            {"request_id": payload["request_id"], "content": token}
+                        )
+                    await adapter._on_response_message(
+                        {"request_id": payload["request_id"], "finished": True}
+                    )
+
+                asyncio.get_running_loop().create_task(reply())
+
+            mock_sio.connect = AsyncMock(side_effect=fake_connect)
+            mock_sio.emit = AsyncMock(side_effect=fake_emit)
+
+            async def collect(text, content, finished):
+                received.setdefault(text, []).append(content)
+
+            await asyncio.gather(
+                *(
+                    adapter.send_messages(
+                        _make_dto(text),
+                        on_token=lambda c, f, t=text: collect(t, c, f),
+                    )
+                    for text in ("uno", "dos", "tres")
+                )
+            )
+            mock_sio.connect.assert_awaited_once()
+
+    asyncio.run(run())
+
+    assert received == {
+        "uno": ["uno", "!", ""],
+        "dos": ["dos", "!", ""],
+        "tres": ["tres", "!", ""],
+    }
+
+
+def _fake_server(mock_sio, reply_to):
+    """Socket.IO stand-in whose disconnect takes a while, like the real one."""
+    mock_sio.connected = False
+    mock_sio.eio.state = "disconnected"
+    emitted = []
+
+    async def fake_connect(*args, **kwargs):
+        if mock_sio.eio.state != "disconnected":
+            raise ValueError("Client is not in a disconnected state")
+        mock_sio.connected = True
+        mock_sio.eio.state = "connected"
+
+    async def fake_disconnect():
+        mock_sio.eio.state = "disconnecting"
+        await asyncio.sleep(0.02)
+        mock_sio.connected = False
+        mock_sio.eio.state = "disconnected"
+
+    async def fake_emit(event, payload, namespace):
+        if not mock_sio.connected or mock_sio.eio.state != "connected":
+            raise ValueError("Emit on a closing connection")
+        emitted.append((event, payload))
+        if event == "send_message":
+            asyncio.get_running_loop().create_task(reply_to(payload))
+
+    mock_sio.connect = AsyncMock(side_effect=fake_connect)
+    mock_sio.disconnect = AsyncMock(side_effect=fake_disconnect)
+    mock_sio.shutdown = AsyncMock()
+    mock_sio.emit = AsyncMock(side_effect=fake_emit)
+    return emitted
+
+
+def test_stream_started_while_closing_waits_and_reconnects():
+    adapter = AsyncSocketAdapter(base_url="http://mock-base-url", persistent=False)
+    received = []
+
+    async def reply(adapter, payload):
+        await asyncio.sleep(0)
+        await adapter._on_response_message(
+            {"request_id": payload["request_id"], "content": payload["text"]}
+        )
+        await adapter._on_response_message(
+            {"request_id": payload["request_id"], "finished": True}
+        )
+
+    async def run():
+        with patch.object(adapter, "sio") as mock_sio:
+            _fake_server(mock_sio, lambda payload: reply(adapter, payload))
+
+            async def on_token(content, finished):
+                received.append(content)
+
+            first = asyncio.get_running_loop().create_task(
+                adapter.send_messages(_make_dto("uno"), on_token=on_token)
+            )
+            # Start the second stream while the first one disconnects.
+            while mock_sio.eio.state != "disconnecting":
+                await asyncio.sleep(0)
+            await adapter.send_messages(_make_dto("dos"), on_token=on_token)
+            await first
+            assert mock_sio.connect.await_count == 2
+            assert mock_sio.eio.state == "disconnected"
+
+    asyncio.run(run())
+
+    assert received == ["uno", "", "dos", ""]
+
+
+def test_events_for_unknown_request_ids_are_dropped():
+    adapter = AsyncSocketAdapter(base_url="http://mock-base-url", persistent=True)
+    received = []
+
+    async def reply(adapter, payload):
+        await asyncio.sleep(0)
+        await adapter._on_response_message(
+            {"request_id": "ended-stream", "content": "stale"}
+        )
+        await adapter._on_error({"request_id": "ended-stream", "error": "late"})
+        await adapter._on_response_message(
+            {"request_id": payload["request_id"], "content": "fresh"}
+        )
+        await adapter._on_response_message(
+            {"request_id": payload["request_id"], "finished": True}
+        )
+
+    async def run():
+        with patch.object(adapter, "sio") as mock_sio:
+            _fake_server(mock_sio, lambda payload: reply(adapter, payload))
+
+            async def on_token(content, finished):
+                received.append(content)
+
+            await adapter.send_messages(_make_dto("uno"), on_token=on_token)
+
+    asyncio.run(run())
+
+    assert received == ["fresh", ""]
+
+
+def test_stream_without_an_end_times_out_and_is_cancelled():
+    adapter = AsyncSocketAdapter(
+        base_url="http://mock-base-url", persistent=True, stream_timeout=0.05
+    )
+
+    async def never_reply(payload):
+        pass
+
+    async def run():
+        with patch.object(adapter, "sio") as mock_sio:
+            emitted = _fake_server(mock_sio, never_reply)
+            with pytest.raises(SocketCommunicationException):
+                await adapter.send_messages(
+                    _make_dto("uno"), on_token=lambda c, f: None
+                )
+            return emitted
+
+    emitted = asyncio.run(run())
+
+    assert [event for event, _ in emitted] == ["send_message", "cancel_message"]
+    assert emitted[1][1] == {"request_id": emitted[0][1]["request_id"]}
+    assert adapter._streams == {}
@@ -29,3 +29,49 @@ def test_config_adapter_methods(monkeypatch, method_name, config_key, mock_respo
     assert result == mock_response
     expected_url = "http://mock-base-url" + adapter._config[config_key]
     assert called["url"] == expected_url
+
+
+class _FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def test_cached_get_serves_fresh_entries_and_revalidates_with_etag(monkeypatch):
+    adapter = ConfigAdapter(
+        base_url="http://mock-base-url", cache_ttls={"available_llms": 60}
+    )
+    calls = []
+    envelope = {"success": True, "response": {"llms": ["openai"]}, "error": None}
+
+    def fake_send(method, url, headers=None):
+        calls.append(headers)
+        if headers:
+            return None, _FakeResponse(304)
+        return envelope, _FakeResponse(200, {"ETag": '"v1"'})
+
+    monkeypatch.setattr(adapter, "_send", fake_send)
+
+    assert adapter.get_available_llms() == envelope
+    assert adapter.get_available_llms() == envelope
+    assert calls == [None]
+
+    adapter._cache["available_llms"].expires_at = 0
+    assert adapter.get_available_llms() == envelope
+    assert calls == [None, {"If-None-Match": '"v1"'}]
+
+
+def test_cached_results_cannot_be_changed_by_callers(monkeypatch):
+    adapter = ConfigAdapter(
+        base_url="http://mock-base-url", cache_ttls={"available_llms": 60}
+    )
+
+    def fake_send(method, url, headers=None):
+        envelope = {"success": True, "response": {"llms": ["openai"]}, "error": None}
+        return envelope, _FakeResponse(200)
+
+    monkeypatch.setattr(adapter, "_send", fake_send)
+
+    adapter.get_available_llms()["response"]["llms"].append("mutated")
+
+    assert adapter.get_available_llms()["response"] == {"llms": ["openai"]}
@@ -1,34 +1,101 @@
 import pytest
 
+import io
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../..")))
 from src.llm_streaming_client.adapter.config_audio_adapter import ConfigAudioAdapter
-from unittest.mock import mock_open, patch
 
 
-def test_transcribe_audio_calls_post(monkeypatch):
-    adapter = ConfigAudioAdapter(base_url="http://mock-base-url")
-    audio_service = "whisper"
-    audio_url = "fake_audio.wav"
-    expected_url = "http://mock-base-url" + adapter._config["audio"]
-    mock_response = {"transcription": "Hello world"}
-
+def _capture_post(adapter, monkeypatch, mock_response):
     called = {}
 
-    def fake_post(url, files=None, data=None):
+    def fake_post(url, data=None, headers=None):
         called["url"] = url
-        called["files"] = files
-        called["data"] = data
+        called["length"] = data.len
+        called["body"] = b"".join(bytes(chunk) for chunk in data)
+        called["headers"] = headers
         return mock_response
 
     monkeypatch.setattr(adapter, "_post", fake_post)
+    return called
 
-    with patch("builtins.open", mock_open(read_data=b"fake-bytes")) as mock_file:
-        result = adapter.transcribe_audio(audio_service, audio_url)
+
+def test_transcribe_audio_calls_post(monkeypatch, tmp_path):
+    adapter = ConfigAudioAdapter(base_url="http://mock-base-url")
+    audio_service = "whisper"
+    audio_url = str(tmp_path / "fake_audio.wav")
+    with open(audio_url, "wb") as audio_file:
+        audio_file.write(b"fake-bytes")
+    expected_url = "http://mock-base-url" + adapter._config["audio"]
+    mock_response = {"transcription": "Hello world"}
+
+    called = _capture_post(adapter, monkeypatch, mock_response)
+
+    result = adapter.transcribe_audio(audio_service, audio_url)
 
     assert result == mock_response
     assert called["url"] == expected_url
-    assert "audio" in called["files"]
-    assert called["files"]["audio"][0] == audio_url
-    assert called["data"] == {"audio_service": audio_service}
+    body = called["body"]
+    assert called["length"] == len(body)
+    assert called["headers"]["Content-Type"].startswith("multipart/form-data; boundary=")
+    assert b'name="audio_service"\r\n\r\nwhisper\r\n' in body
+    assert f'name="audio"; filename="{audio_url}"'.encode() in body
+    assert b"Content-Type: audio/" in body
+    assert b"\r\n\r\nfake-bytes\r\n--" in body
+
+
+@pytest.mark.parametrize(
+    "source, expected_length_known",
+    [
+        (b"fake-bytes", True),
+        (memoryview(b"fake-bytes"), True),
+        (io.BytesIO(b"fake-bytes"), True),
+        (iter([b"fake-", b"bytes"]), False),
+    ],
+)
+def test_transcribe_audio_streams_in_memory_sources(
+    monkeypatch, source, expected_length_known
+):
+    adapter = ConfigAudioAdapter(base_url="http://mock-base-url")
+    called = _capture_post(adapter, monkeypatch, {"text": "ok"})
+
+    adapter.transcribe_audio("whisper", source, filename="clip.mp3")
+
+    assert b'filename="clip.mp3"\r\nContent-Type: audio/mpeg\r\n\r\nfake-bytes' in called["body"]
+    assert (called["length"] is not None) == expected_length_known
+
+
+def test_transcribe_audio_chunked_stitches_segments_in_order(monkeypatch):
+    import wave
+    import time
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(1000)
+        wav.writeframes(b"\x00\x00" * 3000)
+
+    adapter = ConfigAudioAdapter(base_url="http://mock-base-url")
+    texts = {
+        "segment_0.wav": "uno dos tres",
+        "segment_1.wav": "dos tres cuatro",
+        "segment_2.wav": "cinco",
+    }
+
+    def fake_transcribe(audio_service, audio, filename=None):
+        time.sleep(0.01 * (3 - int(filename[8])))
+        return {"success": True, "response": {"text": texts[filename]}, "error": None}
+
+    monkeypatch.setattr(adapter, "transcribe_audio", fake_transcribe)
+
+    result = adapter.transcribe_audio_chunked(
+        "whisper", buffer.getvalue(), segment_seconds=1, overlap_seconds=0.2,
+        silence_search_seconds=0, max_concurrency=3,
+    )
+
+    assert result.text == "uno dos tres cuatro cinco"
+    assert [(s.index, s.start, s.end) for s in result.segments] == [
+        (0, 0.0, 1.2), (1, 1.0, 2.2), (2, 2.0, 3.0)
+    ]
@@ -0,0 +1,235 @@
+import sys
+import os
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../.."))
+)
+from src.llm_streaming_client.adapter.http_client import create_session
+from src.llm_streaming_client.client import LLMStreamingClient
+
+
+def test_create_session_configures_pool():
+    session = create_session(pool_connections=4, pool_maxsize=64, pool_block=True)
+
+    adapter = session.get_adapter("https://mock-base-url")
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 64
+    assert adapter._pool_block is True
+    assert session.headers["Connection"] == "keep-alive"
+    assert create_session(keep_alive=False).headers["Connection"] == "close"
+
+
+def test_client_adapters_share_one_session():
+    client = LLMStreamingClient("http://mock-base-url", pool_maxsize=50)
+
+    sessions = {
+        id(client.config_adapter.session),
+        id(client.config_audio_adapter.session),
+        id(client.server_request_adapter.session),
+    }
+    assert sessions == {id(client.session)}
+    assert client.session.get_adapter("http://x")._pool_maxsize == 50
+
+
+def _response(status, body=b'{"response": "ok"}', headers=None):
+    import requests
+
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers.update(headers or {})
+    response.url = "http://mock-base-url/api"
+    return response
+
+
+class _ScriptedSession:
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def request(self, method, url, timeout=None, **kwargs):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def _client(session, **policy):
+    from src.llm_streaming_client.adapter.http_client import HttpClient
+    from src.llm_streaming_client.utils.retry import RetryPolicy
+
+    delays = []
+    client = HttpClient(
+        session=session, retry_policy=RetryPolicy(sleep=delays.append, **policy)
+    )
+    return client, delays
+
+
+def test_transient_failures_are_retried_honouring_retry_after():
+    import requests
+
+    session = _ScriptedSession(
+        requests.exceptions.ConnectionError("reset"),
+        _response(429, b"{}", {"Retry-After": "2"}),
+        _response(200),
+    )
+    client, delays = _client(session)
+
+    result = client._get("http://mock-base-url/api")
+
+    assert result == {"success": True, "response": "ok", "error": None}
+    assert session.calls == 3
+    assert delays[1] == 2.0
+    assert 0 <= delays[0] <= 0.2
+
+
+def test_client_errors_and_streamed_bodies_are_not_retried():
+    session = _ScriptedSession(_response(400, b'{"error": "bad"}'), _response(503))
+    client, delays = _client(session)
+
+    assert client._get("http://mock-base-url/api")["error"] == "Code: 400, Error: bad"
+    assert client._post("http://mock-base-url/api", data=iter([b"x"]))["success"] is False
+    assert session.calls == 2
+    assert delays == []
+
+
+def test_posts_are_not_replayed_after_a_read_timeout():
+    import requests
+
+    timeouts = requests.exceptions.ReadTimeout, requests.exceptions.ConnectTimeout
+    session = _ScriptedSession(
+        timeouts[0]("read"),
+        timeouts[1]("connect"),
+        _response(200),
+        timeouts[0]("read"),
+        _response(200),
+    )
+    client, _ = _client(session)
+    url = "http://mock-base-url/api"
+
+    timed_out = client._post(url, json={"text": "hola"})
+    assert timed_out["error_info"]["kind"] == "timeout"
+    assert session.calls == 1
+    assert client._post(url, json={"text": "hola"})["success"] is True
+    assert session.calls == 3
+    assert client._get(url)["success"] is True
+    assert session.calls == 5
+
+
+def test_replaying_posts_after_a_read_timeout_is_opt_in():
+    import requests
+
+    session = _ScriptedSession(requests.exceptions.ReadTimeout("read"), _response(200))
+    client, _ = _client(session, replay_read_timeouts=True)
+
+    assert client._post("http://mock-base-url/api", json={"text": "hola"})["success"]
+    assert session.calls == 2
+
+
+def test_circuit_opens_after_repeated_failures():
+    session = _ScriptedSession(*[_response(503, b"{}") for _ in range(4)])
+    client, _ = _client(session, max_attempts=2, failure_threshold=4)
+
+    client._get("http://mock-base-url/api")
+    client._get("http://mock-base-url/api")
+    result = client._get("http://mock-base-url/api")
+
+    assert session.calls == 4
+    assert result["error"] == "Circuit open for http://mock-base-url/api"
+
+
+def test_responses_decode_into_dtos_and_invalid_bodies_become_errors():
+    from src.llm_streaming_client.dtos.output import AvailableLLMsOutputDTO
+
+    session = _ScriptedSession(
+        _response(200, b'{"response": {"llms": ["openai"]}}'),
+        _response(200, b'{"llms": ["google"]}'),
+        _response(200, b"<html>"),
+    )
+    client, _ = _client(session)
+    url = "http://mock-base-url/api"
+
+    wrapped = client._get(url, response_type=AvailableLLMsOutputDTO)
+    bare = client._get(url, response_type=AvailableLLMsOutputDTO)
+    invalid = client._get(url)
+
+    assert wrapped["response"] == AvailableLLMsOutputDTO(llms=["openai"])
+    assert bare["response"] == AvailableLLMsOutputDTO(llms=["google"])
+    assert invalid["success"] is False
+    assert invalid["error"].startswith("Invalid response body")
+
+
+def test_json_bodies_are_encoded_with_the_active_backend():
+    from src.llm_streaming_client.utils import json_codec
+
+    class _RecordingSession(_ScriptedSession):
+        def request(self, method, url, timeout=None, **kwargs):
+            self.kwargs = kwargs
+            return super().request(method, url, timeout=timeout, **kwargs)
+
+    session = _RecordingSession(_response(200))
+    client, _ = _client(session)
+
+    client._post("http://mock-base-url/api", json={"text": "¿Qué tal?"})
+
+    if json_codec.BACKEND == "json":
+        assert session.kwargs["json"] == {"text": "¿Qué tal?"}
+    else:
+        assert json_codec.loads(session.kwargs["data"]) == {"text": "¿Qué tal?"}
+        assert session.kwargs["headers"]["Content-Type"] == "application/json"
+
+
+def test_quota_errors_are_not_retried_and_carry_their_classification():
+    body = b'{"error": {"message": "No credit", "code": "insufficient_quota"}}'
+    session = _ScriptedSession(_response(429, body))
+    client, delays = _client(session)
+
+    result = client._get("http://mock-base-url/api")
+
+    assert result["error"] == "Code: 429, Error: No credit"
+    assert result["error_info"]["code"] == "insufficient_quota"
+    assert session.calls == 1
+    assert delays == []
+
+
+def test_rate_limited_responses_slow_down_the_client_limiter():
+    from src.llm_streaming_client.utils.rate_limiter import RateLimiter
+
+    session = _ScriptedSession(
+        _response(429, b"{}", {"Retry-After": "1"}), _response(200)
+    )
+    client, delays = _client(session)
+    client.rate_limiter = limiter = RateLimiter(default_rate=8, sleep=delays.append)
+
+    result = client._post(
+        "http://mock-base-url/api", json={}, rate_key=("openai", "gpt-4o-mini")
+    )
+
+    bucket = limiter.bucket(("openai", "gpt-4o-mini"))
+    assert result["success"] is True
+    assert bucket.throttles == 1
+    assert 4 <= bucket.rate < 8
+    assert delays[0] == 1.0 and delays[1] > 0.9
+
+
+def test_relative_urls_are_balanced_and_retried_on_another_replica():
+    import requests
+    from src.llm_streaming_client.utils.load_balancer import LoadBalancer
+
+    class _RecordingSession(_ScriptedSession):
+        def request(self, method, url, timeout=None, **kwargs):
+            urls.append(url)
+            if url.startswith("http://down"):
+                raise requests.exceptions.ConnectionError("refused")
+            return _response(200)
+
+    urls = []
+    client, _ = _client(_RecordingSession())
+    client.load_balancer = LoadBalancer(["http://down", "http://up"])
+
+    results = [client._get("/api/status") for _ in range(2)]
+
+    assert all(result["success"] for result in results)
+    assert urls == ["http://down/api/status", "http://up/api/status"] * 2
+    assert client.load_balancer.snapshot()[0]["errors"] == 2
@@ -47,3 +47,75 @@ def test_handle_request_sends_correct_payload(monkeypatch):
     assert result == mock_response
     assert called["url"] == expected_url
     assert called["json"] == expected_payload
+
+
+def _make_dto(text):
+    return MessageInputDTO(
+        llm_name="openai",
+        model_name="gpt-4o-mini",
+        text=text,
+        language=LanguageEnum.SPANISH,
+        action_key=ActionKeys.SUMMARIZE,
+    )
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_handle_requests_batch_bounds_concurrency(monkeypatch, ordered):
+    import threading
+    import time
+
+    adapter = ServerRequestAdapter(base_url="http://mock-base-url")
+    lock = threading.Lock()
+    state = {"in_flight": 0, "peak": 0}
+
+    def fake_post(url, json):
+        with lock:
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+        time.sleep(0.01 * (5 - int(json["text"]) % 5))
+        with lock:
+            state["in_flight"] -= 1
+        if json["text"] == "3":
+            raise RuntimeError("boom")
+        return {"success": True, "response": json["text"], "error": None}
+
+    monkeypatch.setattr(adapter, "_post", fake_post)
+
+    results = list(
+        adapter.handle_requests_batch(
+            (_make_dto(str(i)) for i in range(10)), max_concurrency=3, ordered=ordered
+        )
+    )
+
+    assert state["peak"] <= 3
+    assert sorted(index for index, _ in results) == list(range(10))
+    if ordered:
+        assert [index for index, _ in results] == list(range(10))
+    envelopes = dict(results)
+    assert envelopes[0]["response"] == "0"
+    assert envelopes[3] == {
+        "success": False,
+        "response": None,
+        "error": "Failed to handle request to LLM service",
+    }
+
+
+def test_handle_request_reuses_cached_response(monkeypatch):
+    from src.llm_streaming_client.utils.response_cache import ResponseCache
+
+    adapter = ServerRequestAdapter(
+        base_url="http://mock-base-url", response_cache=ResponseCache()
+    )
+    calls = []
+
+    def fake_post(url, json):
+        calls.append(json["text"])
+        return {"success": True, "response": "resumen", "error": None}
+
+    monkeypatch.setattr(adapter, "_post", fake_post)
+
+    first = adapter.handle_request(_make_dto("doc"))
+    second = adapter.handle_request(_make_dto("doc"))
+
+    assert first == second == {"success": True, "response": "resumen", "error": None}
+    assert calls == ["doc"]
@@ -1,11 +1,14 @@
 import pytest
 import sys
 import os
+import threading
+import time
 
 sys.path.insert(
     0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../.."))
 )
 from src.llm_streaming_client.adapter.socket_client import SocketAdapter
+from src.llm_streaming_client.utils.load_balancer import LoadBalancer
 from src.llm_streaming_client.dtos.input import StreamingInputDTO
 from src.llm_streaming_client.dtos.core_dto import IMessage, EMessageType
 from src.llm_streaming_client.enums.action_keys import ActionKeys
@@ -13,50 +16,476 @@ from src.llm_streaming_client.enums.language_keys import LanguageEnum
 from unittest.mock import MagicMock, patch
 
 
-def test_send_messages_emits_correct_payload():
-    adapter = SocketAdapter(base_url="http://mock-base-url")
-
-    dto = StreamingInputDTO(
+def _make_dto(text="Hola"):
+    return StreamingInputDTO(
         llm_name="openai",
         model_name="gpt-4o-mini",
-        messages=[
-            IMessage(
-                id="1",
-                content="Hola",
-                type=EMessageType.USER,
-                timestamp="2024-01-01T12:00:00Z",
-            )
-        ],
+        text=text,
         prompt=None,
         language=LanguageEnum.SPANISH,
         action_key=ActionKeys.DEFAULT,
         image_object=None,
     )
 
+
+def test_send_messages_emits_correct_payload():
+    adapter = SocketAdapter(base_url="http://mock-base-url")
+    tokens = []
+
     with patch.object(adapter, "sio") as mock_sio:
-        mock_sio.connected = True
-        adapter.send_messages(dto)
+        mock_sio.connected = False
 
-        expected_payload = {
-            "messages": [
-                {
-                    "id": "1",
-                    "content": "Hola",
-                    "type": "user",
-                    "timestamp": "2024-01-01T12:00:00Z",
-                }
-            ],
+        def fake_emit(event, payload, namespace):
+            adapter._on_response_message(
+                {"request_id": payload["request_id"], "content": "Hi", "finished": True}
+            )
+
+        mock_sio.emit.side_effect = fake_emit
+        adapter.send_messages(_make_dto(), on_token=lambda c, f: tokens.append((c, f)))
+
+        payload = mock_sio.emit.call_args[0][1]
+        assert payload["request_id"]
+        assert {k: v for k, v in payload.items() if k != "request_id"} == {
+            "text": "Hola",
             "llm_name": "openai",
             "model_name": "gpt-4o-mini",
             "action_key": "default",
             "language": "spanish",
+            "session_id": None,
+            "context_info": None,
         }
-
         mock_sio.connect.assert_called_once_with(
             "http://mock-base-url", namespaces=[adapter.namespace]
         )
-        mock_sio.emit.assert_called_once_with(
-            "send_message", expected_payload, namespace=adapter.namespace
+        assert tokens == [("Hi", True)]
+
+
+def test_persistent_mode_reuses_connection_and_routes_by_request_id():
+    adapter = SocketAdapter(base_url="http://mock-base-url", persistent=True)
+    received = {}
+
+    with patch.object(adapter, "sio") as mock_sio:
+        mock_sio.connected = False
+
+        def fake_connect(*args, **kwargs):
+            mock_sio.connected = True
+
+        def fake_emit(event, payload, namespace):
+            adapter._on_response_message(
+                {
+                    "request_id": payload["request_id"],
+                    "content": payload["text"],
+                    "finished": True,
+                }
+            )
+
+        mock_sio.connect.side_effect = fake_connect
+        mock_sio.emit.side_effect = fake_emit
+
+        for text in ("uno", "dos"):
+            adapter.send_messages(
+                _make_dto(text),
+                on_token=lambda c, f, t=text: received.setdefault(t, []).append(c),
+            )
+
+        mock_sio.connect.assert_called_once()
+        mock_sio.disconnect.assert_not_called()
+        assert received == {"uno": ["uno"], "dos": ["dos"]}
+
+
+def test_stream_returns_iterable_handle_and_disconnects_when_finished():
+    adapter = SocketAdapter(base_url="http://mock-base-url")
+
+    with patch.object(adapter, "sio") as mock_sio:
+        mock_sio.connected = False
+
+        def fake_connect(*args, **kwargs):
+            mock_sio.connected = True
+
+        def fake_emit(event, payload, namespace):
+            for token in ("Ho", "la"):
+                adapter._on_response_message(
+                    {"request_id": payload["request_id"], "content": token}
+                )
+            adapter._on_response_message(
+                {"request_id": payload["request_id"], "finished": True}
+            )
+
+        mock_sio.connect.side_effect = fake_connect
+        mock_sio.emit.side_effect = fake_emit
+
+        handle = adapter.stream(_make_dto())
+
+        assert list(handle) == ["Ho", "la"]
+        assert handle.text == "Hola"
+        mock_sio.disconnect.assert_called_once()
+
+
+def test_coalesced_tokens_are_flushed_before_an_error():
+    adapter = SocketAdapter(base_url="http://mock-base-url", coalesce_tokens=True)
+    tokens = []
+
+    with patch.object(adapter, "sio") as mock_sio:
+        mock_sio.connected = False
+
+        def fake_emit(event, payload, namespace):
+            for token in ("Ho", "la"):
+                adapter._on_response_message(
+                    {"request_id": payload["request_id"], "content": token}
+                )
+            adapter._on_error({"request_id": payload["request_id"], "message": "x"})
+
+        mock_sio.emit.side_effect = fake_emit
+        adapter.send_messages(_make_dto(), on_token=lambda c, f: tokens.append((c, f)))
+
+    assert tokens[0] == ("Hola", False)
+    assert tokens[1][0].startswith("[ERROR]") and tokens[1][1] is True
+    assert len(tokens) == 2
+
+
+def test_watchdog_flushes_coalesced_tokens_of_a_quiet_stream():
+    adapter = SocketAdapter(
+        base_url="http://mock-base-url", persistent=True, coalesce_tokens=True
+    )
+    tokens = []
+
+    with patch.object(adapter, "sio") as mock_sio, patch(
+        "threading.Timer", side_effect=AssertionError("no timer per batch")
+    ):
+        mock_sio.connected = True
+
+        def fake_emit(event, payload, namespace):
+            def reply():
+                data = {"request_id": payload["request_id"], "content": "Ho"}
+                adapter._on_response_message(data)
+                time.sleep(0.3)
+                adapter._on_response_message(
+                    {"request_id": payload["request_id"], "finished": True}
+                )
+
+            threading.Thread(target=reply).start()
+
+        mock_sio.emit.side_effect = fake_emit
+        started = time.monotonic()
+        adapter.send_messages(
+            _make_dto(),
+            on_token=lambda c, f: tokens.append((c, f, time.monotonic() - started)),
         )
-        mock_sio.wait.assert_called_once()
-        mock_sio.disconnect.assert_called()
+
+    assert [(c, f) for c, f, _ in tokens] == [("Ho", False), ("", True)]
+    # Delivered while the stream was still quiet, not with the final token.
+    assert tokens[0][2] < 0.25
+
+
+def test_stream_timings_are_recorded():
+    adapter = SocketAdapter(base_url="http://mock-base-url")
+
+    with patch.object(adapter, "sio") as mock_sio:
+        mock_sio.connected = False
+
+        def fake_emit(event, payload, namespace):
+            for token in ("Ho", "la"):
+                adapter._on_response_message(
+                    {"request_id": payload["request_id"], "content": token}
+                )
+            adapter._on_response_message(
+                {"request_id": payload["request_id"], "finished": True}
+            )
+
+        mock_sio.emit.side_effect = fake_emit
+        adapter.send_messages(_make_dto(), on_token=lambda c, f: None)
+
+    [entry] = adapter.metrics.snapshot()
+    assert (entry["llm_name"], entry["model_name"], entry["action_key"]) == (
+        "openai",
+        "gpt-4o-mini",
+        "default",
+    )
+    assert (entry["streams"], entry["errors"]) == (1, 0)
+    assert entry["connect"]["count"] == 1
+    assert entry["inter_token"]["count"] == 1
+    assert entry["tokens"]["sum"] == 2
+
+
+def test_concurrent_streams_share_the_connection_up_to_the_cap():
+    adapter = SocketAdapter(
+        base_url="http://mock-base-url", persistent=True, max_concurrent_streams=2
+    )
+    in_flight = []
+    received = {}
+
+    with patch.object(adapter, "sio") as mock_sio:
+        mock_sio.connected = False
+
+        def fake_connect(*args, **kwargs):
+            mock_sio.connected = True
+
+        def fake_emit(event, payload, namespace):
+            in_flight.append(len(adapter._streams))
+
+            def reply():
+                for token in (payload["text"], "!"):
+                    adapter._on_response_message(
+                        {"request_id": payload["request_id"], "content": token}
+                    )
+                adapter._on_response_message(
+                    {"request_id": payload["request_id"], "finished": True}
+                )
+
+            threading.Timer(0.02, reply).start()
+
+        mock_sio.connect.side_effect = fake_connect
+        mock_sio.emit.side_effect = fake_emit
+
+        def run(text):
+            received[text] = list(adapter.stream(_make_dto(text)))
+
+        threads = [threading.Thread(target=run, args=(str(i),)) for i in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        mock_sio.connect.assert_called_once()
+        assert received == {str(i): [str(i), "!"] for i in range(6)}
+        assert max(in_flight) <= 2
+        assert adapter._streams == {}
+
+
+def test_cancelled_handle_stops_delivery_and_aborts_on_the_server():
+    adapter = SocketAdapter(base_url="http://mock-base-url")
+
+    with patch.object(adapter, "sio") as mock_sio:
+        mock_sio.connected = False
+
+        def fake_connect(*args, **kwargs):
+            mock_sio.connected = True
+
+        def fake_emit(event, payload, namespace):
+            if event == "send_message":
+                adapter._on_response_message(
+                    {"request_id": payload["request_id"], "content": "Ho"}
+                )
+
+        mock_sio.connect.side_effect = fake_connect
+        mock_sio.emit.side_effect = fake_emit
+
+        handle = adapter.stream(_make_dto())
+        assert next(handle) == "Ho"
+        handle.cancel()
+        # Late tokens of the cancelled stream are dropped.
+        adapter._on_response_message({"request_id": handle.request_id, "content": "la"})
+
+        assert list(handle) == []
+        mock_sio.emit.assert_called_with(
+            "cancel_message", {"request_id": handle.request_id}, namespace=adapter.namespace
+        )
+        assert adapter._streams == {}
+        assert adapter.cancel(handle.request_id) is False
+
+
+def test_idle_and_first_token_timeouts_end_stalled_streams():
+    adapter = SocketAdapter(
+        base_url="http://mock-base-url", first_token_timeout=0.1, idle_timeout=0.05
+    )
+    tokens = []
+
+    with patch.object(adapter, "sio") as mock_sio:
+        mock_sio.connected = True
+        mock_sio.emit.side_effect = lambda event, payload, namespace: None
+        adapter.send_messages(_make_dto(), on_token=lambda c, f: tokens.append((c, f)))
+
+        def fake_emit(event, payload, namespace):
+            if event == "send_message":
+                adapter._on_response_message(
+                    {"request_id": payload["request_id"], "content": "Ho"}
+                )
+
+        mock_sio.emit.side_effect = fake_emit
+        handle = adapter.stream(_make_dto())
+
+        assert tokens == [("[ERROR] No token received within 0.1s", True)]
+        with pytest.raises(Exception, match="No token received for 0.05s"):
+            list(handle)
+        assert handle.text == "Ho"
+        assert adapter._streams == {}
+
+
+def test_handler_threads_keep_token_order_with_a_slow_consumer():
+    adapter = SocketAdapter(base_url="http://mock-base-url", persistent=True)
+
+    with patch.object(adapter, "sio") as mock_sio:
+        mock_sio.connected = True
+        handle = adapter.stream(_make_dto())
+
+        # Socket.IO runs every event on its own thread.
+        events = [{"request_id": handle.request_id, "content": str(i)} for i in range(40)]
+        events.append({"request_id": handle.request_id, "finished": True})
+        threads = []
+        for event in events:
+            thread = threading.Thread(target=adapter._on_response_message, args=(event,))
+            thread.start()
+            threads.append(thread)
+            thread.join(timeout=1)
+        assert not any(thread.is_alive() for thread in threads)
+
+        assert list(handle) == [str(i) for i in range(40)]
+        assert adapter._streams == {}
+
+
+def test_consumer_falling_behind_cancels_the_stream():
+    adapter = SocketAdapter(base_url="http://mock-base-url", persistent=True)
+
+    with patch.object(adapter, "sio") as mock_sio:
+        mock_sio.connected = True
+        handle = adapter.stream(_make_dto(), maxsize=3)
+
+        for i in range(10):
+            adapter._on_response_message(
+                {"request_id": handle.request_id, "content": str(i)}
+            )
+
+        mock_sio.emit.assert_called_with(
+            "cancel_message",
+            {"request_id": handle.request_id},
+            namespace=adapter.namespace,
+        )
+        assert mock_sio.emit.call_count == 2
+        assert adapter._streams == {}
+        with pytest.raises(Exception, match="more than 3 unread tokens"):
+            list(handle)
+        assert handle.text == "012"
+
+
+def test_streams_that_finish_normally_are_not_recorded_as_errors():
+    adapter = SocketAdapter(base_url="http://mock-base-url", persistent=True)
+    record_timing = adapter._record_timing
+
+    def slow_record_timing(request_id, error=False, replica_ok=None):
+        if not error:
+            time.sleep(0.002)
+        record_timing(request_id, error, replica_ok)
+
+    with patch.object(adapter, "sio") as mock_sio, patch.object(
+        adapter, "_record_timing", slow_record_timing
+    ):
+        mock_sio.connected = True
+
+        def fake_emit(event, payload, namespace):
+            if event == "send_message":
+                data = {"request_id": payload["request_id"], "content": "Hi", "finished": True}
+                threading.Thread(target=adapter._on_response_message, args=(data,)).start()
+
+        mock_sio.emit.side_effect = fake_emit
+        for _ in range(20):
+            adapter.send_messages(_make_dto(), on_token=lambda c, f: None)
+
+    [entry] = adapter.metrics.snapshot()
+    assert (entry["streams"], entry["errors"]) == (20, 0)
+
+
+def test_replica_outcome_follows_the_stream_outcome():
+    balancer = LoadBalancer(["http://replica-1"], failure_threshold=1)
+    adapter = SocketAdapter(base_url="", persistent=True, load_balancer=balancer)
+    record_timing = adapter._record_timing
+
+    def slow_record_timing(request_id, error=False, replica_ok=None):
+        if not error:
+            time.sleep(0.002)
+        record_timing(request_id, error, replica_ok)
+
+    with patch.object(adapter, "sio") as mock_sio, patch.object(
+        adapter, "_record_timing", slow_record_timing
+    ):
+        mock_sio.connected = False
+
+        def fake_connect(*args, **kwargs):
+            mock_sio.connected = True
+
+        def fake_emit(event, payload, namespace):
+            if event == "send_message" and payload["text"] != "hold":
+                data = {"request_id": payload["request_id"], "content": "Hi", "finished": True}
+                threading.Thread(target=adapter._on_response_message, args=(data,)).start()
+
+        mock_sio.connect.side_effect = fake_connect
+        mock_sio.emit.side_effect = fake_emit
+        for _ in range(10):
+            adapter.send_messages(_make_dto(), on_token=lambda c, f: None)
+
+        # A stream cut by our own disconnect does not count against the replica.
+        handle = adapter.stream(_make_dto("hold"))
+        adapter._on_disconnect("client disconnect")
+        with pytest.raises(Exception, match="Socket disconnected"):
+            handle.result()
+
+    [endpoint] = balancer.snapshot()
+    assert (endpoint["requests"], endpoint["errors"], endpoint["available"]) == (
+        11,
+        0,
+        True,
+    )
+
+
+def test_cancelled_streams_are_neither_successes_nor_latency_samples():
+    balancer = LoadBalancer(["http://replica-1"], failure_threshold=1)
+    adapter = SocketAdapter(base_url="", persistent=True, load_balancer=balancer)
+
+    with patch.object(adapter, "sio") as mock_sio:
+        mock_sio.connected = True
+        adapter._endpoint = balancer.pick()
+        handle = adapter.stream(_make_dto())
+        handle.cancel()
+
+    [entry] = adapter.metrics.snapshot()
+    assert (entry["streams"], entry["errors"], entry["cancelled"]) == (1, 0, 1)
+    assert entry["duration"]["count"] == 0
+    [endpoint] = balancer.snapshot()
+    assert (endpoint["requests"], endpoint["outstanding"]) == (1, 0)
+    assert endpoint["ewma"] is None
+
+
+def test_rate_limiter_sees_every_successful_stream():
+    limiter = MagicMock()
+    limiter.acquire.return_value = True
+    adapter = SocketAdapter(
+        base_url="http://mock-base-url", persistent=True, rate_limiter=limiter
+    )
+    record_rate_outcome = adapter._record_rate_outcome
+
+    def slow_record_rate_outcome(request_id, info=None):
+        time.sleep(0.002)
+        record_rate_outcome(request_id, info)
+
+    with patch.object(adapter, "sio") as mock_sio, patch.object(
+        adapter, "_record_rate_outcome", slow_record_rate_outcome
+    ):
+        mock_sio.connected = True
+
+        def fake_emit(event, payload, namespace):
+            if event == "send_message":
+                data = {"request_id": payload["request_id"], "content": "Hi", "finished": True}
+                threading.Thread(target=adapter._on_response_message, args=(data,)).start()
+
+        mock_sio.emit.side_effect = fake_emit
+        for _ in range(10):
+            adapter.send_messages(_make_dto(), on_token=lambda c, f: None)
+
+    assert limiter.record_success.call_count == 10
+
+
+def test_disconnect_releases_the_slots_of_failed_handles():
+    adapter = SocketAdapter(
+        base_url="http://mock-base-url", timeout=1, max_concurrent_streams=1
+    )
+
+    with patch.object(adapter, "sio") as mock_sio:
+        mock_sio.connected = True
+        first = adapter.stream(_make_dto())
+        adapter._on_disconnect("transport error")
+
+        with pytest.raises(Exception, match="Socket disconnected"):
+            first.result()
+        assert adapter._streams == {}
+
+        second = adapter.stream(_make_dto())
+        assert adapter._streams == {second.request_id: second}
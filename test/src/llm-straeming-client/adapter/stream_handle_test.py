@@ -0,0 +1,77 @@
+import asyncio
+import threading
+import pytest
+import sys
+import os
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../.."))
+)
+from src.llm_streaming_client.adapter.stream_handle import StreamHandle
+from src.llm_streaming_client.adapter.exceptions import SocketCommunicationException
+
+
+def _produce(handle, tokens, error=None):
+    for token in tokens:
+        handle.feed(token, False)
+    if error:
+        handle.fail(error)
+    else:
+        handle.feed("", True)
+
+
+def test_producer_never_blocks_and_consumer_sees_the_backlog():
+    handle = StreamHandle("req-1", maxsize=6)
+    producer = threading.Thread(target=_produce, args=(handle, list("abcdef")))
+    producer.start()
+
+    producer.join(timeout=1)
+    assert not producer.is_alive()
+    assert handle.backlogged
+
+    assert list(handle) == list("abcdef")
+    assert handle.text == "abcdef"
+    assert handle.finished
+    assert not handle.backlogged
+
+
+def test_overflow_drops_later_tokens_and_raises_after_the_buffered_ones():
+    handle = StreamHandle("req-overflow", maxsize=2)
+    _produce(handle, list("abcdef"))
+
+    assert handle.overflowed
+    assert len(handle._buffer) == 3
+    with pytest.raises(SocketCommunicationException, match="more than 2 unread"):
+        handle.result()
+    assert handle.text == "ab"
+
+
+def test_async_iteration_yields_tokens():
+    handle = StreamHandle("req-2")
+
+    async def consume():
+        threading.Thread(target=_produce, args=(handle, ["Ho", "la"])).start()
+        return [token async for token in handle]
+
+    assert asyncio.run(consume()) == ["Ho", "la"]
+    assert handle.text == "Hola"
+
+
+def test_stream_errors_are_raised_to_the_consumer():
+    handle = StreamHandle("req-3")
+    _produce(handle, ["partial"], error={"error_message": "model overloaded"})
+
+    with pytest.raises(SocketCommunicationException, match="model overloaded"):
+        handle.result()
+    assert handle.text == "partial"
+
+
+def test_json_events_yield_rows_before_the_document_closes():
+    handle = StreamHandle("req-json")
+    _produce(handle, ['{"rows": [[1', ", 2]", ', [3, 4]]}'])
+
+    events = handle.json_events(max_depth=2)
+    first = next(events)
+
+    assert (first.path, first.value) == (("rows", 0), [1, 2])
+    assert [event.path for event in events] == [("rows", 1), ("rows",), ()]
@@ -0,0 +1,73 @@
+import json
+import subprocess
+import sys
+import os
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+)
+from src.llm_streaming_client.client import LLMStreamingClient
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+
+# Cold import of the client module, without any transport library. Importing
+# socketio alone used to take several times this.
+IMPORT_BUDGET_SECONDS = 0.25
+
+TRANSPORT_MODULES = ("requests", "urllib3", "socketio", "engineio", "aiohttp")
+
+
+def _run_isolated(code):
+    """Runs ``code`` in a fresh interpreter and returns the JSON it prints."""
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_import_loads_no_transport_library_and_stays_within_budget():
+    code = f"""
+import json, sys, time
+started = time.perf_counter()
+import src.llm_streaming_client.client
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    "elapsed": elapsed,
+    "loaded": [m for m in {TRANSPORT_MODULES!r} if m in sys.modules],
+}}))
+"""
+    runs = [_run_isolated(code) for _ in range(3)]
+
+    assert runs[0]["loaded"] == []
+    assert min(run["elapsed"] for run in runs) < IMPORT_BUDGET_SECONDS
+
+
+def test_http_only_usage_never_imports_socketio():
+    code = """
+import json, sys
+from src.llm_streaming_client.client import LLMStreamingClient
+client = LLMStreamingClient("http://mock-base-url")
+client.server_request_adapter
+client.close()
+loaded = {name: name in sys.modules for name in ("socketio", "requests")}
+print(json.dumps(loaded))
+"""
+    assert _run_isolated(code) == {"socketio": False, "requests": True}
+
+
+def test_adapters_are_created_on_first_use_and_shared():
+    client = LLMStreamingClient("http://mock-base-url")
+    assert "session" not in vars(client)
+    assert "socket_adapter" not in vars(client)
+
+    adapter = client.server_request_adapter
+
+    assert client.server_request_adapter is adapter
+    assert adapter.session is client.session
+    assert "socket_adapter" not in vars(client)
+    assert client.socket_adapter.metrics is client.stream_metrics
+    client.close()
@@ -0,0 +1,49 @@
+import sys
+import os
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../.."))
+)
+
+from src.llm_streaming_client.dtos.input import StreamingInputDTO
+from src.llm_streaming_client.dtos.output import (
+    AvailablePromptsOutputDTO,
+    SocketOutputDTO,
+)
+from src.llm_streaming_client.dtos.prompt_dto import PromptTemplate
+from src.llm_streaming_client.enums.action_keys import ActionKeys
+from src.llm_streaming_client.enums.language_keys import LanguageEnum
+from src.llm_streaming_client.utils.json_codec import convert
+
+
+def test_socket_output_from_wire_reads_the_event_fields():
+    event = SocketOutputDTO.from_wire(
+        {"request_id": "r1", "content": "Hola", "finished": False, "extra": 1}
+    )
+    assert event == SocketOutputDTO("Hola", False, "r1")
+
+    legacy = SocketOutputDTO.from_wire({"content": None})
+    assert legacy == SocketOutputDTO("", False, None)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10")
+def test_dtos_are_slotted():
+    dto = StreamingInputDTO(
+        llm_name="openai",
+        model_name="gpt-4o-mini",
+        text="Hola",
+        prompt=PromptTemplate(title="t", description="d"),
+        language=LanguageEnum.SPANISH,
+        action_key=ActionKeys.DEFAULT,
+    )
+    for instance in (dto, dto.prompt, SocketOutputDTO("a", True)):
+        assert not hasattr(instance, "__dict__")
+
+    prompts = convert(
+        {"prompts": [{"title": "Summarize", "action_key": "summarize"}]},
+        AvailablePromptsOutputDTO,
+    )
+    assert prompts.prompts[0].title == "Summarize"
+    assert not hasattr(prompts.prompts[0], "__dict__")
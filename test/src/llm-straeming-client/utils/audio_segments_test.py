@@ -0,0 +1,68 @@
+import io
+import sys
+import os
+import wave
+from array import array
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../.."))
+)
+from src.llm_streaming_client.utils.audio_segments import (
+    merge_overlap,
+    open_wav,
+    plan_segments,
+    read_segment,
+)
+
+
+def _make_wav(seconds, rate=1000, silent_ranges=()):
+    samples = array("h", [8000 if i % 2 else -8000 for i in range(seconds * rate)])
+    for start, end in silent_ranges:
+        for i in range(int(start * rate), int(end * rate)):
+            samples[i] = 0
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+def test_fixed_windows_cover_the_audio_with_overlap():
+    audio = _make_wav(10)
+
+    segments = plan_segments(audio, window_seconds=4, overlap_seconds=1)
+
+    assert [(s.start, s.end) for s in segments] == [(0, 5), (4, 9), (8, 10)]
+    with open_wav(read_segment(audio, segments[1])) as wav:
+        assert wav.getnframes() == 5000
+
+
+def test_cuts_snap_to_silence():
+    audio = _make_wav(10, silent_ranges=[(2.5, 2.7)])
+
+    segments = plan_segments(audio, window_seconds=4, silence_search_seconds=2)
+
+    assert 2.5 <= segments[0].end <= 2.7
+    assert segments[1].start == segments[0].end
+
+
+def test_equally_quiet_cuts_prefer_the_window_end():
+    audio = _make_wav(10, silent_ranges=[(2.2, 2.4), (3.4, 3.6)])
+
+    segments = plan_segments(audio, window_seconds=4, silence_search_seconds=2)
+
+    assert 3.4 <= segments[0].end <= 3.6
+
+
+def test_merge_overlap_drops_repeated_words():
+    assert merge_overlap("we met at the old station", "the old Station, and then left") == (
+        "and then left"
+    )
+    assert merge_overlap("hello there", "general kenobi") == "general kenobi"
+
+
+def test_merge_overlap_ignores_single_word_matches():
+    assert merge_overlap("I saw the", "the end of it") == "the end of it"
+    assert merge_overlap("I saw the end", "the end of it") == "of it"
@@ -0,0 +1,76 @@
+import json
+import sys
+import os
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../.."))
+)
+from src.llm_streaming_client.utils.error_classifier import (
+    ErrorInfo,
+    ErrorKind,
+    classify_payload,
+    classify_response,
+)
+from src.llm_streaming_client.utils.http_client_utils import (
+    build_status_error_response,
+    get_error_info,
+)
+
+
+def test_relayed_provider_errors_are_parsed_without_eval():
+    body = {
+        "error_message": "Error code: 429 - {'error': {'message': 'Rate limit "
+        "reached. Please try again in 350ms.', 'type': 'requests', "
+        "'code': 'rate_limit_exceeded'}}"
+    }
+
+    info = classify_response(500, body)
+
+    assert info.message.startswith("Code: 429, Error: Rate limit reached.")
+    assert (info.status, info.code, info.kind) == (
+        429,
+        "rate_limit_exceeded",
+        ErrorKind.RATE_LIMIT,
+    )
+    assert info.retryable is True
+    assert info.retry_after == 0.35
+
+    hostile = "Error code: 500 - {'error': __import__('os').getcwd()}"
+    assert classify_payload(hostile).message == f"Error: {hostile}"
+
+
+def test_provider_codes_override_the_status():
+    quota = b'{"error": {"message": "No credit", "code": "insufficient_quota"}}'
+    overloaded = '{"error": {"type": "overloaded_error", "message": "Busy"}}'
+
+    assert classify_response(429, quota).retryable is False
+    assert classify_response(429, quota).kind is ErrorKind.QUOTA
+    assert classify_response(529, overloaded).retryable is True
+    assert classify_response(400, '{"error": "bad"}').retryable is False
+
+
+def test_unparseable_bodies_and_retry_after_headers():
+    info = classify_response(503, "<html>" + "x" * 300, retry_after="7")
+
+    assert info.message == "Code: 503, Error: <html>" + "x" * 194 + "..."
+    assert (info.kind, info.retryable, info.retry_after) == (
+        ErrorKind.SERVER,
+        True,
+        7.0,
+    )
+
+
+def test_socket_errors_with_only_a_rate_limit_code_are_rate_limits():
+    info = classify_payload({"error": {"code": "rate_limit_exceeded", "message": "Slow down"}})
+
+    assert (info.kind, info.retryable) == (ErrorKind.RATE_LIMIT, True)
+    assert classify_payload({"error": {"code": "other"}}).kind is ErrorKind.UNKNOWN
+
+
+def test_error_envelopes_are_json_serializable():
+    result = build_status_error_response(429, '{"error": "slow down"}', retry_after="2")
+
+    assert json.loads(json.dumps(result))["error_info"]["kind"] == "rate_limit"
+    assert get_error_info(result) == ErrorInfo(
+        "Code: 429, Error: slow down", ErrorKind.RATE_LIMIT, 429, None, True, 2.0
+    )
@@ -0,0 +1,90 @@
+import itertools
+import threading
+import time
+import pytest
+import sys
+import os
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../.."))
+)
+from src.llm_streaming_client.utils.hedging import Hedger, LatencyTracker
+
+
+def _scripted(*delays):
+    """Returns a call whose n-th invocation sleeps ``delays[n]`` and reports n."""
+    counter = itertools.count()
+
+    def call():
+        n = next(counter)
+        time.sleep(delays[n])
+        return {"success": True, "response": n, "error": None}
+
+    return call
+
+
+def test_fast_primary_is_not_hedged():
+    hedger = Hedger(delay=0.2)
+
+    assert hedger.run(_scripted(0.0))["response"] == 0
+    assert hedger.hedges_sent == 0
+    hedger.close()
+
+
+def test_slow_primary_is_hedged_and_fast_hedge_wins():
+    hedger = Hedger(delay=0.05)
+
+    started = time.monotonic()
+    result = hedger.run(_scripted(1.0, 0.0))
+
+    assert result["response"] == 1
+    assert time.monotonic() - started < 0.5
+    assert (hedger.hedges_sent, hedger.hedges_won) == (1, 1)
+    hedger.close()
+
+
+def test_failed_hedge_falls_back_to_primary():
+    hedger = Hedger(delay=0.05)
+    counter = itertools.count()
+
+    def call():
+        if next(counter) == 0:
+            time.sleep(0.2)
+            return {"success": True, "response": "primary", "error": None}
+        return {"success": False, "response": None, "error": "boom"}
+
+    assert hedger.run(call)["response"] == "primary"
+    assert hedger.hedges_won == 0
+    hedger.close()
+
+
+def test_in_flight_hedges_are_capped():
+    hedger = Hedger(delay=0.01, max_in_flight=1)
+    release = threading.Event()
+
+    def call():
+        release.wait(1)
+        return {"success": True, "response": None, "error": None}
+
+    threads = [threading.Thread(target=hedger.run, args=(call,)) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert hedger.hedges_sent == 1
+    hedger.close()
+
+
+def test_delay_follows_observed_percentile():
+    hedger = Hedger(percentile=0.9, initial_delay=3, min_samples=10)
+    assert hedger.current_delay() == 3
+
+    for ms in range(1, 11):
+        hedger.latencies.record(ms / 1000)
+
+    assert hedger.current_delay() == pytest.approx(0.010)
+    assert LatencyTracker().percentile(0.5) is None
+    hedger.close()
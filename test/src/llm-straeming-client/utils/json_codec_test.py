@@ -0,0 +1,73 @@
+import pytest
+import sys
+import os
+from types import SimpleNamespace
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../.."))
+)
+from src.llm_streaming_client.utils.json_codec import (
+    _convert,
+    convert,
+    decode_as,
+    dumps,
+    loads,
+)
+from src.llm_streaming_client.utils import http_client_utils
+from src.llm_streaming_client.dtos.output import (
+    AudioTranscriptionOutputDTO,
+    AvailablePromptsOutputDTO,
+    PromptInfoDTO,
+)
+
+
+def test_round_trip_keeps_unicode():
+    encoded = dumps({"text": "¿Qué tal?", "n": [1, 2.5, None]})
+
+    assert isinstance(encoded, bytes)
+    assert loads(encoded) == {"text": "¿Qué tal?", "n": [1, 2.5, None]}
+
+
+def test_decode_as_builds_nested_dtos_ignoring_unknown_fields():
+    body = b'{"prompts": [{"title": "Resumen", "action_key": "summarize", "x": 1}]}'
+
+    assert decode_as(body, AvailablePromptsOutputDTO) == AvailablePromptsOutputDTO(
+        prompts=[PromptInfoDTO(title="Resumen", action_key="summarize")]
+    )
+
+
+@pytest.mark.parametrize("to_type", [convert, _convert])
+def test_convert_handles_optional_lists_and_numbers(to_type):
+    value = {
+        "text": "hola",
+        "segments": [{"index": 0, "start": 0, "end": 1, "text": "hola", "elapsed": 0.2}],
+    }
+
+    dto = to_type(value, AudioTranscriptionOutputDTO)
+
+    assert dto.segments[0].end == 1.0
+    assert to_type({"text": "hola"}, AudioTranscriptionOutputDTO).segments is None
+
+
+def test_mismatched_values_raise_value_error():
+    with pytest.raises(ValueError):
+        convert({"prompts": [{"title": 1}]}, AvailablePromptsOutputDTO)
+    with pytest.raises(ValueError):
+        decode_as(b"not json", AvailablePromptsOutputDTO)
+
+
+def test_typed_success_responses_decode_the_body_once():
+    response = SimpleNamespace(
+        content=b'{"response": {"prompts": [{"title": "Resumen", "action_key": "summarize"}]}}'
+    )
+
+    with patch.object(http_client_utils, "loads", wraps=loads) as counted:
+        result = http_client_utils.build_success_response(
+            response, AvailablePromptsOutputDTO
+        )
+
+    assert counted.call_count == 1
+    assert result["response"] == AvailablePromptsOutputDTO(
+        prompts=[PromptInfoDTO(title="Resumen", action_key="summarize")]
+    )
@@ -0,0 +1,58 @@
+import json
+import sys
+import os
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../.."))
+)
+from src.llm_streaming_client.utils.json_stream import IncrementalJSONParser
+
+DOCUMENT = (
+    '```json\n{"text": "Factura n\\u00ba 7 \\"A\\"", "tables": [{"title": "Items", '
+    '"rows": [["Pan", 2, 1.5e0], ["Leche", 1, null]]}], "ok": true, "tags": [],}\n```'
+)
+
+
+def test_values_are_reported_as_soon_as_they_close():
+    parser = IncrementalJSONParser()
+    seen = []
+    for ch in DOCUMENT:
+        seen.extend((event.path, len(seen)) for event in parser.feed(ch))
+    positions = dict(seen)
+
+    expected = json.loads(DOCUMENT[8:-4].replace(",}", "}"))
+    assert parser.close() == expected
+    assert positions[("text",)] == 0
+    assert positions[("tables", 0, "rows", 0)] < positions[("tables", 0, "rows", 1)]
+    assert positions[("tables", 0, "rows", 1)] < positions[("tables", 0)]
+    assert [path for path, _ in seen][-1] == ()
+
+
+def test_chunking_does_not_change_the_events():
+    whole = IncrementalJSONParser(max_depth=2).feed(DOCUMENT)
+    parser = IncrementalJSONParser(max_depth=2)
+    chunked = []
+    for start in range(0, len(DOCUMENT), 7):
+        chunked.extend(parser.feed(DOCUMENT[start : start + 7]))
+
+    assert chunked == whole
+    assert {event.path for event in whole} == {
+        ("text",),
+        ("tables", 0),
+        ("tables",),
+        ("ok",),
+        ("tags",),
+        (),
+    }
+
+
+def test_invalid_and_incomplete_documents_raise():
+    with pytest.raises(ValueError, match="unexpected ']' at character 5"):
+        IncrementalJSONParser().feed('{"a":]')
+
+    parser = IncrementalJSONParser()
+    parser.feed('{"rows": [[1, 2]')
+    with pytest.raises(ValueError, match="Incomplete JSON"):
+        parser.close()
@@ -0,0 +1,75 @@
+import sys
+import os
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../.."))
+)
+from src.llm_streaming_client.utils.load_balancer import LoadBalancer
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _balancer(**kwargs):
+    clock = _Clock()
+    urls = ["http://a", "http://b", "http://c"]
+    return LoadBalancer(urls, clock=clock, **kwargs), clock
+
+
+def test_least_outstanding_spreads_concurrent_calls():
+    balancer, _ = _balancer()
+
+    picked = [balancer.acquire().url for _ in range(6)]
+
+    assert sorted(picked) == ["http://a"] * 2 + ["http://b"] * 2 + ["http://c"] * 2
+    endpoint = balancer.endpoints[0]
+    balancer.release(endpoint, 0.1, True)
+    assert balancer.acquire() is endpoint
+
+
+def test_ewma_prefers_the_fastest_replica():
+    balancer, _ = _balancer(policy="ewma")
+    for endpoint, latency in zip(balancer.endpoints, (0.5, 0.05, 0.2)):
+        balancer.begin(endpoint)
+        balancer.release(endpoint, latency, True)
+
+    assert balancer.pick().url == "http://b"
+    for _ in range(3):
+        balancer.begin(balancer.endpoints[1])
+    assert balancer.pick().url == "http://c"
+
+
+def test_failing_replicas_are_ejected_and_slowly_readmitted():
+    balancer, clock = _balancer(failure_threshold=2, eject_seconds=10, slow_start=20)
+    bad = balancer.endpoints[0]
+    for _ in range(2):
+        balancer.begin(bad)
+        balancer.release(bad, None, False)
+
+    assert bad not in {balancer.acquire() for _ in range(10)}
+    clock.now += 10
+    assert balancer.is_available(bad)
+    assert balancer.snapshot()[0]["weight"] == pytest.approx(0.1)
+    clock.now += 20
+    assert balancer.snapshot()[0]["weight"] == 1.0
+
+
+def test_probes_eject_and_readmit_replicas():
+    balancer, clock = _balancer(eject_seconds=5)
+    healthy = {"http://a": False, "http://b": True, "http://c": True}
+    balancer._probing = True
+
+    balancer.probe_once(healthy.get)
+    clock.now += 6
+    assert not balancer.is_available(balancer.endpoints[0])
+
+    healthy["http://a"] = True
+    balancer.probe_once(healthy.get)
+    assert balancer.is_available(balancer.endpoints[0])
@@ -0,0 +1,64 @@
+import pytest
+import sys
+import os
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../.."))
+)
+from src.llm_streaming_client.utils.metrics import Histogram, StreamMetrics
+
+
+def test_histogram_uses_le_buckets():
+    histogram = Histogram([0.1, 1])
+    for value in (0.05, 0.1, 0.5, 2):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 4
+    assert snapshot["sum"] == pytest.approx(2.65)
+    assert snapshot["buckets"] == {0.1: 2, 1: 3, float("inf"): 4}
+
+
+def test_stream_timings_are_aggregated_per_labels():
+    metrics = StreamMetrics(latency_buckets=[1], token_buckets=[10])
+    timing = metrics.start("openai", "gpt-4o-mini", "default")
+    timing.connect = 0.2
+    for _ in range(3):
+        timing.token()
+    timing.finish()
+    metrics.record(timing)
+
+    failed = metrics.start("openai", "gpt-4o-mini", "default")
+    failed.finish(error=True)
+    metrics.record(failed)
+
+    [entry] = metrics.snapshot()
+    assert (entry["llm_name"], entry["model_name"], entry["action_key"]) == (
+        "openai",
+        "gpt-4o-mini",
+        "default",
+    )
+    assert (entry["streams"], entry["errors"]) == (2, 1)
+    assert entry["connect"]["count"] == 1
+    assert entry["ttft"]["count"] == 1
+    assert entry["inter_token"]["count"] == 2
+    assert entry["tokens"]["sum"] == 3
+    assert not failed.finish()
+
+
+def test_prometheus_text_format():
+    metrics = StreamMetrics(latency_buckets=[1], token_buckets=[10])
+    timing = metrics.start("openai", 'm"1', "default")
+    timing.token()
+    timing.finish()
+    metrics.record(timing)
+
+    text = metrics.to_prometheus(prefix="llm")
+    labels = 'llm_name="openai",model_name="m\\"1",action_key="default"'
+    assert "# TYPE llm_streams_total counter" in text
+    assert f"llm_streams_total{{{labels}}} 1" in text
+    assert "# TYPE llm_ttft_seconds histogram" in text
+    assert f'llm_ttft_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+    assert f'llm_tokens_bucket{{{labels},le="10.0"}} 1' in text
+    assert f"llm_duration_seconds_count{{{labels}}} 1" in text
+    assert f"llm_cancelled_total{{{labels}}} 0" in text
@@ -0,0 +1,68 @@
+import sys
+import os
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../.."))
+)
+from src.llm_streaming_client.utils.rate_limiter import RateLimiter, TokenBucket
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_bucket_queues_calls_beyond_the_burst():
+    clock = _Clock()
+    bucket = TokenBucket(rate=2, burst=2, clock=clock)
+
+    waits = [bucket.reserve() for _ in range(4)]
+
+    assert waits == [0.0, 0.0, 0.5, 1.0]
+    assert bucket.reserve(max_wait=1.0) is None
+    clock.now += 1.5
+    assert bucket.reserve() == 0.0
+
+
+def test_throttles_back_off_once_per_burst_and_recover():
+    clock = _Clock()
+    bucket = TokenBucket(rate=4, burst=4, recovery=1, clock=clock)
+
+    bucket.record_throttle(retry_after=3)
+    bucket.record_throttle()
+
+    assert bucket.rate == 2
+    assert bucket.throttles == 2
+    assert bucket.reserve() == 3.5
+    for _ in range(5):
+        bucket.record_success()
+    assert bucket.rate == 4
+
+
+def test_limiter_seeds_buckets_per_model_and_waits_locally():
+    clock = _Clock()
+    limiter = RateLimiter(
+        limits={"openai": 5, "openai/gpt-4o": 1},
+        default_rate=20,
+        burst=1,
+        max_wait=2,
+        sleep=clock.sleep,
+        clock=clock,
+    )
+
+    assert limiter.bucket(("openai", "gpt-4o")).rate == 1
+    assert limiter.bucket(("openai", "gpt-4o-mini")).rate == 5
+    assert limiter.bucket(("google", "gemini")).rate == 20
+
+    assert limiter.acquire(("openai", "gpt-4o"))
+    assert limiter.acquire(("openai", "gpt-4o"))
+    assert clock.now == 101.0
+    limiter.record_throttle(("openai", "gpt-4o"), retry_after=5)
+    assert limiter.acquire(("openai", "gpt-4o")) is False
+    assert limiter.snapshot()["openai/gpt-4o"]["throttles"] == 1
@@ -0,0 +1,83 @@
+import sys
+import os
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../.."))
+)
+from src.llm_streaming_client.utils.response_cache import (
+    ResponseCache,
+    make_cache_key,
+)
+from src.llm_streaming_client.dtos.input import MessageInputDTO
+from src.llm_streaming_client.enums.action_keys import ActionKeys
+from src.llm_streaming_client.enums.language_keys import LanguageEnum
+
+
+def _make_dto(text="Hola", action_key=ActionKeys.SUMMARIZE, session_id=None):
+    return MessageInputDTO(
+        llm_name="openai",
+        model_name="gpt-4o-mini",
+        text=text,
+        language=LanguageEnum.SPANISH,
+        action_key=action_key,
+        session_id=session_id,
+    )
+
+
+def test_cache_key_ignores_session_and_tracks_inputs():
+    assert make_cache_key(_make_dto(session_id="a")) == make_cache_key(
+        _make_dto(session_id="b")
+    )
+    assert make_cache_key(_make_dto("Hola")) != make_cache_key(_make_dto("Adiós"))
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2, ttl=60)
+    cache.set("a", {"response": 1})
+    cache.set("b", {"response": 2})
+    cache.get("a")
+    cache.set("c", {"response": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"response": 1}
+    assert cache.get("c") == {"response": 3}
+
+
+def test_expired_entries_are_dropped():
+    cache = ResponseCache(ttl=-1)
+    cache.set("a", {"response": 1})
+
+    assert cache.get("a") is None
+
+
+def test_sqlite_tier_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "cache.db")
+    ResponseCache(sqlite_path=path).set("a", {"success": True, "response": "ok"})
+
+    other = ResponseCache(sqlite_path=path)
+
+    assert other.is_cacheable(_make_dto())
+    assert not other.is_cacheable(_make_dto(action_key=ActionKeys.DEFAULT))
+    assert other.get("a") == {"success": True, "response": "ok"}
+
+
+def test_sqlite_tier_purges_expired_rows_and_is_bounded(tmp_path):
+    path = str(tmp_path / "cache.db")
+    ResponseCache(ttl=-1, sqlite_path=path).set("expired", {"response": 0})
+    cache = ResponseCache(max_entries=1, sqlite_path=path, max_rows=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, {"response": key})
+
+    rows = cache._db.execute("SELECT key FROM response_cache ORDER BY key").fetchall()
+
+    assert rows == [("b",), ("c",)]
+
+
+def test_callers_get_their_own_copy():
+    cache = ResponseCache(ttl=60)
+    value = {"response": {"rows": [1, 2]}}
+    cache.set("a", value)
+    value["response"]["rows"].append(3)
+    cache.get("a")["response"]["rows"].append(4)
+
+    assert cache.get("a") == {"response": {"rows": [1, 2]}}
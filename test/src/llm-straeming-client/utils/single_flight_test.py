@@ -0,0 +1,56 @@
+import threading
+import time
+import pytest
+import sys
+import os
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../.."))
+)
+from src.llm_streaming_client.utils.single_flight import SingleFlight
+
+
+def _run_concurrently(n, target):
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(target())) for _ in range(n)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_callers_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.1)
+        return {"response": {"rows": [1]}}
+
+    results = _run_concurrently(8, lambda: flight.do("key", slow))
+    results[0]["response"]["rows"].append(2)
+
+    assert len(calls) == 1
+    assert results[1:] == [{"response": {"rows": [1]}}] * 7
+    assert flight.in_flight() == 0
+
+
+def test_errors_are_shared_and_key_is_released():
+    flight = SingleFlight()
+
+    def fail():
+        time.sleep(0.05)
+        raise ValueError("boom")
+
+    def call():
+        try:
+            flight.do("key", fail)
+        except ValueError as e:
+            return str(e)
+
+    assert _run_concurrently(4, call) == ["boom"] * 4
+    assert flight.do("key", lambda: "again") == "again"
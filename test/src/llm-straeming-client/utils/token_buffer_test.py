@@ -0,0 +1,61 @@
+import time
+import pytest
+import sys
+import os
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../.."))
+)
+from src.llm_streaming_client.utils.token_buffer import TokenCoalescer
+
+
+def _collector():
+    calls = []
+    return calls, lambda content, finished: calls.append((content, finished))
+
+
+def test_flushes_on_token_count_and_on_finished():
+    calls, on_token = _collector()
+    coalescer = TokenCoalescer(on_token, max_bytes=1024, max_tokens=3, flush_interval=10)
+
+    for token in ("a", "b", "c", "d"):
+        coalescer(token, False)
+    coalescer("e", True)
+
+    assert calls == [("abc", False), ("de", True)]
+
+
+def test_flushes_on_byte_size():
+    calls, on_token = _collector()
+    coalescer = TokenCoalescer(on_token, max_bytes=4, max_tokens=100, flush_interval=10)
+
+    coalescer("ñá", False)
+    coalescer("x", True)
+
+    assert calls == [("ñá", False), ("x", True)]
+
+
+def test_finished_without_buffered_tokens_is_still_delivered():
+    calls, on_token = _collector()
+    TokenCoalescer(on_token)("", True)
+
+    assert calls == [("", True)]
+
+
+def test_flush_interval_is_checked_on_the_next_call_and_by_flush_due():
+    calls, on_token = _collector()
+    coalescer = TokenCoalescer(on_token, max_bytes=1024, max_tokens=100, flush_interval=0.02)
+
+    coalescer("Ho", False)
+    coalescer.flush_due()
+    assert calls == []
+    time.sleep(0.03)
+    coalescer("la", False)
+    assert calls == [("Hola", False)]
+
+    coalescer("!", False)
+    time.sleep(0.03)
+    coalescer.flush_due()
+    assert calls == [("Hola", False), ("!", False)]
+    coalescer("", True)
+    assert calls == [("Hola", False), ("!", False), ("", True)]
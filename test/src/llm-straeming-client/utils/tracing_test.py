@@ -0,0 +1,114 @@
+import pytest
+import sys
+import os
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../.."))
+)
+from src.llm_streaming_client.utils.tracing import (
+    Span,
+    Tracer,
+    get_tracer,
+    set_tracer,
+)
+from src.llm_streaming_client.adapter.http_client import HttpClient
+from src.llm_streaming_client.adapter.socket_client import SocketAdapter
+from src.llm_streaming_client.dtos.input import StreamingInputDTO
+from src.llm_streaming_client.enums.action_keys import ActionKeys
+from src.llm_streaming_client.enums.language_keys import LanguageEnum
+from unittest.mock import patch
+
+
+class _RecordingSpan(Span):
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = dict(attributes or {})
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+
+class _RecordingTracer(Tracer):
+    enabled = True
+
+    def __init__(self):
+        self.spans = []
+
+    def span(self, name, attributes=None):
+        span = _RecordingSpan(name, attributes)
+        self.spans.append(span)
+        return span
+
+    def inject(self, carrier):
+        carrier["traceparent"] = "00-trace-span-01"
+
+
+@pytest.fixture
+def tracer():
+    tracer = _RecordingTracer()
+    set_tracer(tracer)
+    yield tracer
+    set_tracer(None)
+
+
+def _response(status=200):
+    import requests
+
+    response = requests.Response()
+    response.status_code = status
+    response._content = b'{"response": "ok"}'
+    return response
+
+
+def test_default_tracer_is_a_no_op():
+    tracer = get_tracer()
+
+    assert tracer.enabled is False
+    with tracer.span("anything", {"a": 1}) as span:
+        span.set_attribute("b", 2)
+    carrier = {}
+    tracer.inject(carrier)
+    assert carrier == {}
+
+
+def test_http_requests_are_traced_and_propagate_context(tracer):
+    client = HttpClient()
+    with patch.object(client.session, "request", return_value=_response()) as request:
+        client._get("http://mock-base-url/status")
+
+    assert request.call_args.kwargs["headers"] == {"traceparent": "00-trace-span-01"}
+    names = [span.name for span in tracer.spans]
+    assert names == ["http.request", "http.attempt", "http.parse"]
+    assert tracer.spans[0].attributes["http.status_code"] == 200
+    assert tracer.spans[0].attributes["http.attempts"] == 1
+
+
+def test_socket_stream_is_traced_and_payload_carries_context(tracer):
+    adapter = SocketAdapter(base_url="http://mock-base-url")
+    dto = StreamingInputDTO(
+        llm_name="openai",
+        model_name="gpt-4o-mini",
+        text="Hola",
+        prompt=None,
+        language=LanguageEnum.SPANISH,
+        action_key=ActionKeys.DEFAULT,
+        image_object=None,
+    )
+
+    with patch.object(adapter, "sio") as mock_sio:
+        mock_sio.connected = False
+
+        def fake_emit(event, payload, namespace):
+            adapter._on_response_message(
+                {"request_id": payload["request_id"], "content": "Hi", "finished": True}
+            )
+
+        mock_sio.emit.side_effect = fake_emit
+        adapter.send_messages(dto, on_token=lambda c, f: None)
+
+    payload = mock_sio.emit.call_args[0][1]
+    assert payload["trace_context"] == {"traceparent": "00-trace-span-01"}
+    [span] = tracer.spans
+    assert span.name == "socket.stream"
+    assert span.attributes["llm.model"] == "gpt-4o-mini"
+    assert span.attributes["llm.tokens"] == 1